@@ -0,0 +1,49 @@
+"""
+Compare `np.histogram` with `BinCounter` on large columns.
+
+Usage: python benchmarks/bench_bin_counts.py [n_rows]
+"""
+import sys
+import time
+import numpy as np
+
+from driftsense import BinCounter, get_bin_edges
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(n_rows: int = 10_000_000) -> None:
+    rng = np.random.default_rng(0)
+    reference = rng.normal(size=1_000_000)
+    values = rng.normal(size=n_rows)
+    cases = {
+        "equal_width": get_bin_edges(reference, bins=10, method="equal_width"),
+        "equal_freq": np.unique(get_bin_edges(reference, bins=10, method="equal_freq")),
+    }
+    fitted = cases["equal_freq"].copy()
+    fitted[0], fitted[-1] = -np.inf, np.inf
+    cases["equal_freq (open ends)"] = fitted
+    cases["equal_width, 50 bins"] = get_bin_edges(reference, bins=50, method="equal_width")
+    cases["equal_freq, 50 bins"] = np.unique(get_bin_edges(reference, bins=50, method="equal_freq"))
+
+    print(f"{n_rows:,} rows")
+    print(f"{'edges':<24}{'dtype':<10}{'histogram':>12}{'BinCounter':>12}{'speedup':>10}")
+    for name, edges in cases.items():
+        counter = BinCounter(edges)
+        for dtype in (np.float64, np.float32):
+            data = values.astype(dtype)
+            assert np.array_equal(counter.count(data), np.histogram(data, bins=edges)[0])
+            t_hist = best_of(lambda: np.histogram(data, bins=edges))
+            t_counter = best_of(lambda: counter.count(data))
+            print(f"{name:<24}{np.dtype(dtype).name:<10}{t_hist:>11.3f}s{t_counter:>11.3f}s{t_hist / t_counter:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
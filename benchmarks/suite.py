@@ -0,0 +1,264 @@
+"""
+Benchmark suite for binning and end-to-end drift runs.
+
+Each case is timed (best of `--repeat` runs) and run once more under `tracemalloc` for its peak
+memory. Import cases run in a fresh interpreter each time, so they measure cold import cost.
+Results can be saved as a JSON baseline and later runs compared against it; the exit code is 1
+when a case got slower or bigger than the tolerance allows.
+
+Usage:
+    python benchmarks/suite.py [--size small|medium|large] [--rows N] [--features N] [--categories N]
+                               [--bins N] [--filter TEXT] [--repeat N] [--save FILE] [--compare FILE]
+                               [--tolerance 0.25]
+
+Example:
+    python benchmarks/suite.py --size medium --save baseline.json
+    python benchmarks/suite.py --size medium --compare baseline.json
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import metadata
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from driftsense import (
+    calculate_all_features_drift, calculate_feature_drift, create_drift_report, get_bin_edges
+)
+
+# rows: rows of tall frames and single columns; features: columns of wide frames (with rows // 10 rows)
+SIZES = {
+    "small": {"rows": 20_000, "features": 100, "categories": 20, "bins": 10},
+    "medium": {"rows": 200_000, "features": 1_000, "categories": 50, "bins": 10},
+    "large": {"rows": 2_000_000, "features": 5_000, "categories": 200, "bins": 10},
+}
+
+# Columns of the tall frame
+TALL_FEATURES = 10
+
+# Share of categorical columns in generated frames
+CATEGORICAL_SHARE = 0.1
+
+# Absolute slack (seconds, MB) on top of the relative tolerance, so tiny cases do not flag noise
+NOISE_FLOOR = {"time": 1e-3, "peak_mb": 0.5}
+
+Case = Tuple[str, Callable[[], object]]
+
+# Statements timed by the import cases in a fresh interpreter
+IMPORT_CASES = {
+    "import/driftsense": "import driftsense",
+    "import/equal_freq_drift": (
+        "import driftsense; driftsense.calculate_feature_drift(list(range(1000)), list(range(500, 1500)))"
+    ),
+}
+
+# Prints the time, peak traced memory and loaded heavy modules of the statement, as JSON
+_IMPORT_SCRIPT = """
+import json, sys, time, tracemalloc
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if {trace} else 0
+print(json.dumps({{"time": elapsed, "peak_mb": peak / 2**20, "sklearn": "sklearn" in sys.modules}}))
+"""
+
+
+class ImportCase:
+    """Benchmark case timing `code` in a new interpreter (in-process timings would hit cached modules)."""
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def __call__(self, trace: bool = False) -> dict:
+        env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT.format(code=self.code, trace=trace)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        return json.loads(output)
+
+    def measure(self, repeat: int = 3) -> Dict[str, float]:
+        timings = [self()["time"] for _ in range(repeat)]
+        return {"time": min(timings), "peak_mb": self(trace=True)["peak_mb"]}
+
+
+def _frames(n_rows: int, n_features: int, n_categories: int, seed: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Reference and (slightly shifted) new frame with numeric and string categorical columns."""
+    rng = np.random.default_rng(seed)
+    n_categorical = int(n_features * CATEGORICAL_SHARE)
+    labels = np.array([f"c{i}" for i in range(n_categories)], dtype=object)
+
+    def frame(shift: float) -> pd.DataFrame:
+        columns = {f"num_{i}": rng.normal(shift, 1, n_rows) for i in range(n_features - n_categorical)}
+        columns.update({f"cat_{i}": labels[rng.integers(0, n_categories, n_rows)] for i in range(n_categorical)})
+        return pd.DataFrame(columns)
+
+    return frame(0.0), frame(0.1)
+
+
+def build_cases(rows: int, features: int, categories: int, bins: int, report_dir: str) -> List[Case]:
+    """
+    Benchmark cases for the given sizes; inputs are generated up front and not measured. Reports are
+    written to `report_dir`.
+    """
+    rng = np.random.default_rng(0)
+    reference, new = rng.normal(size=rows), rng.normal(0.1, 1, rows)
+    target = (reference + rng.normal(size=rows) > 0).astype(int)
+    labels = np.array([f"c{i}" for i in range(categories)], dtype=object)
+    reference_labels, new_labels = labels[rng.integers(0, categories, rows)], labels[rng.integers(0, categories, rows)]
+    domain_edges = list(np.linspace(-4, 4, bins + 1))
+
+    wide = _frames(max(rows // 10, 1), features, categories)
+    tall = _frames(rows, TALL_FEATURES, categories, seed=1)
+    report_summary, report_details = calculate_all_features_drift(*wide, bins=bins)
+    report_path = os.path.join(report_dir, "report.html")
+
+    cases: List[Case] = [
+        (f"get_bin_edges/{method}", lambda method=method: get_bin_edges(reference, bins, method))
+        for method in ("equal_width", "equal_freq", "kmeans")
+    ]
+    cases += [
+        ("get_bin_edges/adaptive", lambda: get_bin_edges(reference, bins, "adaptive", target=target)),
+        ("get_bin_edges/domain", lambda: get_bin_edges(reference, domain_edges, "domain")),
+        ("calculate_feature_drift/numeric", lambda: calculate_feature_drift(reference, new, bins=bins)),
+        ("calculate_feature_drift/numeric_domain",
+         lambda: calculate_feature_drift(reference, new, bins=domain_edges, method="domain")),
+        ("calculate_feature_drift/categorical", lambda: calculate_feature_drift(reference_labels, new_labels)),
+        ("calculate_all_features_drift/wide", lambda: calculate_all_features_drift(*wide, bins=bins)),
+        ("calculate_all_features_drift/wide_batched",
+         lambda: calculate_all_features_drift(*wide, bins=bins, batched=True)),
+        ("calculate_all_features_drift/tall", lambda: calculate_all_features_drift(*tall, bins=bins)),
+        ("create_drift_report/wide", lambda: create_drift_report(report_summary, report_details, report_path)),
+    ]
+    cases += [(name, ImportCase(code)) for name, code in IMPORT_CASES.items()]
+    return cases
+
+
+def _package_version() -> Optional[str]:
+    try:
+        return metadata.version("driftsense")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> Dict[str, float]:
+    """Best wall time over `repeat` runs and peak traced memory (MB) of one extra run."""
+    if isinstance(func, ImportCase):
+        return func.measure(repeat)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"time": min(timings), "peak_mb": peak / 2**20}
+
+
+def run(
+    sizes: Dict[str, int],
+    repeat: int = 3,
+    name_filter: Optional[str] = None,
+    stream=sys.stdout
+) -> dict:
+    """Run all cases (optionally only those whose name contains `name_filter`) and return the results document."""
+    results = {}
+    with tempfile.TemporaryDirectory() as report_dir:
+        for name, func in build_cases(**sizes, report_dir=report_dir):
+            if name_filter and name_filter not in name:
+                continue
+            # Reports print a confirmation line; keep the benchmark table readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name] = measure(func, repeat)
+            print(f"{name:<45}{results[name]['time']:>10.4f}s{results[name]['peak_mb']:>10.1f} MB", file=stream)
+
+    return {
+        "meta": {
+            "sizes": sizes,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "driftsense": _package_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25, stream=sys.stdout) -> List[str]:
+    """
+    Compare results with a baseline; returns the names of cases whose time or peak memory grew
+    by more than `tolerance` (relative, plus `NOISE_FLOOR`). Cases missing on either side are ignored.
+    """
+    if current["meta"]["sizes"] != baseline["meta"]["sizes"]:
+        print("Warning: baseline was recorded with different sizes.", file=stream)
+
+    regressions = []
+    print(f"{'case':<45}{'time':>10}{'memory':>10}", file=stream)
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        ratios = {key: result[key] / reference[key] if reference[key] > 0 else 1.0 for key in NOISE_FLOOR}
+        regressed = any(result[key] > reference[key] * (1 + tolerance) + floor for key, floor in NOISE_FLOOR.items())
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<45}{ratios['time']:>9.2f}x{ratios['peak_mb']:>9.2f}x{'  REGRESSION' if regressed else ''}", file=stream)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DriftSense benchmark suite")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    for key in ("rows", "features", "categories", "bins"):
+        parser.add_argument(f"--{key}", type=int, help=f"override the {key} of --size")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare with a JSON baseline written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown/growth")
+    args = parser.parse_args(argv)
+
+    sizes = {key: getattr(args, key) or value for key, value in SIZES[args.size].items()}
+    print(", ".join(f"{key}={value:,}" for key, value in sizes.items()))
+    results = run(sizes, repeat=args.repeat, name_filter=args.filter)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
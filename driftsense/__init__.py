@@ -1,15 +1,81 @@
 # stability_drift_metrics/__init__.py
+#
+# Public names are imported lazily, on first attribute access, so `import driftsense` stays cheap
+# for short-lived jobs (scikit-learn is only imported by the 'adaptive' and 'kmeans' binning methods).
 
-from .get_bin_edges import get_bin_edges
-from .calculate_feature_drift import calculate_feature_drift
-from .calculate_all_features_drift import calculate_all_features_drift
-from .create_drift_report import create_drift_report
-from .get_drift_report import get_drift_report
-
-__all__ = [
-    "get_bin_edges",
-    "calculate_feature_drift",
-    "calculate_all_features_drift",
-    "create_drift_report",
-    "get_drift_report"
-]
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .get_bin_edges import get_bin_edges
+    from .calculate_feature_drift import calculate_feature_drift
+    from .calculate_all_features_drift import calculate_all_features_drift
+    from .create_drift_report import create_drift_report
+    from .get_drift_report import get_drift_report
+    from .feature_baseline import FeatureBaseline
+    from .drift_profile import DriftProfile
+    from .drift_monitor import DriftMonitor
+    from .streaming import read_chunks
+    from .quantile_sketch import QuantileSketch
+    from .bin_counts import BinCounter
+    from .drift_result import FeatureDrift
+    from .export import export_drift_results, read_drift_results
+    from .profiling import DriftProfiler, profile_drift
+    from .async_scoring import AsyncDriftScorer
+    from .bin_edge_cache import BinEdgeCache, enable_edge_cache, disable_edge_cache
+    from .segment_drift import calculate_segment_drift
+    from .drift_bootstrap import bootstrap_drift
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    "get_bin_edges": "get_bin_edges",
+    "calculate_feature_drift": "calculate_feature_drift",
+    "calculate_all_features_drift": "calculate_all_features_drift",
+    "create_drift_report": "create_drift_report",
+    "get_drift_report": "get_drift_report",
+    "FeatureBaseline": "feature_baseline",
+    "DriftProfile": "drift_profile",
+    "DriftMonitor": "drift_monitor",
+    "read_chunks": "streaming",
+    "QuantileSketch": "quantile_sketch",
+    "BinCounter": "bin_counts",
+    "FeatureDrift": "drift_result",
+    "export_drift_results": "export",
+    "read_drift_results": "export",
+    "DriftProfiler": "profiling",
+    "profile_drift": "profiling",
+    "AsyncDriftScorer": "async_scoring",
+    "BinEdgeCache": "bin_edge_cache",
+    "enable_edge_cache": "bin_edge_cache",
+    "disable_edge_cache": "bin_edge_cache",
+    "calculate_segment_drift": "segment_drift",
+    "bootstrap_drift": "drift_bootstrap",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # Importing a submodule binds it on the package; functions named like their submodule
+        # (e.g. `get_bin_edges`) must not be shadowed by it.
+        if isinstance(value, ModuleType) and _LAZY_IMPORTS.get(name) == name:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
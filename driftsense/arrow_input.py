@@ -0,0 +1,158 @@
+from typing import List, Union
+import numpy as np
+import pandas as pd
+
+# Input types accepted besides pandas DataFrames: (module, class name), checked without importing pyarrow/polars
+ARROW_TABLE_TYPES = (("pyarrow", "Table"), ("pyarrow", "RecordBatch"))
+POLARS_FRAME_TYPES = (("polars", "DataFrame"),)
+
+
+def _type_of(data) -> tuple:
+    return type(data).__module__.split(".")[0], type(data).__name__
+
+
+def is_arrow_input(data) -> bool:
+    """Whether `data` is a pyarrow Table/RecordBatch or a Polars DataFrame."""
+    return _type_of(data) in ARROW_TABLE_TYPES + POLARS_FRAME_TYPES
+
+
+class ArrowColumn:
+    """
+    Column of an Arrow table, converted to the values the drift functions work on.
+
+    Numeric, boolean and temporal columns become NumPy arrays; a single-chunk column without
+    nulls is a zero-copy view of the Arrow buffer. String and dictionary-encoded columns become a
+    `pd.Categorical` over the Arrow dictionary indices, so they are counted on their integer codes
+    instead of being expanded to object arrays.
+    """
+
+    def __init__(self, column):
+        import pyarrow as pa
+
+        self.column = column if isinstance(column, pa.ChunkedArray) else pa.chunked_array([column])
+        self._values = None
+
+    def __len__(self) -> int:
+        return len(self.column)
+
+    def _coded(self) -> pd.Categorical:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        column = self.column
+        if not pa.types.is_dictionary(column.type):
+            if hasattr(pa.types, "is_string_view") and pa.types.is_string_view(column.type):
+                column = column.cast(pa.large_string())
+            column = pc.dictionary_encode(column)
+        column = column.unify_dictionaries()
+
+        if column.num_chunks == 0:
+            return pd.Categorical.from_codes(np.array([], dtype=np.int32), categories=pd.Index([], dtype=object))
+        codes = np.concatenate([
+            pc.fill_null(chunk.indices.cast(pa.int32()), -1).to_numpy(zero_copy_only=False)
+            for chunk in column.chunks
+        ])
+        categories = pd.Index(column.chunk(0).dictionary.to_pylist(), dtype=object)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    def _is_string(self) -> bool:
+        import pyarrow as pa
+
+        value_type = self.column.type.value_type if pa.types.is_dictionary(self.column.type) else self.column.type
+        is_string_view = getattr(pa.types, "is_string_view", lambda _: False)
+        return pa.types.is_string(value_type) or pa.types.is_large_string(value_type) or is_string_view(value_type)
+
+    def values(self) -> Union[np.ndarray, pd.Categorical]:
+        """All values of the column (missing values as NaN/None, or code -1 for categoricals)."""
+        if self._values is None:
+            import pyarrow as pa
+
+            if self._is_string() and not (pa.types.is_dictionary(self.column.type) and self._dictionary_nulls()):
+                self._values = self._coded()
+            else:
+                column = self.column
+                if pa.types.is_dictionary(column.type):
+                    column = pa.chunked_array([chunk.dictionary_decode() for chunk in column.chunks], column.type.value_type)
+                chunks = [chunk.to_numpy(zero_copy_only=False) for chunk in column.chunks]
+                self._values = chunks[0] if len(chunks) == 1 else np.concatenate(chunks) if chunks else np.array([])
+        return self._values
+
+    def _dictionary_nulls(self) -> bool:
+        return any(chunk.dictionary.null_count for chunk in self.column.chunks)
+
+    def notna(self) -> np.ndarray:
+        """Boolean mask of the observed (non-null, non-NaN) values."""
+        return ~np.asarray(pd.isna(self.values()))
+
+    def count(self) -> int:
+        """Number of observed values, as `pd.Series.count`."""
+        return int(np.count_nonzero(self.notna()))
+
+    def to_values(self, drop_missing: bool = True) -> Union[np.ndarray, pd.Categorical]:
+        """Column values, without missing values if `drop_missing` (copied only when some are missing)."""
+        values = self.values()
+        if drop_missing:
+            mask = np.asarray(pd.isna(values))
+            if mask.any():
+                values = values[~mask]
+        return values
+
+
+class ArrowFrame:
+    """
+    Read-only view of a pyarrow Table/RecordBatch (or a Polars DataFrame, through its Arrow data)
+    with the small part of the DataFrame interface the drift functions use: `columns`, `len` and
+    column access. Columns are converted on access (see `ArrowColumn`).
+    """
+
+    def __init__(self, table):
+        if _type_of(table) in POLARS_FRAME_TYPES:
+            table = table.to_arrow()
+        self.table = table
+        self._columns = {}
+
+    def __repr__(self) -> str:
+        return f"ArrowFrame(rows={len(self)}, columns={len(self.columns)})"
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.table.schema.names)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __getitem__(self, col: str) -> ArrowColumn:
+        # Converted columns are kept, so each column is converted once per frame
+        if col not in self._columns:
+            self._columns[col] = ArrowColumn(self.table.column(col))
+        return self._columns[col]
+
+    def numeric_columns(self) -> List[str]:
+        """Integer and floating point columns, from the schema (nothing is converted)."""
+        import pyarrow as pa
+
+        return [
+            field.name for field in self.table.schema
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        ]
+
+    def to_pandas(self, columns: List[str]) -> pd.DataFrame:
+        """Selected columns as a pandas DataFrame (e.g. numeric columns for `batched=True`)."""
+        return pd.DataFrame({col: self[col].values() for col in columns})
+
+
+def _as_frame(data):
+    """
+    `data` as a frame the drift functions accept: pandas DataFrames unchanged, Arrow/Polars
+    tables wrapped in an `ArrowFrame`, anything else as-is (for the caller to reject).
+    """
+    return ArrowFrame(data) if is_arrow_input(data) else data
+
+
+def _is_frame(data) -> bool:
+    return isinstance(data, (pd.DataFrame, ArrowFrame))
+
+
+def _numeric_pandas(frame) -> pd.DataFrame:
+    """pandas DataFrame holding (at least) the numeric columns of a frame, for the vectorized batched path."""
+    return frame.to_pandas(frame.numeric_columns()) if isinstance(frame, ArrowFrame) else frame
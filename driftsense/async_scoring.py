@@ -0,0 +1,315 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .arrow_input import _as_frame, _is_frame
+from .drift_profile import DriftProfile
+from .drift_result import FeatureDrift
+from .feature_baseline import FeatureBaseline, _column_values, _is_coded
+
+Counts = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+class _Request:
+    __slots__ = ("columns", "feature", "detail", "future")
+
+    def __init__(self, columns: Dict[str, np.ndarray], feature: Optional[str], detail: bool, future: asyncio.Future):
+        self.columns = columns
+        self.feature = feature
+        self.detail = detail
+        self.future = future
+
+
+def _request_counts(baseline: FeatureBaseline, labels: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One row of a batched count matrix in the form `FeatureBaseline.count` returns for that request alone.
+    """
+    if baseline.is_categorical and baseline.method != 'domain':
+        # The batch labels are the union over all requests; keep the categories seen in this request
+        regular, missing = baseline._split_counts(counts)
+        seen = regular > 0
+        return labels[seen], np.append(regular[seen], missing)
+    return labels, counts
+
+
+def _concat_values(members: List[Union[np.ndarray, pd.Categorical]]) -> Union[np.ndarray, pd.Categorical]:
+    """
+    Values of all requests as one array. String categoricals stay coded: their categories are merged
+    and the codes remapped, instead of expanding every member to an object array.
+    """
+    if all(_is_coded(values) for values in members):
+        categories = pd.Index(np.unique(np.concatenate([np.asarray(values.categories, dtype=object)
+                                                        for values in members])))
+        codes = np.concatenate([
+            np.append(categories.get_indexer(np.asarray(values.categories, dtype=object)), -1)[values.codes]
+            for values in members
+        ])
+        return pd.Categorical.from_codes(codes, categories)
+    return np.concatenate([np.asarray(values) for values in members])
+
+
+def _count_batch(features: Dict[str, FeatureBaseline], requests: List[_Request]) -> List[Counts]:
+    """
+    Count the new data of all requests with one pass per feature.
+
+    The values of every request are concatenated (string categoricals on their codes) and histogrammed
+    together with the request as the group (`FeatureBaseline.count_by`), instead of once per request.
+    """
+    batch_counts: List[Counts] = [{} for _ in requests]
+    for col, baseline in features.items():
+        members = [(i, request.columns[col]) for i, request in enumerate(requests) if col in request.columns]
+        if not members:
+            continue
+
+        if len(members) == 1:
+            i, values = members[0]
+            batch_counts[i][col] = baseline.count(values)
+            continue
+
+        values = _concat_values([values for _, values in members])
+        groups = np.repeat(np.arange(len(members)), [len(values) for _, values in members])
+        labels, matrix = baseline.count_by(values, groups, len(members))
+        for (i, _), counts in zip(members, matrix):
+            batch_counts[i][col] = _request_counts(baseline, labels, counts)
+    return batch_counts
+
+
+class AsyncDriftScorer:
+    """
+    asyncio front end scoring new data against a fitted `DriftProfile`.
+
+    `score` and `score_feature` are coroutines: the CPU work runs in a bounded executor, so the event
+    loop stays responsive. Requests arriving within `max_delay` of each other (up to `max_batch_size`)
+    are coalesced: each feature is counted once for the whole batch (one binning pass over the
+    concatenated values, with the request as the group), and each request then gets its own result.
+    Results are identical to `DriftProfile.score` / `FeatureBaseline.score` of the request alone.
+
+    At most `max_pending` requests are queued or running (`pending` counts the requests submitted and
+    not yet answered). Further calls wait for a free slot (backpressure) or, with `reject_when_full=True`,
+    fail immediately with `asyncio.QueueFull`.
+
+    Parameters:
+    - profile (DriftProfile): Fitted reference profile.
+
+    - max_batch_size (int): Maximum number of requests scored together.
+
+    - max_delay (float): Seconds to wait for more requests after the first one of a batch.
+
+    - max_pending (int): Maximum number of requests queued or in progress.
+
+    - reject_when_full (bool): Raise `asyncio.QueueFull` instead of waiting when `max_pending` is reached.
+
+    - max_workers (int, optional): Threads of the executor created by the scorer (default: up to 4).
+
+    - executor (Executor, optional): Executor for the CPU work instead of an own thread pool.
+
+    Example:
+    ```python
+    async with AsyncDriftScorer(profile) as scorer:
+        summary_df, detailed_dfs = await scorer.score(batch_df)
+        result = await scorer.score_feature("age", values)
+    ```
+    """
+
+    def __init__(
+        self,
+        profile: DriftProfile,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        max_pending: int = 1024,
+        reject_when_full: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ):
+        if not isinstance(profile, DriftProfile):
+            raise TypeError("'profile' must be a fitted DriftProfile.")
+        if max_batch_size < 1 or max_pending < 1:
+            raise ValueError("'max_batch_size' and 'max_pending' must be positive integers.")
+        if max_delay < 0:
+            raise ValueError("'max_delay' must not be negative.")
+
+        self.profile = profile
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.reject_when_full = reject_when_full
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.pending = 0
+
+    def __repr__(self) -> str:
+        return f"AsyncDriftScorer(features={len(self.profile.features)}, pending={self.pending})"
+
+    async def __aenter__(self) -> "AsyncDriftScorer":
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _start(self) -> None:
+        if self._dispatcher is not None:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="driftsense")
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def close(self) -> None:
+        """
+        Finish the requests already submitted, then stop the dispatcher (and the scorer's own executor).
+        """
+        if self._dispatcher is None:
+            return
+        await self._idle.wait()
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+        self._dispatcher = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _submit(self, columns: Dict[str, np.ndarray], feature: Optional[str], detail: bool):
+        self._start()
+        if self.reject_when_full and self.pending >= self.max_pending:
+            raise asyncio.QueueFull(f"{self.max_pending} drift requests are already pending.")
+
+        self.pending += 1
+        self._idle.clear()
+        try:
+            async with self._slots:
+                future = asyncio.get_running_loop().create_future()
+                self._queue.put_nowait(_Request(columns, feature, detail, future))
+                return await future
+        finally:
+            self.pending -= 1
+            if self.pending == 0:
+                self._idle.set()
+
+    async def score(self, new_df: pd.DataFrame, detail: bool = True) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Score a batch of new data against the profile, as `DriftProfile.score`.
+
+        Parameters:
+        - new_df (DataFrame): New dataset (or an Arrow table, see `DriftProfile.score`).
+
+        - detail (bool): Whether to return the detailed Drift DataFrames.
+
+        Returns:
+        - Tuple containing the summary DataFrame and the dictionary of detailed DataFrames.
+        """
+        new_df = _as_frame(new_df)
+        if not _is_frame(new_df):
+            raise ValueError("Input 'new_df' should be a pandas DataFrame or an Arrow table.")
+
+        drop_missing = self.profile.missing != 'bin'
+        columns = {}
+        for col in self.profile.features:
+            if col in new_df.columns:
+                values = _column_values(new_df[col], drop_missing=drop_missing)
+                if len(values):
+                    columns[col] = values
+        return await self._submit(columns, None, detail)
+
+    async def score_feature(self, feature: str, new: Union[List[float], np.ndarray]) -> FeatureDrift:
+        """
+        Score new values of a single feature against its fitted baseline.
+
+        Missing values are handled as in `DriftProfile.score` (dropped unless the profile bins them).
+        Input without any value left to score raises a ValueError, as `score` skips such columns.
+
+        Parameters:
+        - feature (str): Feature of the profile.
+
+        - new (array-like): New values of the feature.
+
+        Returns:
+        - FeatureDrift: Drift result of the feature.
+        """
+        if feature not in self.profile.features:
+            raise ValueError(f"Feature '{feature}' is not part of the fitted profile.")
+        new = np.asarray(new)
+        if self.profile.missing != 'bin':
+            new = new[~pd.isna(new)]
+        if len(new) == 0:
+            raise ValueError(f"Input 'new' data of feature '{feature}' is empty or contains only missing values.")
+        return await self._submit({feature: new}, feature, True)
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            job = loop.run_in_executor(self._executor, self._score_batch, batch)
+            job.add_done_callback(lambda job, batch=batch: self._finish(job, batch))
+
+    def _finish(self, job: asyncio.Future, batch: List[_Request]) -> None:
+        if job.cancelled():
+            for request in batch:
+                request.future.cancel()
+            return
+        outcomes = [job.exception()] * len(batch) if job.exception() is not None else job.result()
+
+        for request, outcome in zip(batch, outcomes):
+            if request.future.done():
+                continue  # The caller gave up (e.g. timeout)
+            if isinstance(outcome, BaseException):
+                request.future.set_exception(outcome)
+            else:
+                request.future.set_result(outcome)
+
+    def _score_batch(self, batch: List[_Request]) -> list:
+        """Executor job: count the whole batch together, then build each request's result."""
+        try:
+            batch_counts = _count_batch(self.profile.features, batch)
+        except Exception:
+            # Isolate a failing request: count the requests one by one
+            batch_counts = []
+            for request in batch:
+                try:
+                    batch_counts.append(_count_batch(self.profile.features, [request])[0])
+                except Exception as e:
+                    batch_counts.append(e)
+
+        outcomes = []
+        for request, counts in zip(batch, batch_counts):
+            if isinstance(counts, Exception):
+                outcomes.append(counts)
+                continue
+            try:
+                if request.feature is not None:
+                    baseline = self.profile.features[request.feature]
+                    outcomes.append(baseline.score_counts(
+                        *counts[request.feature], metrics=self.profile.metrics, bootstrap=self.profile.bootstrap
+                    ))
+                else:
+                    outcomes.append(self.profile.score_counts(counts, detail=request.detail))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
@@ -0,0 +1,129 @@
+import numpy as np
+from typing import Tuple
+
+# Values are processed in cache-sized blocks so temporaries (masks, indices) stay small for long columns.
+BLOCK_SIZE = 1 << 16
+
+# Up to this many bins, one comparison pass per edge beats a binary search or sort per value.
+MAX_COMPARE_BINS = 16
+
+
+def _float32_bounds(bin_edges: np.ndarray) -> Tuple[np.ndarray, np.float32]:
+    """
+    float32 versions of the edges for comparing float32 values without upcasting them.
+
+    For float32 ``x``: ``x >= edge`` iff ``x >= lower[i]`` (edges rounded up) and
+    ``x <= bin_edges[-1]`` iff ``x <= upper`` (last edge rounded down).
+    """
+    lower = bin_edges.astype(np.float32)
+    below = lower < bin_edges
+    lower[below] = np.nextafter(lower[below], np.float32(np.inf))
+
+    upper = np.float32(bin_edges[-1])
+    if upper > bin_edges[-1]:
+        upper = np.nextafter(upper, np.float32(-np.inf))
+    return lower, upper
+
+
+class BinCounter:
+    """
+    Counting kernel for known, sorted bin edges (`np.histogram` semantics).
+
+    Edge checks and preparation happen once, so the same counter can be reused for the reference
+    data, every new batch and every window. Values are processed in cache-sized blocks with the
+    cheapest exact strategy for the edges:
+
+    - up to `MAX_COMPARE_BINS` bins (the default of 10, equal-width or not): one vectorized
+      comparison per edge;
+    - more bins: sorted blocks (counts) or `np.searchsorted` (indices).
+
+    float32 input is compared against float32 edges rounded outward, which gives the same bins as
+    float64 comparisons without upcasting the data.
+
+    Parameters:
+    - bin_edges (array-like): Monotonically increasing bin edges (may start at -inf / end at +inf).
+    """
+
+    __slots__ = ("bin_edges", "n_bins", "_lower32", "_upper32")
+
+    def __init__(self, bin_edges: np.ndarray):
+        bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        if bin_edges.ndim != 1 or len(bin_edges) < 2:
+            raise ValueError("At least two bin edges are required.")
+        if np.any(np.diff(bin_edges) < 0):
+            raise ValueError("Bin edges must increase monotonically.")
+
+        self.bin_edges = bin_edges
+        self.n_bins = len(bin_edges) - 1
+        self._lower32, self._upper32 = _float32_bounds(bin_edges)
+
+    def _bounds(self, block: np.ndarray):
+        if block.dtype == np.float32:
+            return self._lower32, self._upper32
+        return self.bin_edges, self.bin_edges[-1]
+
+    def _block_indices(self, block: np.ndarray) -> np.ndarray:
+        lower, upper = self._bounds(block)
+        last = self.n_bins - 1
+
+        if self.n_bins <= MAX_COMPARE_BINS:
+            # Number of edges at or below each value; NaN compares False everywhere and stays at -1
+            indices = np.full(len(block), -1, dtype=np.intp)
+            for edge in lower[:-1]:
+                indices += block >= edge
+        else:
+            indices = np.searchsorted(lower, block, side="right") - 1
+            indices[~(block >= lower[0])] = -1
+
+        # Like np.histogram, the last bin is closed on the right; values above it are dropped
+        indices[indices == self.n_bins] = last
+        indices[block > upper] = -1
+        return indices
+
+    def _block_counts(self, block: np.ndarray) -> np.ndarray:
+        lower, upper = self._bounds(block)
+
+        if self.n_bins <= MAX_COMPARE_BINS:
+            # Number of values below each edge (at or below the last one); bin counts are the differences
+            below = [np.count_nonzero(block < edge) for edge in lower[:-1]]
+            below.append(np.count_nonzero(block <= upper))
+        else:
+            # NaN sorts to the end, past every edge
+            block = np.sort(block)
+            below = np.append(np.searchsorted(block, lower[:-1], side="left"), np.searchsorted(block, upper, side="right"))
+        return np.diff(below)
+
+    def indices(self, values: np.ndarray) -> np.ndarray:
+        """
+        Bin index of each value (-1 for values outside the edges or NaN).
+
+        Parameters:
+        - values (np.ndarray): Numeric values.
+
+        Returns:
+        - np.ndarray: Integer bin indices.
+        """
+        values = np.asarray(values)
+        if len(values) <= BLOCK_SIZE:
+            return self._block_indices(values)
+
+        indices = np.empty(len(values), dtype=np.intp)
+        for start in range(0, len(values), BLOCK_SIZE):
+            indices[start:start + BLOCK_SIZE] = self._block_indices(values[start:start + BLOCK_SIZE])
+        return indices
+
+    def count(self, values: np.ndarray) -> np.ndarray:
+        """
+        Number of values in each bin; same result as ``np.histogram(values, bins=bin_edges)[0]``.
+
+        Parameters:
+        - values (np.ndarray): Numeric values.
+
+        Returns:
+        - np.ndarray: int64 counts, one per bin.
+        """
+        values = np.asarray(values)
+        counts = np.zeros(self.n_bins, dtype=np.int64)
+        for start in range(0, len(values), BLOCK_SIZE):
+            counts += self._block_counts(values[start:start + BLOCK_SIZE])
+        return counts
@@ -0,0 +1,211 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import numpy as np
+
+# Bumped whenever the fitted edges of a method could change, so stale disk entries are not reused
+CACHE_VERSION = 1
+
+
+def _digest_array(h: "hashlib._Hash", values: np.ndarray) -> None:
+    values = np.ascontiguousarray(values)
+    h.update(f"{values.dtype.str}{values.shape}".encode())
+    h.update(memoryview(values).cast("B"))
+
+
+def fingerprint(
+    reference: np.ndarray,
+    bins: int,
+    method: str,
+    target: Optional[np.ndarray] = None,
+    max_fit_rows: Optional[int] = None
+) -> Optional[str]:
+    """
+    Content hash of a reference column and the binning parameters, or None when the inputs are not
+    hashable by content (non-numeric arrays).
+
+    Parameters:
+    - reference (np.ndarray): Reference values.
+
+    - bins (int): Number of bins.
+
+    - method (str): Binning method.
+
+    - target (np.ndarray, optional): Target of 'adaptive' binning.
+
+    - max_fit_rows (int, optional): Fast fitting sample size.
+
+    Returns:
+    - str or None: Hex digest identifying the fitted edges.
+    """
+    if reference.dtype.kind not in "biuf" or (target is not None and target.dtype.kind not in "biuf"):
+        return None
+    # Edges fitted by scikit-learn models can change between its releases
+    fitter_version = None
+    if method in ("kmeans", "adaptive"):
+        import sklearn
+        fitter_version = sklearn.__version__
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((CACHE_VERSION, int(bins), method, max_fit_rows, fitter_version)).encode())
+    _digest_array(h, reference)
+    if target is not None:
+        _digest_array(h, target)
+    return h.hexdigest()
+
+
+class BinEdgeCache:
+    """
+    Memoizes fitted bin edges by a fingerprint of the reference data and the binning parameters.
+
+    Recently used edges are kept in memory (least recently used entries are evicted beyond
+    `max_entries`). With `directory`, edges are also written there as `.npy` files, so other
+    processes and later sessions can skip fitting too. Use `enable_edge_cache` to make
+    `get_bin_edges` (and everything built on it) consult a cache.
+
+    Parameters:
+    - max_entries (int): Maximum number of edge arrays held in memory.
+
+    - directory (str, optional): Directory of the on-disk tier (created if missing).
+
+    Example:
+    ```python
+    cache = enable_edge_cache(max_entries=512, directory=".driftsense_cache")
+    calculate_feature_drift(reference, new, method="kmeans")  # fits the edges
+    calculate_feature_drift(reference, new, method="kmeans")  # reuses them
+    cache.stats()
+    ```
+    """
+
+    def __init__(self, max_entries: int = 1024, directory: Optional[str] = None):
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be a positive integer.")
+        self.max_entries = max_entries
+        self.directory = os.fspath(directory) if directory is not None else None
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"BinEdgeCache(entries={len(self._entries)}, max_entries={self.max_entries}, directory={self.directory!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def _remember(self, key: str, edges: np.ndarray) -> None:
+        self._entries[key] = edges
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached edges of `key` (a copy), from memory or disk, or None."""
+        with self._lock:
+            edges = self._entries.get(key)
+            if edges is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return edges.copy()
+
+        if self.directory is not None:
+            try:
+                edges = np.load(self._path(key), allow_pickle=False)
+            except (OSError, ValueError):
+                edges = None  # Missing or unreadable file
+            if edges is not None:
+                with self._lock:
+                    self._remember(key, edges)
+                    self.disk_hits += 1
+                return edges.copy()
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, edges: np.ndarray) -> None:
+        """Store fitted edges under `key`."""
+        edges = np.array(edges)
+        with self._lock:
+            self._remember(key, edges)
+        if self.directory is not None and edges.dtype.kind in "biuf":
+            # Write to a temporary file first so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, edges, allow_pickle=False)
+                os.replace(tmp_path, self._path(key))
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the in-memory entries and reset the statistics (and delete the disk tier if `disk`)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".npy"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hit/miss statistics: memory hits, disk hits, misses, hit rate and number of entries in memory.
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+_ACTIVE_CACHE: Optional[BinEdgeCache] = None
+
+
+def enable_edge_cache(
+    max_entries: int = 1024,
+    directory: Optional[str] = None,
+    cache: Optional[BinEdgeCache] = None
+) -> BinEdgeCache:
+    """
+    Memoize the bin edges fitted by `get_bin_edges` (process-wide) until `disable_edge_cache`.
+
+    Repeated runs on an unchanged reference column with the same `bins`, `method`, `target` and
+    `max_fit_rows` then skip fitting. 'domain' bins and `QuantileSketch` references are not cached.
+
+    Parameters:
+    - max_entries (int): Maximum number of edge arrays held in memory.
+
+    - directory (str, optional): Directory of the on-disk tier.
+
+    - cache (BinEdgeCache, optional): Existing cache to use instead of a new one.
+
+    Returns:
+    - BinEdgeCache: The active cache (for its `stats`).
+    """
+    global _ACTIVE_CACHE
+    _ACTIVE_CACHE = cache if cache is not None else BinEdgeCache(max_entries, directory)
+    return _ACTIVE_CACHE
+
+
+def disable_edge_cache() -> None:
+    """Stop memoizing bin edges."""
+    global _ACTIVE_CACHE
+    _ACTIVE_CACHE = None
+
+
+def active_edge_cache() -> Optional[BinEdgeCache]:
+    """The cache consulted by `get_bin_edges`, if enabled."""
+    return _ACTIVE_CACHE
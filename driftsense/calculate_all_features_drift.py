@@ -1,71 +1,250 @@
-from typing import Union, Dict, Tuple
+from concurrent.futures import Executor
+from itertools import chain
+from typing import Union, Dict, Tuple, Optional, Iterable, List
 import pandas as pd
 
+from .arrow_input import _as_frame, _is_frame, _numeric_pandas
 from .calculate_feature_drift import calculate_feature_drift
+from .parallel import map_feature_tasks
+from .drift_profile import DriftProfile
+from .feature_baseline import FeatureBaseline, _column_values
+from .drift_metrics import get_metrics
+from .drift_result import DriftDetails, _drift_output
+from .profiling import feature_scope, profile_drift, stage
+from .batched_drift import batched_numeric_columns, batched_numeric_drift
+from .segment_drift import calculate_segment_drift
+
+
+def _feature_drift_task(reference, new, feature=None, **kwargs):
+    # Module-level (picklable) task so profiled stages are attributed to their feature
+    with feature_scope(feature):
+        return calculate_feature_drift(reference, new, **kwargs)
+
+
+def _is_default_executor(executor: Union[str, Executor]) -> bool:
+    return isinstance(executor, str) and executor == 'thread'
+
+
+def _reject_options(context: str, **given: bool) -> None:
+    """Raise for the first option given (True) that is not available in `context`."""
+    for name, is_given in given.items():
+        if is_given:
+            raise ValueError(f"'{name}' is not available {context}.")
 
 
 def calculate_all_features_drift(
     reference_df: pd.DataFrame,
-    new_df: pd.DataFrame,
+    new_df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
     bins: Union[int, Dict[str, list]] = 10,
-    method: str = 'equal_freq'
-) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    method: str = 'equal_freq',
+    missing: str = 'drop',
+    n_jobs: Optional[int] = 1,
+    executor: Union[str, Executor] = 'thread',
+    chunk_size: Optional[int] = None,
+    max_fit_rows: Optional[int] = None,
+    kinds: Optional[Dict[str, str]] = None,
+    metrics: Optional[List[str]] = None,
+    batched: bool = False,
+    detail: bool = True,
+    profile: bool = False,
+    segment_by: Optional[Union[str, List[str]]] = None,
+    segment_bins: str = 'shared',
+    bootstrap: Optional[int] = None
+) -> Union[Tuple[pd.DataFrame, Dict[str, pd.DataFrame]], Tuple[pd.DataFrame, Dict[str, pd.DataFrame], pd.DataFrame]]:
     
     """
     Compute drift/stability for all features in the dataframe.
 
     Parameters:
-    - reference_df (DataFrame): Baseline dataset.
+    - reference_df (DataFrame): Baseline dataset. A pyarrow Table/RecordBatch or a Polars DataFrame is read
+      directly: numeric columns without copying, string and dictionary columns on their integer codes.
     
-    - new_df (DataFrame): New dataset. Monitoring/Test/Validation.
+    - new_df (DataFrame or iterable of DataFrames): New dataset. Monitoring/Test/Validation (or Arrow tables, as `reference_df`).
+      An iterator of DataFrame chunks (e.g. from `read_chunks`) is scored in streaming mode:
+      per-bin counts are accumulated chunk by chunk, giving the same result with memory bounded
+      by the chunk size. 'n_jobs', 'executor', 'chunk_size' and 'batched' must keep their defaults in
+      streaming mode.
     
     - bins (int or dict): Number of bins (for numerical) or category handling.
     
     - method (str): Binning method ('equal_width', 'equal_freq', 'adaptive', 'kmeans', 'domain').
 
+    - missing (str): 'drop' (default) ignores missing values; 'bin' counts them in an extra "Missing" bin
+      instead of dropping them, which also avoids copying the columns.
+
+    - n_jobs (int): Number of features computed in parallel. 1 (default) runs serially, -1 uses all CPUs.
+
+    - executor (str or Executor): 'thread' (default), 'process' or a `concurrent.futures.Executor`.
+      Process workers receive numeric columns through shared memory. Results are identical to a serial run.
+
+    - chunk_size (int, optional): Number of features per parallel task; raise it for thousands of cheap features.
+
+    - max_fit_rows (int, optional): Fit 'kmeans'/'adaptive' bins on a reproducible sample of at most this many
+      rows, aggregated to weighted distinct values (see `get_bin_edges`).
+
+    - kinds (dict, optional): Feature kind per column ('categorical' or 'numeric'), overriding the automatic
+      decision (object dtype or fewer than 20 distinct values) for those columns.
+
+    - metrics (list, optional): Extra drift metrics added as summary columns, computed from the same bin
+      counts as the Drift score: any of "psi", "kl", "js", "hellinger", "ks", "wasserstein" or a metric
+      registered with `driftsense.drift_metrics.register_metric`.
+
+    - batched (bool): Bin and score all numeric features together with array operations over blocks
+      of columns ('equal_width' and 'equal_freq' only), instead of one call per feature. Results are
+      the same; this removes the per-feature overhead for thousands of narrow numeric features.
+      Other features are computed as usual.
+
+    - detail (bool): Whether to return the detailed Drift DataFrames. With False (summary-only mode) the
+      second element is an empty dictionary and no per-feature detail is kept.
+
+    - profile (bool): Record wall time and rows per feature and stage (type detection, bin fitting,
+      counting, scoring, ...) and return them as a third element (see `driftsense.profiling.profile_drift`
+      for memory tracking, callbacks and log events).
+
+    - segment_by (str or list, optional): Column(s) defining segments (e.g. region, channel). Drift is then
+      computed per segment and feature in one grouped pass (see `calculate_segment_drift`); the first
+      element is the tidy (segment, feature) table and the second an empty dictionary.
+
+    - segment_bins (str): With `segment_by`, 'shared' (default) bins from the whole reference or 'segment'
+      bins fitted per segment. The segments are scored in a single serial pass: 'n_jobs', 'executor',
+      'chunk_size', 'batched' and 'detail' must keep their defaults.
+
+    - bootstrap (int, optional): Number of bootstrap resamples (e.g. 1000) of each feature's bin counts. Adds a
+      95% confidence interval ("Drift CI Lower", "Drift CI Upper") and a p-value against "no drift" ("P-Value")
+      as summary columns, e.g. for `create_drift_report(..., decision='ci')`. Not available with `segment_by`.
+
     Returns:
     
     - Tuple containing:
     
         1. DataFrame with Drift (CSI/PSI) values for all features.
         
-        2. Dictionary of Drift (CSI/PSI) dataFrames for all features.
+        2. Dictionary of Drift (CSI/PSI) dataFrames for all features. Each DataFrame is built from
+           the compact per-feature result (`FeatureDrift`, see `.results`) when it is first accessed.
+
+        3. With `profile=True`, DataFrame of timings per feature and stage.
         
     """
 
-    if not isinstance(reference_df, pd.DataFrame) or not isinstance(new_df, pd.DataFrame):
-        raise ValueError("Both inputs should be pandas DataFrames.")
+    if profile:
+        with profile_drift() as profiler:
+            summary_df, detailed_dfs = calculate_all_features_drift(
+                reference_df, new_df, bins=bins, method=method, missing=missing, n_jobs=n_jobs, executor=executor,
+                chunk_size=chunk_size, max_fit_rows=max_fit_rows, kinds=kinds, metrics=metrics, batched=batched,
+                detail=detail, segment_by=segment_by, segment_bins=segment_bins, bootstrap=bootstrap
+            )
+        return summary_df, detailed_dfs, profiler.to_frame()
 
-    csi_results = []
-    detailed_csi_dfs = {}
+    # Arrow tables (and Polars DataFrames) are read column by column without a pandas conversion
+    reference_df, new_df = _as_frame(reference_df), _as_frame(new_df)
+    if not _is_frame(reference_df):
+        raise ValueError("Both inputs should be pandas DataFrames or Arrow tables.")
 
-    for col in reference_df.columns:
-        if col not in new_df.columns:
-            continue  # Skip columns missing in new dataset
+    if segment_by is not None:
+        if not _is_frame(new_df):
+            raise ValueError("Segmented drift requires the new data as a single DataFrame, not chunks.")
+        if bootstrap:
+            raise ValueError("'bootstrap' is not available with 'segment_by'.")
+        _reject_options("with 'segment_by'", n_jobs=n_jobs != 1, executor=not _is_default_executor(executor),
+                        chunk_size=chunk_size is not None, batched=batched, detail=not detail)
+        segment_df = calculate_segment_drift(
+            reference_df, new_df, segment_by, bins=bins, method=method, missing=missing, segment_bins=segment_bins,
+            max_fit_rows=max_fit_rows, kinds=kinds, metrics=metrics
+        )
+        return segment_df, {}
 
-        reference = reference_df[col].dropna()
-        actual = new_df[col].dropna()
+    if not _is_frame(new_df):
+        if isinstance(new_df, (str, bytes)) or not isinstance(new_df, Iterable):
+            raise ValueError("Both inputs should be pandas DataFrames or Arrow tables.")
 
-        # Skip if column is empty in either dataset
-        if len(reference) == 0 or len(actual) == 0:
-            continue
+        _reject_options("when the new data is streamed in chunks", n_jobs=n_jobs != 1,
+                        executor=not _is_default_executor(executor), chunk_size=chunk_size is not None,
+                        batched=batched)
+
+        # Streaming mode: bin the reference once, then accumulate counts over the chunks
+        chunks = iter(new_df)
+        first_chunk = _as_frame(next(chunks, None))
+        if not _is_frame(first_chunk):
+            raise ValueError("Each chunk of new data should be a pandas DataFrame or an Arrow table.")
+
+        columns = [col for col in reference_df.columns if col in first_chunk.columns]
+        drift_profile = DriftProfile(bins=bins, method=method, missing=missing, max_fit_rows=max_fit_rows,
+                                     kinds=kinds, metrics=metrics, bootstrap=bootstrap).fit(reference_df, columns=columns)
+        return drift_profile.score_chunks(chain([first_chunk], chunks), detail=detail)
+
+    batched_results = {}
+    if batched:
+        batch_reference, batch_new = _numeric_pandas(reference_df), _numeric_pandas(new_df)
+        batched_columns = batched_numeric_columns(
+            batch_reference, batch_new, list(batch_reference.columns), method, missing=missing, kinds=kinds
+        )
+        with stage("batched", rows=len(reference_df) + len(new_df)):
+            batched_results = batched_numeric_drift(batch_reference, batch_new, batched_columns, bins, method, missing)
+
+    features = []
+
+    def feature_tasks():
+        for col in reference_df.columns:
+            if col not in new_df.columns or col in batched_results:
+                continue  # Skip columns missing in new dataset (or already scored in batch)
+
+            # Column values as NumPy arrays, without copying: missing values are masked once by the
+            # baseline, which counts or drops them
+            with stage("prepare", feature=col, rows=len(reference_df) + len(new_df)):
+                reference = _column_values(reference_df[col], drop_missing=False)
+                actual = _column_values(new_df[col], drop_missing=False)
+
+            # Skip if column is empty in either dataset
+            if len(actual) == 0 or reference_df[col].count() == 0 or (missing != 'bin' and new_df[col].count() == 0):
+                continue
 
-        ## ADD CHUNK HERE - FOR SPECIFIC BINNING FOR ALL COLUMNS
-        if method == 'domain':
-            # Expecting dict of bins: {col_name: bin_edges or categories}
-            if not isinstance(bins, dict) or col not in bins:
-                raise ValueError(f"Bins for column '{col}' must be provided as a list in a dictionary for method='domain'")
+            ## ADD CHUNK HERE - FOR SPECIFIC BINNING FOR ALL COLUMNS
+            if method == 'domain':
+                # Expecting dict of bins: {col_name: bin_edges or categories}
+                if not isinstance(bins, dict) or col not in bins:
+                    raise ValueError(f"Bins for column '{col}' must be provided as a list in a dictionary for method='domain'")
 
-            domain_bins = bins[col]
-            drift_output = calculate_feature_drift(reference, actual, bins=domain_bins, method=method)
+                feature_bins = bins[col]
+            else:
+                feature_bins = bins
+
+            features.append(col)
+            yield reference, actual, {
+                "feature": col, "bins": feature_bins, "method": method, "missing": missing,
+                "max_fit_rows": max_fit_rows, "kind": (kinds or {}).get(col), "metrics": metrics,
+                "bootstrap": bootstrap
+            }
+
+    drift_outputs = map_feature_tasks(
+        _feature_drift_task, feature_tasks(), n_jobs=n_jobs, executor=executor, chunk_size=chunk_size
+    )
+
+    csi_results = []
+    feature_results = {}
+
+    drift_outputs = dict(zip(features, drift_outputs))
+    for col in reference_df.columns:
+        if col in batched_results:
+            bin_edges, reference_counts, new_counts, drift_score = batched_results[col]
+            baseline = FeatureBaseline(method, False, bin_edges, reference_counts, missing=missing == 'bin')
+            # Scored for the whole block at once
+            drift_output = _drift_output(baseline.strategy, *baseline._align(bin_edges, new_counts), get_metrics(metrics),
+                                         baseline.positions, drift_score=drift_score, bootstrap=bootstrap)
+        elif col in drift_outputs:
+            drift_output = drift_outputs[col]
         else:
-            drift_output = calculate_feature_drift(reference, actual, bins=bins, method=method)
-        
-        csi_results.append({"Feature": col, "Binning Strategy": drift_output["Binning Strategy"], "Drift": drift_output['Drift Score']})
+            continue
+
+        csi_results.append({
+            "Feature": col, "Binning Strategy": drift_output["Binning Strategy"], "Drift": drift_output['Drift Score'],
+            **drift_output.get("Drift Metrics", {})
+        })
         
-        detailed_csi_dfs[col] = drift_output['Drift DataFrame']
+        if detail:
+            feature_results[col] = drift_output
         #except Exception as e:
         #    print(f"Skipping column {col} due to error: {e}")
-    csi_results = pd.DataFrame(csi_results).sort_values(by="Drift", ascending=False).reset_index()
+    with stage("summary", rows=len(csi_results)):
+        csi_results = pd.DataFrame(csi_results).sort_values(by="Drift", ascending=False).reset_index()
     #detailed_csi_dfs = pd.DataFrame(detailed_csi_dfs)   
-    return csi_results, detailed_csi_dfs
+    return csi_results, DriftDetails(feature_results) if detail else {}
@@ -1,19 +1,22 @@
 import numpy as np
-import pandas as pd
-#from sklearn.tree import DecisionTreeClassifier
-#from sklearn.cluster import KMeans
 from typing import Union, List, Optional
 
-from .get_bin_edges import get_bin_edges
+from .feature_baseline import FeatureBaseline
+from .drift_result import FeatureDrift
 
 def calculate_feature_drift(
     reference: Union[List[float], np.ndarray], 
     new: Union[List[float], np.ndarray], 
     bins: Union[int, List[float]] = 10, 
     method: str ="equal_freq",
-    n_categories: int = 20
-
-)-> dict:
+    n_categories: int = 20,
+    missing: str = "drop",
+    max_fit_rows: Optional[int] = None,
+    kind: Optional[str] = None,
+    metrics: Optional[List[str]] = None,
+    bootstrap: Optional[int] = None
+
+)-> FeatureDrift:
     """
     Calculate Characteristic/Population Stability Index (CSI/PSI) or Drift Score for a given variable.
     
@@ -28,78 +31,31 @@ def calculate_feature_drift(
     
     - n_categories (int): Number of distinct values in a variable to treat as categorical variable
 
-    Returns:
-    - dict: Feature Drift dataframe containing the actual count, reference count, actual percentage, reference percentage, drift score for each bin and final drift score is aggregate sum of bin-wise drift score.
-    """
-    reference = np.array(reference)
-    new = np.array(new)
-
-    # Determine if variable is categorical or numerical
-    is_categorical = reference.dtype == 'object' or len(np.unique(reference)) < n_categories
-    #is_categorical = reference.dtype == 'object'
-
-
-    if is_categorical and method != 'domain':
-        # Categorical variable binning
-        unique_bins = np.unique(np.concatenate([reference, new]))
-        reference_counts = np.array([np.sum(reference == cat) for cat in unique_bins])
-        new_counts = np.array([np.sum(new == cat) for cat in unique_bins])
-        min_bins, max_bins = unique_bins, unique_bins  # Same for categorical values
-
-    elif is_categorical and method == 'domain':
-        # Categorical variable binning
-        unique_bins = np.unique(bins)
-        reference_counts = np.array([np.sum(reference == cat) for cat in unique_bins])
-        new_counts = np.array([np.sum(new == cat) for cat in unique_bins])
-        min_bins, max_bins = unique_bins, unique_bins  # Same for categorical values    
-        
-    else:
-        # Numerical variable binning
-        bin_edges = get_bin_edges(reference, bins, method)
-        bin_edges = np.unique(bin_edges)
-
-        # Ensure full coverage by setting first bin to -inf and last to +inf
-        if method != 'domain':
-            bin_edges[0] = -np.inf
-            bin_edges[-1] = np.inf
+    - missing (str): 'drop' (default) ignores missing values; 'bin' adds a "Missing" bin so that a change
+      in the share of missing values counts as drift.
 
-        reference_counts, _ = np.histogram(reference, bins=bin_edges)
-        new_counts, _ = np.histogram(new, bins=bin_edges)
-        min_bins = bin_edges[:-1]
-        max_bins = bin_edges[1:]
+    - max_fit_rows (int, optional): Fit 'kmeans'/'adaptive' bins on a reproducible sample of at most this many
+      rows, aggregated to weighted distinct values (see `get_bin_edges`).
 
-    # Normalize counts to proportions
-    reference_perc = reference_counts / np.sum(reference_counts)
-    new_perc = new_counts / np.sum(new_counts)
+    - kind (str, optional): 'categorical' or 'numeric' to skip the automatic decision (object dtype or fewer
+      than `n_categories` distinct values).
 
-    # Avoid division by zero
-    epsilon = 1e-10
-    reference_perc = np.where(reference_perc == 0, epsilon, reference_perc)
-    new_perc = np.where(new_perc == 0, epsilon, new_perc)
+    - metrics (list, optional): Extra drift metrics computed from the same bin counts, e.g.
+      ["js", "hellinger", "ks", "wasserstein"] (see `driftsense.drift_metrics`).
 
-    # Compute CSI
-    csi_values = (new_perc - reference_perc) * np.log(new_perc / reference_perc)
+    - bootstrap (int, optional): Number of bootstrap resamples (e.g. 1000). The bin counts are resampled
+      from multinomial distributions, without touching the raw data, to add a 95% confidence interval
+      ("Drift CI Lower", "Drift CI Upper") and a p-value against "no drift" ("P-Value") to "Drift Metrics"
+      (see `driftsense.drift_bootstrap.bootstrap_drift`).
 
-    # Create CSI DataFrame
-    csi_df = {
-        "Min Bin": min_bins,
-        "Max Bin": max_bins,
-        "Reference Count": reference_counts,
-        "New Count": new_counts,
-        "Reference %": reference_perc,
-        "New %": new_perc,
-        "Drift Value": csi_values
-    }
-
-    total_csi = np.sum(csi_values)
-    
-    return(
-        {
-        "Binning Strategy": method if not is_categorical or method=='domain' else "domain",
-        "Drift DataFrame": pd.DataFrame(csi_df),
-        "Drift Score": total_csi
-        }
+    Returns:
+    - FeatureDrift: Read-only mapping holding the aligned bins and counts. "Binning Strategy" and "Drift Score" (the
+      sum of the bin-wise drift values) are read directly; "Drift DataFrame" (actual and reference count and
+      percentage and drift value per bin) is built on first access. With `metrics` or `bootstrap`, "Drift Metrics"
+      holds each requested metric and the confidence interval and p-value of the drift score.
+    """
+    baseline = FeatureBaseline.fit(
+        reference, bins=bins, method=method, n_categories=n_categories, missing=missing, max_fit_rows=max_fit_rows,
+        kind=kind
     )
-
-
-
+    return baseline.score(new, metrics=metrics, bootstrap=bootstrap)
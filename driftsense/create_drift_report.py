@@ -1,16 +1,25 @@
-from typing import Dict
+from typing import Dict, Optional
 import pandas as pd
 
+from .report_writer import write_report
+
 def create_drift_report(
     summary_df: pd.DataFrame,
     detailed_dfs: Dict[str, pd.DataFrame],
     file_path: str = "Drift_Report.html",
-    drift_threshold: float = 0.25
+    drift_threshold: float = 0.25,
+    detail: str = "all",
+    page_size: Optional[int] = None,
+    decision: str = "score",
+    alpha: float = 0.05
 ) -> None:
     
     """
     Save the summary and detailed Drift DataFrames into a single HTML file with Pass/Fail test.
 
+    The report is written incrementally from the summary columns and per-feature detail, so its
+    generation time grows linearly with the number of features.
+
     Parameters:
     - summary_df (DataFrame): Summary Drift values per feature.
     
@@ -20,51 +29,25 @@ def create_drift_report(
     
     - drift_threshold (float): Drift threshold for test pass/fail.
 
+    - detail (str): Detail tables to include: 'all' (default), 'failing' (features failing the test only) or 'none'.
+
+    - page_size (int, optional): Split the detail tables over pages of this many features. `file_path` then
+      holds the summary with links to each feature's page, and the pages are written next to it
+      (`<name>_page_1.html`, ...). By default everything is written to a single file.
+
+    - decision (str): How the pass/fail test is decided. 'score' (default) fails features whose Drift exceeds
+      `drift_threshold`. With a summary computed with `bootstrap=...`, 'ci' fails only features whose whole
+      confidence interval is above the threshold, and 'p_value' only features above the threshold with a
+      p-value below `alpha`, so small windows are not failed on noise alone.
+
+    - alpha (float): Significance level for decision='p_value'.
+
     Returns:
     - None (writes an HTML file to disk)
     
     """
     
-    # Add Pass/Fail column
-    summary_df = summary_df.copy()
-    summary_df["Test Result"] = summary_df["Drift"].apply(lambda x: "Pass" if x <= drift_threshold else "Fail")
-
-    with open(file_path, "w") as f:
-        f.write("<html><head><title>Drift Report</title>")
-        f.write("""
-        <style>
-            body { font-family: Arial, sans-serif; padding: 20px; }
-            h2 { color: #2a6592; }
-            table { border-collapse: collapse; width: 100%; margin-bottom: 40px; }
-            th, td { border: 1px solid #ccc; padding: 8px; text-align: center; }
-            th { background-color: #f2f2f2; }
-            tr:nth-child(even) { background-color: #f9f9f9; }
-            .pass { background-color: #d4edda; color: #155724; font-weight: bold; }
-            .fail { background-color: #f8d7da; color: #721c24; font-weight: bold; }
-        </style>
-        """)
-        f.write("</head><body>")
-
-        # Summary Table with conditional formatting
-        f.write("<h2>Drift Summary</h2>")
-        f.write("<table>")
-        f.write("<tr><th>Feature</th><th>Drift</th><th>Test Result</th></tr>")
-        for _, row in summary_df.iterrows():
-            css_class = "pass" if row["Test Result"] == "Pass" else "fail"
-            f.write(
-                f"<tr>"
-                f"<td>{row['Feature']}</td>"
-                f"<td>{row['Drift']:.4f}</td>"
-                f"<td class='{css_class}'>{row['Test Result']}</td>"
-                f"</tr>"
-            )
-        f.write("</table>")
-
-        # Detailed Drift per feature
-        for feature, df in detailed_dfs.items():
-            f.write(f"<h2>Drift Detail for Feature: {feature}</h2>")
-            f.write(df.to_html(index=False, float_format="%.4f", border=0))
-
-        f.write("</body></html>")
+    write_report(summary_df, detailed_dfs, file_path, drift_threshold, score_column="Drift", title="Drift",
+                 detail=detail, page_size=page_size, decision=decision, alpha=alpha)
 
     print(f"Drift report with results saved to: {file_path}")
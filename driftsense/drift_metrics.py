@@ -0,0 +1,173 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+import numpy as np
+
+# Floor for empty bins in the log-based metrics, as in the Drift (CSI/PSI) calculation
+EPSILON = 1e-10
+
+
+class DriftMetric(NamedTuple):
+    """
+    A registered drift metric.
+
+    - column (str): Column name of the metric in drift summaries.
+
+    - func (callable): ``func(reference_perc, new_perc, positions)`` returning the metric along the
+      last axis of the bin proportions.
+
+    - ordered (bool): Whether the metric needs ordered numeric bins (`positions`); it is NaN for
+      categorical features.
+    """
+    column: str
+    func: Callable[[np.ndarray, np.ndarray, Optional[np.ndarray]], Union[float, np.ndarray]]
+    ordered: bool
+
+
+DRIFT_METRICS: Dict[str, DriftMetric] = {}
+
+
+def register_metric(name: str, column: Optional[str] = None, ordered: bool = False) -> Callable:
+    """
+    Register a drift metric computed from binned proportions.
+
+    All registered metrics are computed from the same bin counts, so adding metrics never adds a
+    pass over the data. Metrics receive the reference and new bin proportions (normalized along the
+    last axis, so 2-D group x bin matrices work too) and, for ordered metrics, the representative
+    position of each numeric bin (see `bin_positions`).
+
+    Parameters:
+    - name (str): Name used to request the metric (case-insensitive).
+
+    - column (str, optional): Column name in drift summaries. Defaults to `name`.
+
+    - ordered (bool): Whether the metric needs ordered numeric bins.
+
+    Example:
+    ```python
+    @register_metric("tv", column="Total Variation")
+    def total_variation(reference_perc, new_perc, positions):
+        return 0.5 * np.abs(new_perc - reference_perc).sum(axis=-1)
+    ```
+    """
+    def decorator(func):
+        DRIFT_METRICS[name.lower()] = DriftMetric(column or name, func, ordered)
+        return func
+    return decorator
+
+
+def get_metrics(metrics: Optional[List[str]]) -> List[DriftMetric]:
+    """
+    Look up registered metrics by name; raises ValueError for unknown names.
+    """
+    if not metrics:
+        return []
+    if isinstance(metrics, str):
+        metrics = [metrics]
+
+    unknown = [name for name in metrics if name.lower() not in DRIFT_METRICS]
+    if unknown:
+        raise ValueError(f"Unknown drift metric(s): {unknown}. Choose from {sorted(DRIFT_METRICS)}.")
+    return [DRIFT_METRICS[name.lower()] for name in metrics]
+
+
+def bin_positions(bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Representative value of each numeric bin: the midpoint, or the finite edge of an open-ended bin.
+    """
+    lower, upper = bin_edges[:-1], bin_edges[1:]
+    positions = np.where(np.isinf(lower), upper, np.where(np.isinf(upper), lower, (lower + upper) / 2))
+    # A single (-inf, inf) bin has no finite edge
+    return np.where(np.isfinite(positions), positions, 0.0)
+
+
+def _proportions(counts: np.ndarray) -> np.ndarray:
+    return counts / np.sum(counts, axis=-1, keepdims=True)
+
+
+def compute_metrics(
+    metrics: List[DriftMetric],
+    reference_counts: np.ndarray,
+    new_counts: np.ndarray,
+    positions: Optional[np.ndarray] = None
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Evaluate metrics on aligned reference and new bin counts.
+
+    Proportions are computed once and shared by all metrics. Ordered metrics use the first
+    ``len(positions)`` bins only (a trailing "Missing" bin is left out and the observed bins are
+    renormalized); without `positions` (categorical features) they are NaN.
+
+    Parameters:
+    - metrics (list): Metrics from `get_metrics`.
+
+    - reference_counts (np.ndarray): Reference count per bin.
+
+    - new_counts (np.ndarray): New count per bin, or a (groups x bins) matrix.
+
+    - positions (np.ndarray, optional): Representative value of each ordered numeric bin.
+
+    Returns:
+    - dict: Metric value (or array of values per group) by summary column name.
+    """
+    results = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        reference_perc, new_perc = _proportions(reference_counts), _proportions(new_counts)
+        if positions is not None:
+            n_ordered = len(positions)
+            ordered_perc = (_proportions(reference_counts[..., :n_ordered]), _proportions(new_counts[..., :n_ordered]))
+
+        for metric in metrics:
+            if not metric.ordered:
+                results[metric.column] = metric.func(reference_perc, new_perc, None)
+            elif positions is None:
+                results[metric.column] = np.full(np.shape(new_counts)[:-1], np.nan)[()]
+            else:
+                results[metric.column] = metric.func(*ordered_perc, positions)
+    return results
+
+
+def _floor(perc: np.ndarray) -> np.ndarray:
+    return np.where(perc == 0, EPSILON, perc)
+
+
+@register_metric("psi", column="PSI")
+def population_stability_index(reference_perc, new_perc, positions):
+    """Population/Characteristic Stability Index (same value as the Drift Score)."""
+    reference_perc, new_perc = _floor(reference_perc), _floor(new_perc)
+    return np.sum((new_perc - reference_perc) * np.log(new_perc / reference_perc), axis=-1)
+
+
+@register_metric("kl", column="KL")
+def kullback_leibler(reference_perc, new_perc, positions):
+    """Kullback-Leibler divergence of the new distribution from the reference (natural log)."""
+    reference_perc, new_perc = _floor(reference_perc), _floor(new_perc)
+    return np.sum(new_perc * np.log(new_perc / reference_perc), axis=-1)
+
+
+@register_metric("js", column="JS")
+def jensen_shannon(reference_perc, new_perc, positions):
+    """Jensen-Shannon divergence (base 2, between 0 and 1)."""
+    mixture = (reference_perc + new_perc) / 2
+
+    def relative_entropy(perc):
+        return np.sum(np.where(perc > 0, perc * np.log2(perc / np.where(mixture > 0, mixture, 1)), 0), axis=-1)
+
+    return (relative_entropy(reference_perc) + relative_entropy(new_perc)) / 2
+
+
+@register_metric("hellinger", column="Hellinger")
+def hellinger(reference_perc, new_perc, positions):
+    """Hellinger distance (between 0 and 1)."""
+    return np.sqrt(np.sum((np.sqrt(reference_perc) - np.sqrt(new_perc)) ** 2, axis=-1) / 2)
+
+
+@register_metric("ks", column="KS", ordered=True)
+def kolmogorov_smirnov(reference_perc, new_perc, positions):
+    """Kolmogorov-Smirnov statistic evaluated at the bin edges (largest gap between the two CDFs)."""
+    return np.max(np.abs(np.cumsum(reference_perc, axis=-1) - np.cumsum(new_perc, axis=-1)), axis=-1)
+
+
+@register_metric("wasserstein", column="Wasserstein", ordered=True)
+def wasserstein(reference_perc, new_perc, positions):
+    """Wasserstein-1 (earth mover's) distance with each bin's mass placed at its position."""
+    cdf_gap = np.abs(np.cumsum(reference_perc, axis=-1) - np.cumsum(new_perc, axis=-1))[..., :-1]
+    return np.sum(cdf_gap * np.diff(positions), axis=-1)
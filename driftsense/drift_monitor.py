@@ -0,0 +1,139 @@
+from collections import deque
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .drift_profile import DriftProfile
+
+Counts = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+class DriftMonitor:
+    """
+    Stateful sliding-window drift monitor on top of a fitted `DriftProfile`.
+
+    The monitor keeps per-bin counts of the current window instead of the raw rows. Each batch is
+    histogrammed once when it arrives (`update`); removing data from the window (`expire`, or the
+    oldest bucket falling out on `advance`) subtracts its counts. Current drift scores are then
+    computed from the counts alone, at a cost proportional to the number of bins.
+
+    Parameters:
+    - profile (DriftProfile): Fitted reference profile (fixed reference bins).
+
+    - window (int, optional): Number of time buckets kept in the window. When set, `advance` closes the
+      current bucket and drops the oldest one once more than `window` buckets exist. When None, data
+      only leaves the window through `expire`. The two modes cannot be combined.
+
+    Example:
+    ```python
+    monitor = DriftMonitor(profile, window=24)   # e.g. hourly buckets over one day
+    monitor.update(batch)
+    monitor.drift_scores()
+    monitor.advance()                            # start the next hour
+    ```
+    """
+
+    def __init__(self, profile: DriftProfile, window: Optional[int] = None):
+        if window is not None and window < 1:
+            raise ValueError("'window' must be a positive integer.")
+        self.profile = profile
+        self.window = window
+        self._total: Counts = {}
+        self._buckets = deque([{}])
+
+    def __repr__(self) -> str:
+        return f"DriftMonitor(window={self.window}, buckets={len(self._buckets)}, features={len(self._total)})"
+
+    def _add(self, target: Counts, counts: Counts, sign: int = 1) -> None:
+        # Merge every feature first, so a failing expire leaves the window unchanged
+        added, merged = {}, {}
+        for col, (labels, values) in counts.items():
+            if col not in target:
+                added[col] = (labels, sign * values)
+                continue
+
+            merged[col] = self.profile.features[col].merge_counts(target[col], (labels, sign * values))
+            if np.any(merged[col][1] < 0):
+                raise ValueError(f"Cannot expire more data than was added for feature '{col}'.")
+
+        target.update(added)
+        for col, (labels, values) in merged.items():
+            if values.sum() == 0:
+                del target[col]
+            else:
+                target[col] = (labels, values)
+
+    def update(self, batch: pd.DataFrame) -> "DriftMonitor":
+        """
+        Add a batch of new data to the current bucket of the window.
+
+        Parameters:
+        - batch (DataFrame): Newly arrived rows.
+
+        Returns:
+        - DriftMonitor: The monitor (self).
+        """
+        counts = self.profile.count(batch)
+        self._add(self._total, counts)
+        if self.window is not None:
+            self._add(self._buckets[-1], counts)
+        return self
+
+    def expire(self, batch: pd.DataFrame) -> "DriftMonitor":
+        """
+        Remove a batch that was previously added with `update` from the window.
+
+        Parameters:
+        - batch (DataFrame): Rows leaving the window.
+
+        Returns:
+        - DriftMonitor: The monitor (self).
+        """
+        if self.window is not None:
+            raise ValueError("'expire' is not available when the monitor uses time buckets ('window').")
+
+        counts = self.profile.count(batch)
+        missing = [col for col in counts if col not in self._total]
+        if missing:
+            raise ValueError(f"Cannot expire more data than was added for feature '{missing[0]}'.")
+        self._add(self._total, counts, sign=-1)
+        return self
+
+    def advance(self) -> "DriftMonitor":
+        """
+        Close the current time bucket and start a new one, dropping the oldest bucket beyond `window`.
+
+        Returns:
+        - DriftMonitor: The monitor (self).
+        """
+        if self.window is None:
+            return self  # Without time buckets the window only changes through update/expire
+
+        self._buckets.append({})
+        while len(self._buckets) > self.window:
+            self._add(self._total, self._buckets.popleft(), sign=-1)
+        return self
+
+    def drift_scores(self) -> pd.Series:
+        """
+        Current Drift Score per feature for the data in the window (no detail DataFrames).
+
+        Returns:
+        - Series: Drift Score indexed by feature; features without data in the window are omitted.
+        """
+        return pd.Series(
+            {col: self.profile.features[col].drift_score(*self._total[col]) for col in self.profile.features if col in self._total},
+            name="Drift", dtype=float
+        )
+
+    def score(self, detail: bool = True) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Full drift summary and detail for the data in the window, as `DriftProfile.score`.
+
+        Parameters:
+        - detail (bool): Whether to return the detailed Drift DataFrames (an empty dictionary when False).
+
+        Returns:
+        - Tuple containing the summary DataFrame and the dictionary of detailed DataFrames.
+        """
+        return self.profile.score_counts(self._total, detail=detail)
@@ -0,0 +1,364 @@
+from typing import Union, Dict, Tuple, Optional, List, Mapping, Iterable
+import numpy as np
+import pandas as pd
+
+from .arrow_input import _as_frame, _is_frame
+from .feature_baseline import FeatureBaseline, _column_values
+from .drift_result import DriftDetails
+from .profiling import feature_scope, stage
+from .profile_io import LazyFeatures, save_profile_arrays, load_profile_arrays
+
+
+class DriftProfile:
+    """
+    Reference profile fitted once on a baseline DataFrame and reused to score new batches.
+
+    Fitting bins every feature of `reference_df` exactly as `calculate_all_features_drift`
+    does (categorical/numeric decision, bin edges or categories, reference counts) and keeps
+    only that summary. Scoring a new batch then histograms the new data alone.
+
+    Parameters:
+    - bins (int or dict): Number of bins (for numerical) or, for method='domain', a dictionary
+      of bin edges/categories per column.
+
+    - method (str): Binning method ('equal_width', 'equal_freq', 'adaptive', 'kmeans', 'domain').
+
+    - n_categories (int): Number of distinct values in a variable to treat as categorical variable
+
+    - missing (str): 'drop' (default) ignores missing values; 'bin' counts them in an extra "Missing" bin.
+
+    - max_fit_rows (int, optional): Fit 'kmeans'/'adaptive' bins on a reproducible sample of at most this many
+      rows, aggregated to weighted distinct values (see `get_bin_edges`).
+
+    - kinds (dict, optional): Feature kind per column ('categorical' or 'numeric'), overriding the automatic
+      decision for those columns. The decision is made once at `fit` and kept in each `FeatureBaseline`.
+
+    - metrics (list, optional): Extra drift metrics added as summary columns by `score`, computed from the
+      same bin counts (e.g. ["js", "hellinger", "ks", "wasserstein"], see `driftsense.drift_metrics`).
+
+    - bootstrap (int, optional): Number of bootstrap resamples of the bin counts; `score` then adds the
+      "Drift CI Lower", "Drift CI Upper" and "P-Value" summary columns (see `calculate_feature_drift`).
+
+    Example:
+    ```python
+    profile = DriftProfile(bins=10, method="equal_freq").fit(reference_df)
+    summary_df, detailed_dfs = profile.score(new_df)
+    ```
+    """
+
+    def __init__(
+        self,
+        bins: Union[int, Dict[str, list]] = 10,
+        method: str = 'equal_freq',
+        n_categories: int = 20,
+        missing: str = 'drop',
+        max_fit_rows: Optional[int] = None,
+        kinds: Optional[Dict[str, str]] = None,
+        metrics: Optional[List[str]] = None,
+        bootstrap: Optional[int] = None
+    ):
+        self.bins = bins
+        self.method = method
+        self.n_categories = n_categories
+        self.missing = missing
+        self.max_fit_rows = max_fit_rows
+        self.kinds = kinds
+        self.metrics = metrics
+        self.bootstrap = bootstrap
+        self.features: Mapping[str, FeatureBaseline] = {}
+
+    def __repr__(self) -> str:
+        return f"DriftProfile(method={self.method!r}, n_features={len(self.features)})"
+
+    def __enter__(self) -> "DriftProfile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the file opened by `DriftProfile.load` (a no-op for fitted profiles). The archive is
+        also closed automatically once every feature has been read.
+        """
+        if isinstance(self.features, LazyFeatures):
+            self.features.close()
+
+    def fit(
+        self,
+        reference_df: pd.DataFrame,
+        columns: Optional[List[str]] = None,
+        target: Optional[Union[str, List[int], np.ndarray]] = None
+    ) -> "DriftProfile":
+        """
+        Fit the per-feature reference bins.
+
+        Parameters:
+        - reference_df (DataFrame): Baseline dataset (or a pyarrow Table/RecordBatch or Polars DataFrame).
+
+        - columns (list, optional): Subset of columns to fit. Defaults to all columns.
+
+        - target (str or array-like, optional): Target column name or values aligned with the rows of
+          `reference_df`, required for method='adaptive'. A target column is not itself profiled.
+
+        Returns:
+        - DriftProfile: The fitted profile (self).
+        """
+        reference_df = _as_frame(reference_df)
+        if not _is_frame(reference_df):
+            raise ValueError("Input 'reference_df' should be a pandas DataFrame or an Arrow table.")
+
+        if columns is None:
+            columns = [col for col in reference_df.columns if not (isinstance(target, str) and col == target)]
+        if isinstance(target, str):
+            target = _column_values(reference_df[target], drop_missing=False)
+        if target is not None:
+            target = np.asarray(target)
+
+        features = {}
+        for col in columns:
+            column = reference_df[col]
+
+            # Skip if column is empty in the reference dataset
+            if column.count() == 0:
+                continue
+
+            if self.method == 'domain':
+                # Expecting dict of bins: {col_name: bin_edges or categories}
+                if not isinstance(self.bins, dict) or col not in self.bins:
+                    raise ValueError(f"Bins for column '{col}' must be provided as a list in a dictionary for method='domain'")
+                feature_bins = self.bins[col]
+            else:
+                feature_bins = self.bins
+
+            # Missing values (and the matching target rows) are masked once by the baseline
+            reference = _column_values(column, drop_missing=False)
+
+            with feature_scope(col):
+                features[col] = FeatureBaseline.fit(
+                    reference, bins=feature_bins, method=self.method, n_categories=self.n_categories,
+                    target=target, missing=self.missing, max_fit_rows=self.max_fit_rows,
+                    kind=(self.kinds or {}).get(col)
+                )
+
+        self.features = features
+        return self
+
+    def score(self, new_df: pd.DataFrame, detail: bool = True) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Compute drift/stability of a new batch against the fitted reference profile.
+
+        Parameters:
+        - new_df (DataFrame): New dataset. Monitoring/Test/Validation (or an Arrow table, as in `fit`).
+
+        - detail (bool): Whether to return the detailed Drift DataFrames (an empty dictionary when False).
+
+        Returns:
+
+        - Tuple containing (same layout as `calculate_all_features_drift`):
+
+            1. DataFrame with Drift (CSI/PSI) values for all features.
+
+            2. Dictionary of Drift (CSI/PSI) dataFrames for all features.
+        """
+        new_df = _as_frame(new_df)
+        if not _is_frame(new_df):
+            raise ValueError("Input 'new_df' should be a pandas DataFrame or an Arrow table.")
+
+        return self.score_chunks([new_df], detail=detail)
+
+    def score_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        detail: bool = True
+    ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Compute drift/stability of new data supplied as a stream of DataFrame chunks.
+
+        Per-bin counts are accumulated chunk by chunk, so memory is bounded by the chunk size
+        and the result is identical to scoring the concatenated chunks with `score`.
+
+        Parameters:
+        - chunks (iterable): DataFrame chunks of the new dataset, e.g. from `read_chunks`.
+
+        - detail (bool): Whether to return the detailed Drift DataFrames.
+
+        Returns:
+        - Tuple containing the summary DataFrame and the dictionary of detailed DataFrames, as `score`.
+        """
+        counts = {}
+        for chunk in chunks:
+            for col, chunk_counts in self.count(chunk).items():
+                baseline = self.features[col]
+                counts[col] = chunk_counts if col not in counts else baseline.merge_counts(counts[col], chunk_counts)
+
+        return self.score_counts(counts, detail=detail)
+
+    def count(self, new_df: pd.DataFrame) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Histogram a batch of new data on the fitted bins of every feature.
+
+        Parameters:
+        - new_df (DataFrame): Batch of new data.
+
+        Returns:
+        - dict: `FeatureBaseline.count` result per feature; features missing or empty in the batch are omitted.
+        """
+        new_df = _as_frame(new_df)
+        if not _is_frame(new_df):
+            raise ValueError("Each chunk of new data should be a pandas DataFrame or an Arrow table.")
+
+        counts = {}
+        for col, baseline in self.features.items():
+            if col not in new_df.columns:
+                continue  # Skip columns missing in new dataset
+
+            actual = _column_values(new_df[col], drop_missing=self.missing != 'bin')
+            if len(actual) == 0:
+                continue
+
+            with feature_scope(col):
+                counts[col] = baseline.count(actual)
+        return counts
+
+    def score_counts(
+        self,
+        counts: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        detail: bool = True
+    ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Build the drift summary and detail from per-feature new-data counts (see `count`).
+
+        Parameters:
+        - counts (dict): Per-feature (labels, counts), e.g. accumulated over several batches.
+
+        - detail (bool): Whether to return the detailed Drift DataFrames.
+
+        Returns:
+        - Tuple containing the summary DataFrame and the dictionary of detailed DataFrames, as `score`.
+        """
+        csi_results = []
+        feature_results = {}
+
+        # Features without any new data are skipped
+        for col, baseline in self.features.items():
+            if col not in counts:
+                continue
+
+            with feature_scope(col):
+                drift_output = baseline.score_counts(*counts[col], metrics=self.metrics, bootstrap=self.bootstrap)
+            csi_results.append({
+                "Feature": col, "Binning Strategy": drift_output["Binning Strategy"], "Drift": drift_output['Drift Score'],
+                **drift_output.get("Drift Metrics", {})
+            })
+            if detail:
+                feature_results[col] = drift_output
+
+        with stage("summary", rows=len(csi_results)):
+            csi_results = pd.DataFrame(csi_results).sort_values(by="Drift", ascending=False).reset_index()
+        return csi_results, DriftDetails(feature_results) if detail else {}
+
+    def score_windows(
+        self,
+        new_data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+        by: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Drift of many new windows (e.g. days of a month) against the fitted reference in one call.
+
+        Each feature is binned once for all windows and counted with a single 2-D bincount over
+        (window, bin), so the cost is one pass over the new data regardless of the number of windows.
+        Scores equal those of scoring each window separately with `score`.
+
+        Parameters:
+        - new_data (DataFrame or dict): New dataset with a window column named by `by`, or a dictionary
+          of {window name: DataFrame}.
+
+        - by (str, optional): Column of `new_data` identifying the window of each row (required for a DataFrame).
+
+        Returns:
+        - DataFrame: Drift Score matrix with one row per feature and one column per window (NaN where a
+          window has no data for a feature).
+        """
+        if isinstance(new_data, dict):
+            windows = list(new_data)
+            frames = list(new_data.values())
+            if not all(isinstance(frame, pd.DataFrame) for frame in frames):
+                raise ValueError("Each window of new data should be a pandas DataFrame.")
+
+            def window_columns(col):
+                present = [(i, frame[col]) for i, frame in enumerate(frames) if col in frame.columns]
+                if not present:
+                    return None
+                values = pd.concat([series for _, series in present], ignore_index=True)
+                codes = np.concatenate([np.full(len(series), i) for i, series in present])
+                return values, codes
+
+        elif isinstance(new_data, pd.DataFrame):
+            if by is None or by not in new_data.columns:
+                raise ValueError("A window column 'by' of the new DataFrame is required.")
+            window_codes, windows = pd.factorize(new_data[by], sort=True)
+            windows = list(windows)
+
+            def window_columns(col):
+                if col == by or col not in new_data.columns:
+                    return None
+                return new_data[col], window_codes
+
+        else:
+            raise ValueError("Input 'new_data' should be a pandas DataFrame or a dictionary of DataFrames.")
+
+        scores = {}
+        for col, baseline in self.features.items():
+            columns = window_columns(col)
+            if columns is None:
+                continue  # Skip columns missing in new dataset
+
+            values, codes = columns
+            if self.missing == 'bin':
+                labels, counts = baseline.count_by(values.to_numpy(), codes, len(windows))
+            else:
+                valid = values.notna().to_numpy()
+                labels, counts = baseline.count_by(values[valid].to_numpy(), codes[valid], len(windows))
+            scores[col] = baseline.drift_scores_by(labels, counts)
+
+        drift_matrix = pd.DataFrame.from_dict(scores, orient="index", columns=windows)
+        drift_matrix.index.name = "Feature"
+        return drift_matrix
+
+    def save(self, file_path: str) -> None:
+        """
+        Save the fitted profile to a compact `.npz` file (no reference data, no pickling).
+
+        Parameters:
+        - file_path (str): Destination path, conventionally ending in `.npz`.
+        """
+        settings = {"bins": self.bins, "method": self.method, "n_categories": self.n_categories, "missing": self.missing,
+                    "max_fit_rows": self.max_fit_rows, "kinds": self.kinds,
+                    "metrics": self.metrics, "bootstrap": self.bootstrap}
+        save_profile_arrays(file_path, settings, self.features)
+
+    @classmethod
+    def load(cls, file_path: str) -> "DriftProfile":
+        """
+        Load a profile written by `DriftProfile.save`.
+
+        Per-feature bins and counts are read lazily on first use, so loading is independent
+        of the number of features. The file stays open until every feature has been read; call
+        `close` (or use the profile in a `with` block) to release it earlier.
+
+        Parameters:
+        - file_path (str): Path of the saved profile.
+
+        Returns:
+        - DriftProfile: Fitted profile ready for `score`.
+        """
+        settings, features = load_profile_arrays(file_path)
+        profile = cls(
+            bins=settings["bins"], method=settings["method"], n_categories=settings["n_categories"],
+            missing=settings.get("missing", "drop"), max_fit_rows=settings.get("max_fit_rows"),
+            kinds=settings.get("kinds"), metrics=settings.get("metrics"),
+            bootstrap=settings.get("bootstrap")
+        )
+        profile.features = features
+        return profile
@@ -0,0 +1,197 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .drift_bootstrap import bootstrap_drift
+from .drift_metrics import DriftMetric, compute_metrics
+from .profiling import stage
+
+# Keys of a feature drift result, in the order of the original result dictionary
+RESULT_KEYS = ("Binning Strategy", "Drift DataFrame", "Drift Score")
+
+
+def _drift_values(
+    reference_counts: np.ndarray,
+    new_counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bin proportions and bin-wise CSI/PSI values from reference and new bin counts.
+
+    Counts are normalized along the last axis, so `new_counts` may also be a 2-D
+    (groups x bins) matrix scored against the same reference counts.
+    """
+    # Normalize counts to proportions
+    reference_perc = reference_counts / np.sum(reference_counts, axis=-1, keepdims=True)
+    new_perc = new_counts / np.sum(new_counts, axis=-1, keepdims=True)
+
+    # Avoid division by zero
+    epsilon = 1e-10
+    reference_perc = np.where(reference_perc == 0, epsilon, reference_perc)
+    new_perc = np.where(new_perc == 0, epsilon, new_perc)
+
+    # Compute CSI
+    csi_values = (new_perc - reference_perc) * np.log(new_perc / reference_perc)
+    return reference_perc, new_perc, csi_values
+
+
+class FeatureDrift(Mapping):
+    """
+    Drift result of a single feature, holding only the aligned bins and counts.
+
+    Reads like the result dictionary of `calculate_feature_drift` ("Binning Strategy", "Drift DataFrame",
+    "Drift Score" and, when metrics were requested, "Drift Metrics"), but the detailed "Drift DataFrame"
+    is only built when it is first accessed. Summaries over thousands of features therefore never
+    construct the per-feature DataFrames.
+
+    Attributes:
+    - strategy (str): Binning strategy.
+
+    - min_bins (np.ndarray): Lower edge (or category) of each bin.
+
+    - max_bins (np.ndarray): Upper edge (or category) of each bin.
+
+    - reference_counts (np.ndarray): Reference count per bin.
+
+    - new_counts (np.ndarray): New count per bin.
+
+    - drift_score (float): Drift (CSI/PSI) score, the sum of the bin-wise drift values.
+
+    - metrics (dict or None): Value of each requested extra metric (see `drift_metrics`) and, with
+      bootstrapping, the confidence interval and p-value of the drift score (see `bootstrap_drift`).
+    """
+
+    __slots__ = ("strategy", "min_bins", "max_bins", "reference_counts", "new_counts", "drift_score", "metrics", "_frame")
+
+    def __init__(
+        self,
+        strategy: str,
+        min_bins: np.ndarray,
+        max_bins: np.ndarray,
+        reference_counts: np.ndarray,
+        new_counts: np.ndarray,
+        drift_score: Optional[float] = None,
+        metrics: Optional[Dict[str, float]] = None
+    ):
+        self.strategy = strategy
+        self.min_bins = min_bins
+        self.max_bins = max_bins
+        self.reference_counts = reference_counts
+        self.new_counts = new_counts
+        if drift_score is None:
+            drift_score = np.sum(_drift_values(reference_counts, new_counts)[2])
+        self.drift_score = drift_score
+        self.metrics = metrics
+        self._frame = None
+
+    def __repr__(self) -> str:
+        return f"FeatureDrift(strategy={self.strategy!r}, n_bins={len(self.reference_counts)}, drift_score={self.drift_score:.4f})"
+
+    def detail_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Columns of the detailed Drift DataFrame as arrays (counts, percentages and drift value per bin).
+        """
+        reference_perc, new_perc, csi_values = _drift_values(self.reference_counts, self.new_counts)
+        return {
+            "Min Bin": self.min_bins,
+            "Max Bin": self.max_bins,
+            "Reference Count": self.reference_counts,
+            "New Count": self.new_counts,
+            "Reference %": reference_perc,
+            "New %": new_perc,
+            "Drift Value": csi_values
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build a new detailed Drift DataFrame (counts, percentages and drift value per bin).
+        """
+        return pd.DataFrame(self.detail_columns())
+
+    def _keys(self) -> Tuple[str, ...]:
+        return RESULT_KEYS if self.metrics is None else RESULT_KEYS + ("Drift Metrics",)
+
+    def __getitem__(self, key: str):
+        if key == "Binning Strategy":
+            return self.strategy
+        if key == "Drift DataFrame":
+            if self._frame is None:
+                with stage("detail_frame"):
+                    self._frame = self.to_frame()
+            return self._frame
+        if key == "Drift Score":
+            return self.drift_score
+        if key == "Drift Metrics" and self.metrics is not None:
+            return self.metrics
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+
+class DriftDetails(Mapping):
+    """
+    Read-only mapping of feature name to detailed Drift DataFrame.
+
+    Keeps the compact `FeatureDrift` result of every feature and builds a feature's DataFrame
+    only when it is looked up, so it can be used wherever the dictionary of detailed DataFrames was.
+    """
+
+    def __init__(self, results: Dict[str, FeatureDrift]):
+        self.results = results
+
+    def __repr__(self) -> str:
+        return f"DriftDetails(n_features={len(self.results)})"
+
+    def __getitem__(self, col) -> pd.DataFrame:
+        return self.results[col]["Drift DataFrame"]
+
+    def __contains__(self, col) -> bool:
+        return col in self.results
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+def _drift_output(
+    strategy: str,
+    min_bins: np.ndarray,
+    max_bins: np.ndarray,
+    reference_counts: np.ndarray,
+    new_counts: np.ndarray,
+    metrics: Optional[List[DriftMetric]] = None,
+    positions: Optional[np.ndarray] = None,
+    drift_score: Optional[float] = None,
+    bootstrap: Optional[int] = None
+) -> FeatureDrift:
+    """
+    Build the `calculate_feature_drift` result from reference and new bin counts.
+
+    Requested extra metrics (and, with `bootstrap` resamples, the confidence interval and p-value of
+    the drift score) are computed from the same counts and returned under "Drift Metrics".
+    """
+    values = compute_metrics(metrics, reference_counts, new_counts, positions) if metrics else {}
+    if bootstrap:
+        with stage("bootstrap"):
+            values.update(bootstrap_drift(reference_counts, new_counts, n_resamples=bootstrap))
+    return FeatureDrift(
+        strategy, min_bins, max_bins, reference_counts, new_counts, drift_score=drift_score,
+        metrics=values if metrics or bootstrap else None
+    )
+
+
+def _detail_columns(detailed_dfs: Dict[str, pd.DataFrame], feature: str) -> Dict[str, np.ndarray]:
+    """Detail columns of a feature; compact results are read from their arrays without building the DataFrame."""
+    if isinstance(detailed_dfs, DriftDetails):
+        return detailed_dfs.results[feature].detail_columns()
+    df = detailed_dfs[feature]
+    return {col: df[col].to_numpy() for col in df.columns}
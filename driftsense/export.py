@@ -0,0 +1,253 @@
+import os
+import uuid
+from typing import Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .drift_result import _detail_columns
+
+# Export file formats and the file extension of each
+EXPORT_FORMATS = {"jsonl": ".jsonl", "parquet": ".parquet"}
+
+# Run metadata usable as (hive-style) partition keys
+PARTITION_KEYS = ("date", "window", "method")
+
+DETAIL_COLUMNS = ("Min Bin", "Max Bin", "Reference Count", "New Count", "Reference %", "New %", "Drift Value")
+
+# Columns kept as strings when JSON Lines are read back
+STRING_COLUMNS = ("Run ID", "Window", "Method", "Feature", "Min Bin", "Max Bin")
+
+
+def _utc_timestamp(timestamp: Optional[Union[str, pd.Timestamp]]) -> pd.Timestamp:
+    if timestamp is None:
+        return pd.Timestamp.now(tz="UTC")
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.tz_convert("UTC") if timestamp.tzinfo is not None else timestamp.tz_localize("UTC")
+
+
+def drift_records(
+    summary_df: pd.DataFrame,
+    detailed_dfs: Dict[str, pd.DataFrame],
+    drift_threshold: float = 0.25,
+    method: Optional[str] = None,
+    window: Optional[str] = None,
+    timestamp: Optional[Union[str, pd.Timestamp]] = None,
+    run_id: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Summary and per-bin detail of a drift run as one long-format table.
+
+    There is one row per feature and bin: run metadata, the feature's summary (Drift, Test Result and
+    any metric columns) and the bin detail. Features without detail (e.g. `detail=False` runs) get a
+    single row with empty bin columns. Bin labels are stored as strings so numeric edges and categories
+    share one column type.
+
+    Parameters:
+    - summary_df (DataFrame): Summary per feature, from `calculate_all_features_drift` or `DriftProfile.score`.
+
+    - detailed_dfs (dict): Detailed Drift DataFrames per feature (may be empty).
+
+    - drift_threshold (float): Drift threshold for test pass/fail.
+
+    - method (str, optional): Binning method of the run.
+
+    - window (str, optional): Label of the monitored window (e.g. "2024-06").
+
+    - timestamp (str or Timestamp, optional): Time of the run (UTC). Defaults to now.
+
+    - run_id (str, optional): Identifier of the run. Defaults to a random UUID.
+
+    Returns:
+    - DataFrame: Long-format records.
+    """
+    summary = summary_df.drop(columns="index", errors="ignore").reset_index(drop=True)
+    summary["Feature"] = summary["Feature"].astype(str)
+    summary["Test Result"] = np.where(summary["Drift"].to_numpy(dtype=float) <= drift_threshold, "Pass", "Fail")
+
+    features = [feature for feature in summary_df["Feature"] if feature in detailed_dfs]
+    details = [_detail_columns(detailed_dfs, feature) for feature in features]
+    n_bins = [len(columns["Min Bin"]) for columns in details]
+
+    detail = pd.DataFrame({
+        "Feature": np.repeat(np.asarray([str(feature) for feature in features], dtype=object), n_bins),
+        "Bin": np.concatenate([np.arange(n) for n in n_bins]) if details else np.array([], dtype=np.int64),
+    })
+    for col in DETAIL_COLUMNS:
+        values = [np.asarray(columns[col]) for columns in details]
+        if col in ("Min Bin", "Max Bin"):
+            values = [labels.astype(str) for labels in values]
+        detail[col] = np.concatenate(values) if values else np.array([])
+
+    records = summary.merge(detail, on="Feature", how="left")
+    metadata = {
+        "Run ID": run_id or uuid.uuid4().hex,
+        "Timestamp": _utc_timestamp(timestamp),
+        "Window": window,
+        "Method": method,
+        "Threshold": float(drift_threshold),
+    }
+    for i, (col, value) in enumerate(metadata.items()):
+        records.insert(i, col, value)
+    return records
+
+
+def _partition_dir(path: str, partition_values: Dict[str, object], partition_by: List[str]) -> str:
+    parts = []
+    for key in partition_by:
+        if key not in PARTITION_KEYS:
+            raise ValueError(f"Invalid partition key: '{key}'. Choose from {list(PARTITION_KEYS)}.")
+        value = partition_values[key]
+        parts.append(f"{key}={'' if value is None else str(value).replace(os.sep, '-')}")
+    return os.path.join(path, *parts)
+
+
+def _write_parquet(records: pd.DataFrame, file_path: str) -> None:
+    try:
+        records.to_parquet(file_path, index=False)
+    except ImportError as e:
+        raise ImportError("Writing Parquet files requires 'pyarrow' to be installed.") from e
+
+
+def export_drift_results(
+    summary_df: pd.DataFrame,
+    detailed_dfs: Dict[str, pd.DataFrame],
+    path: str,
+    format: Optional[str] = None,
+    drift_threshold: float = 0.25,
+    method: Optional[str] = None,
+    window: Optional[str] = None,
+    timestamp: Optional[Union[str, pd.Timestamp]] = None,
+    run_id: Optional[str] = None,
+    partition_by: Optional[List[str]] = None
+) -> str:
+    """
+    Export a drift run as machine-readable long-format records (see `drift_records`).
+
+    JSON Lines are appended, so one file can collect many runs. With `partition_by`, `path` is a dataset
+    directory laid out in hive-style partitions (e.g. `path/date=2024-06-30/window=2024-06/`): each run
+    appends to the JSON Lines file of its partition or adds one Parquet file to it, without rewriting
+    earlier runs. Query engines (pyarrow, DuckDB, Spark) and `read_drift_results` can then skip
+    partitions instead of loading every run.
+
+    Parameters:
+    - summary_df (DataFrame): Summary per feature, from `calculate_all_features_drift` or `DriftProfile.score`.
+
+    - detailed_dfs (dict): Detailed Drift DataFrames per feature.
+
+    - path (str): Output file, or dataset directory when `partition_by` is given.
+
+    - format (str, optional): 'jsonl' or 'parquet'. Inferred from the extension of `path` when omitted
+      ('jsonl' for partitioned datasets). Parquet requires 'pyarrow'.
+
+    - drift_threshold (float): Drift threshold for test pass/fail.
+
+    - method (str, optional): Binning method of the run.
+
+    - window (str, optional): Label of the monitored window.
+
+    - timestamp (str or Timestamp, optional): Time of the run (UTC). Defaults to now.
+
+    - run_id (str, optional): Identifier of the run. Defaults to a random UUID.
+
+    - partition_by (list, optional): Partition keys among 'date' (of the timestamp), 'window' and 'method'.
+
+    Returns:
+    - str: Path of the written file.
+    """
+    if format is None:
+        extension = os.path.splitext(os.fspath(path))[1]
+        format = next((name for name, ext in EXPORT_FORMATS.items() if ext == extension), None)
+        if format is None and not partition_by:
+            raise ValueError(f"Cannot infer the export format of '{path}'. Use format='jsonl' or 'parquet'.")
+        format = format or "jsonl"
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format: '{format}'. Choose from 'jsonl' or 'parquet'.")
+
+    timestamp, run_id = _utc_timestamp(timestamp), run_id or uuid.uuid4().hex
+    records = drift_records(summary_df, detailed_dfs, drift_threshold, method, window, timestamp, run_id)
+
+    file_path = os.fspath(path)
+    if partition_by:
+        partition_values = {"date": timestamp.strftime("%Y-%m-%d"), "window": window, "method": method}
+        directory = _partition_dir(file_path, partition_values, partition_by)
+        os.makedirs(directory, exist_ok=True)
+        # Parquet files cannot be appended to; each run adds its own file to the partition
+        name = f"run-{run_id}" if format == "parquet" else "drift"
+        file_path = os.path.join(directory, name + EXPORT_FORMATS[format])
+
+    if format == "parquet":
+        _write_parquet(records, file_path)
+    else:
+        with open(file_path, "a") as f:
+            records.to_json(f, orient="records", lines=True, date_format="iso", date_unit="us", double_precision=15)
+    return file_path
+
+
+def _partition_values(relative_path: str) -> Dict[str, str]:
+    return dict(part.split("=", 1) for part in relative_path.split(os.sep) if "=" in part)
+
+
+def _read_file(file_path: str) -> pd.DataFrame:
+    if file_path.endswith(EXPORT_FORMATS["parquet"]):
+        try:
+            return pd.read_parquet(file_path)
+        except ImportError as e:
+            raise ImportError("Reading Parquet files requires 'pyarrow' to be installed.") from e
+    records = pd.read_json(file_path, lines=True, dtype={col: str for col in STRING_COLUMNS}, convert_dates=["Timestamp"])
+    if "Timestamp" in records:
+        records["Timestamp"] = pd.to_datetime(records["Timestamp"], utc=True)
+    return records
+
+
+def read_drift_results(
+    path: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    window: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Read exported drift records back, optionally restricted to a date range or window.
+
+    For partitioned datasets, partitions outside the requested dates or window are skipped
+    without being read.
+
+    Parameters:
+    - path (str): File or dataset directory written by `export_drift_results`.
+
+    - start (str, optional): First run date to include (e.g. "2024-06-01").
+
+    - end (str, optional): Last run date to include.
+
+    - window (str, optional): Only runs of this window.
+
+    Returns:
+    - DataFrame: Records of the matching runs.
+    """
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        files = []
+        for directory, _, names in sorted(os.walk(path)):
+            partitions = _partition_values(os.path.relpath(directory, path))
+            date = partitions.get("date")
+            if date is not None and ((start and date < start) or (end and date > end)):
+                continue
+            if window is not None and partitions.get("window", window) != window:
+                continue
+            files.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith(tuple(EXPORT_FORMATS.values())))
+    else:
+        files = [path]
+
+    if not files:
+        return pd.DataFrame()
+    records = pd.concat([_read_file(file_path) for file_path in files], ignore_index=True)
+
+    # Unpartitioned data is filtered row by row
+    dates = records["Timestamp"].dt.strftime("%Y-%m-%d")
+    keep = np.ones(len(records), dtype=bool)
+    if start:
+        keep &= (dates >= start).to_numpy()
+    if end:
+        keep &= (dates <= end).to_numpy()
+    if window is not None:
+        keep &= (records["Window"] == window).to_numpy()
+    return records[keep].reset_index(drop=True)
@@ -0,0 +1,610 @@
+import numpy as np
+import pandas as pd
+from typing import Union, List, Optional, Tuple
+
+from .arrow_input import ArrowColumn
+from .get_bin_edges import _numeric_bin_edges, get_bin_edges
+from .quantile_sketch import QuantileSketch
+from .bin_counts import BinCounter
+from .drift_metrics import bin_positions, get_metrics
+from .drift_result import FeatureDrift, _drift_output, _drift_values
+from .profiling import stage
+
+# Label of the extra bin holding missing values when missing="bin"
+MISSING_LABEL = "Missing"
+
+# Explicit feature kinds accepted in place of the automatic categorical/numeric decision
+FEATURE_KINDS = ("categorical", "numeric")
+
+# Rows hashed in the first step of the distinct-value check; the step doubles up to the maximum
+DISTINCT_START_BLOCK = 1 << 10
+DISTINCT_MAX_BLOCK = 1 << 16
+
+
+def _split_missing(values: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Observed (non-missing) values and the number of missing ones, masking NaN/None only once.
+
+    The values are returned as-is (no copy) when nothing is missing.
+    """
+    mask = pd.isna(values)
+    n_missing = int(np.count_nonzero(mask))
+    return (values[~mask] if n_missing else values), n_missing
+
+
+def _skips_nan(values) -> bool:
+    """Whether numeric bins can count `values` as they are: floating point NaNs fall in no bin."""
+    return isinstance(values, np.ndarray) and values.dtype.kind == "f"
+
+
+def _is_coded(values) -> bool:
+    """Whether `values` is a categorical of string labels, counted on its integer codes."""
+    return isinstance(values, pd.Categorical) and pd.api.types.is_string_dtype(values.categories)
+
+
+def _as_values(values) -> Union[np.ndarray, pd.Categorical]:
+    """
+    Array-like input as a NumPy array; string categoricals (pandas 'category' columns, Arrow
+    dictionary arrays) are kept as `pd.Categorical` so they are never expanded to object arrays.
+    """
+    return values if _is_coded(values) else np.asarray(values)
+
+
+def _column_values(column: Union[pd.Series, ArrowColumn], drop_missing: bool = True) -> Union[np.ndarray, pd.Categorical]:
+    """
+    NumPy values of a DataFrame column, without copying unless missing values have to be dropped.
+
+    Columns of 'category' dtype with string categories are returned as their `pd.Categorical`, and
+    columns of Arrow tables are converted by `ArrowColumn`.
+    """
+    if isinstance(column, ArrowColumn):
+        return column.to_values(drop_missing)
+    if drop_missing:
+        mask = column.isna().to_numpy()
+        if mask.any():
+            column = column[~mask]
+    values = column.array
+    return values if _is_coded(values) else column.to_numpy()
+
+
+def _code_counts(values: pd.Categorical) -> Tuple[np.ndarray, np.ndarray]:
+    """All category labels of a string categorical (as objects) and the count of each, from its codes."""
+    codes = values.codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.categories))
+    return np.asarray(values.categories, dtype=object), counts
+
+
+def _has_few_distinct(values: np.ndarray, limit: int) -> bool:
+    """
+    Whether `values` has fewer than `limit` distinct values (NaN counted once, as with `np.unique`).
+
+    Values are hashed block by block and the check stops as soon as `limit` distinct values have
+    been seen, so a high-cardinality column is recognized after a few thousand rows instead of
+    being fully sorted.
+    """
+    distinct = values[:0]
+    start, block = 0, DISTINCT_START_BLOCK
+    while start < len(values):
+        distinct = pd.unique(np.concatenate([distinct, pd.unique(values[start:start + block])]))
+        if len(distinct) >= limit:
+            return False
+        start += block
+        block = min(2 * block, DISTINCT_MAX_BLOCK)
+    return True
+
+
+def _is_categorical(values: np.ndarray, n_categories: int, kind: Optional[str] = None) -> bool:
+    """
+    Categorical/numeric decision for a feature: object dtype or fewer than `n_categories` distinct
+    values, unless `kind` ('categorical' or 'numeric') is given explicitly.
+    """
+    if kind is not None:
+        if kind not in FEATURE_KINDS:
+            raise ValueError(f"Invalid feature kind: '{kind}'. Choose from 'categorical' or 'numeric'.")
+        return kind == "categorical"
+    return _is_coded(values) or values.dtype == 'object' or _has_few_distinct(values, n_categories)
+
+
+def _distinct_counts(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted distinct values and their counts in one hash-based pass (same categories as `np.unique`).
+
+    As with `_count_categories`, NaN is reported as a category but never counted.
+    """
+    if _is_coded(values):
+        categories, counts = _code_counts(values)
+        seen = counts > 0
+        categories, counts = categories[seen], counts[seen]
+        if (values.codes < 0).any():
+            categories, counts = np.append(categories, np.nan), np.append(counts, 0)
+        order = np.argsort(categories, kind="stable")
+        return categories[order], counts[order]
+
+    value_counts = pd.Series(values).value_counts(sort=False, dropna=False)
+    categories = value_counts.index.to_numpy()
+    counts = np.where(pd.isna(categories), 0, value_counts.to_numpy(dtype=np.int64))
+
+    order = np.argsort(categories, kind="stable")
+    return categories[order], counts[order]
+
+
+def _count_categories(
+    values: np.ndarray,
+    categories: np.ndarray
+) -> np.ndarray:
+    """
+    Count occurrences of each category in a single hash-based pass over the data.
+
+    Equivalent to ``[np.sum(values == cat) for cat in categories]`` but linear in the
+    number of rows instead of rows x categories. Categories absent from the data get a
+    count of zero, and NaN never matches (as with ``==``).
+
+    Parameters:
+    - values (np.ndarray): Values to count.
+
+    - categories (np.ndarray): Unique category labels to report counts for, in output order.
+
+    Returns:
+    - np.ndarray: Integer counts aligned with `categories`.
+    """
+    if _is_coded(values):
+        # One bincount over the integer codes instead of hashing the labels
+        labels, counts = _code_counts(values)
+        return _align_counts(labels, counts, categories)
+
+    value_counts = pd.Series(values).value_counts(sort=False, dropna=True)
+    return value_counts.reindex(pd.Index(categories), fill_value=0).to_numpy(dtype=np.int64)
+
+
+def _align_counts(
+    categories: np.ndarray,
+    counts: np.ndarray,
+    target: np.ndarray
+) -> np.ndarray:
+    """
+    Re-express per-category counts on a (super)set of categories, filling zeros for new ones.
+    """
+    aligned = pd.Series(counts, index=pd.Index(categories)).reindex(pd.Index(target), fill_value=0)
+    return aligned.to_numpy(dtype=np.int64)
+
+
+class FeatureBaseline:
+    """
+    Fitted reference binning for a single feature.
+
+    Holds everything `calculate_feature_drift` derives from the reference data (the
+    categorical/numeric decision, the bin edges or categories and the reference counts)
+    so that new data can be scored without revisiting the reference.
+
+    Attributes:
+    - method (str): Binning method requested at fit time.
+
+    - is_categorical (bool): Whether the feature is binned by category.
+
+    - bins (np.ndarray): Bin edges (numeric) or sorted categories (categorical).
+
+    - reference_counts (np.ndarray): Reference count for each bin or category, followed by the
+      count of missing values when `missing` is True.
+
+    - missing (bool): Whether missing values are counted in an extra "Missing" bin.
+    """
+
+    __slots__ = ("method", "is_categorical", "bins", "reference_counts", "missing", "_counter")
+
+    def __init__(
+        self,
+        method: str,
+        is_categorical: bool,
+        bins: np.ndarray,
+        reference_counts: np.ndarray,
+        missing: bool = False
+    ):
+        self.method = method
+        self.is_categorical = is_categorical
+        self.bins = bins
+        self.reference_counts = reference_counts
+        self.missing = missing
+        self._counter = None
+
+    def __repr__(self) -> str:
+        kind = "categorical" if self.is_categorical else "numeric"
+        return f"FeatureBaseline(method={self.method!r}, {kind}, n_bins={len(self.reference_counts)})"
+
+    @property
+    def counter(self) -> BinCounter:
+        """Counting kernel for the numeric bin edges, prepared once and reused for every batch."""
+        if self._counter is None:
+            self._counter = BinCounter(self.bins)
+        return self._counter
+
+    @property
+    def positions(self) -> Optional[np.ndarray]:
+        """Representative value of each numeric bin for ordered metrics (None for categorical features)."""
+        return None if self.is_categorical else bin_positions(self.bins)
+
+    @property
+    def strategy(self) -> str:
+        """Binning strategy reported in the drift output."""
+        return self.method if not self.is_categorical or self.method == 'domain' else "domain"
+
+    @classmethod
+    def fit(
+        cls,
+        reference: Union[List[float], np.ndarray],
+        bins: Union[int, List[float]] = 10,
+        method: str = "equal_freq",
+        n_categories: int = 20,
+        target: Optional[Union[List[int], np.ndarray]] = None,
+        missing: str = "drop",
+        max_fit_rows: Optional[int] = None,
+        kind: Optional[str] = None
+    ) -> "FeatureBaseline":
+        """
+        Bin the reference data once, as `calculate_feature_drift` would.
+
+        Parameters:
+        - reference (array-like): Baseline dataset values.
+
+        - bins (int or list): Number of bins (if numeric) or predefined categories.
+
+        - method (str): Binning strategy ('equal_width', 'equal_freq', 'adaptive', 'kmeans', or 'domain').
+
+        - n_categories (int): Number of distinct values in a variable to treat as categorical variable
+
+        - target (array-like, optional): Target aligned with `reference`, required for method='adaptive'.
+
+        - missing (str): 'drop' (default) ignores missing values; 'bin' counts them in an extra "Missing" bin.
+
+        - max_fit_rows (int, optional): Fit 'kmeans'/'adaptive' bins on a reproducible sample of at most this many
+          rows, aggregated to weighted distinct values (see `get_bin_edges`).
+
+        - kind (str, optional): 'categorical' or 'numeric' to skip the automatic decision (object dtype or
+          fewer than `n_categories` distinct values).
+
+        Returns:
+        - FeatureBaseline: Fitted baseline for the feature.
+        """
+        if missing not in ("drop", "bin"):
+            raise ValueError(f"Invalid missing value handling: '{missing}'. Choose from 'drop' or 'bin'.")
+
+        # Missing values are masked once: the observed values are fitted, and the number of missing ones
+        # becomes the "Missing" bin (missing='bin') or is dropped
+        reference = _as_values(reference)
+        mask = np.asarray(pd.isna(reference))
+        n_missing = int(np.count_nonzero(mask))
+        if n_missing and target is not None and len(target) == len(reference):
+            target = np.asarray(target)[~mask]
+        observed = reference[~mask] if n_missing else reference
+        del mask
+        if len(observed) == 0:
+            raise ValueError("Input 'reference' data contains only missing values.")
+
+        # Determine if variable is categorical or numerical
+        with stage("type_detection", rows=len(observed)):
+            is_categorical = _is_categorical(observed, n_categories, kind)
+
+        if is_categorical and method != 'domain':
+            # Categories seen in the reference; new categories are added at score time
+            with stage("fit_bins", rows=len(observed)):
+                fitted_bins, reference_counts = _distinct_counts(observed)
+
+        elif is_categorical and method == 'domain':
+            fitted_bins = np.unique(bins)
+            with stage("count_reference", rows=len(observed)):
+                reference_counts = _count_categories(observed, fitted_bins)
+
+        else:
+            # Numerical variable binning
+            with stage("fit_bins", rows=len(observed)):
+                if method == 'domain':
+                    fitted_bins = get_bin_edges(observed, bins, method)
+                else:
+                    # A copy made when dropping missing values is private and may be reordered while fitting
+                    fitted_bins = _numeric_bin_edges(
+                        np.asarray(observed), bins, method, target=target, max_fit_rows=max_fit_rows, has_nan=False,
+                        overwrite=observed is not reference
+                    )
+                fitted_bins = np.unique(fitted_bins)
+
+            # Ensure full coverage by setting first bin to -inf and last to +inf
+            if method != 'domain':
+                fitted_bins[0] = -np.inf
+                fitted_bins[-1] = np.inf
+
+            # Float columns are counted in place (NaN falls in no bin), so the observed copy is released first
+            if _skips_nan(reference):
+                observed = reference
+            counter = BinCounter(fitted_bins)
+            with stage("count_reference", rows=len(observed)):
+                reference_counts = counter.count(observed)
+
+        if missing == "bin":
+            reference_counts = np.append(reference_counts, n_missing)
+        baseline = cls(method, is_categorical, fitted_bins, reference_counts, missing=missing == "bin")
+        if not is_categorical:
+            baseline._counter = counter
+        return baseline
+
+    @classmethod
+    def from_sketch(
+        cls,
+        sketch: QuantileSketch,
+        bins: int = 10,
+        method: str = "equal_freq"
+    ) -> "FeatureBaseline":
+        """
+        Build a numeric baseline from a `QuantileSketch` of the reference data.
+
+        Edges come from the sketch (see `get_bin_edges`) and reference counts are estimated from
+        sketch ranks, so a baseline over any number of rows needs a single streaming pass. Counts
+        carry the sketch's rank error (`QuantileSketch.rank_error`).
+
+        Parameters:
+        - sketch (QuantileSketch): Sketch fed with the reference values.
+
+        - bins (int): Number of bins.
+
+        - method (str): 'equal_freq' or 'equal_width'.
+
+        Returns:
+        - FeatureBaseline: Fitted numeric baseline.
+        """
+        bin_edges = np.unique(get_bin_edges(sketch, bins, method))
+        bin_edges[0] = -np.inf
+        bin_edges[-1] = np.inf
+
+        # Values in [edge_i, edge_i+1), as np.histogram (last bin is open-ended at +inf)
+        below = sketch.rank(bin_edges[1:-1], inclusive=False)
+        reference_counts = np.diff(np.concatenate([[0], below, [sketch.n]])).astype(np.int64)
+        return cls(method, False, bin_edges, reference_counts)
+
+    def count(self, new: Union[List[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram new data on the fitted bins without computing drift.
+
+        Counts from several chunks can be combined with `merge_counts` and turned into a
+        drift result with `score_counts`, which gives the same result as scoring all the
+        data at once.
+
+        Parameters:
+        - new (array-like): New dataset values.
+
+        Returns:
+        - Tuple of bin labels (edges, or the categories seen in `new` for categorical
+          features) and the count for each bin (plus a trailing missing count when `missing`).
+        """
+        new = _as_values(new)
+        with stage("count", rows=len(new)):
+            if not self.is_categorical and _skips_nan(new):
+                # NaN falls in no bin, so the values are counted without dropping them first
+                n_missing = int(np.count_nonzero(np.isnan(new))) if self.missing else 0
+            else:
+                new, n_missing = _split_missing(new)
+
+            if self.is_categorical and self.method != 'domain' and _is_coded(new):
+                labels, new_counts = _code_counts(new)
+                seen = new_counts > 0
+                labels, new_counts = labels[seen], new_counts[seen]
+
+            elif self.is_categorical and self.method != 'domain':
+                labels = np.asarray(pd.unique(new), dtype=new.dtype)
+                new_counts = _count_categories(new, labels)
+
+            elif self.is_categorical:
+                labels, new_counts = self.bins, _count_categories(new, self.bins)
+
+            else:
+                labels = self.bins
+                new_counts = self.counter.count(new)
+
+            if self.missing:
+                new_counts = np.append(new_counts, n_missing)
+        return labels, new_counts
+
+    def bin_indices(self, new: Union[List[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Assign each new value to a fitted bin, for grouped or windowed counting.
+
+        Parameters:
+        - new (array-like): New dataset values.
+
+        Returns:
+        - Tuple of bin labels (edges, or the reference plus new categories for categorical
+          features) and the bin index of each value (-1 when the value falls in no bin). With
+          `missing`, missing values get the index just past the last regular bin.
+        """
+        new = _as_values(new)
+        missing_mask = np.asarray(pd.isna(new))
+
+        if self.is_categorical and _is_coded(new):
+            # Look up the (few) categories once and map the codes
+            if self.method != 'domain':
+                labels, counts = _code_counts(new)
+                labels = np.unique(np.concatenate([self.bins, labels[counts > 0]]))
+            else:
+                labels = self.bins
+            indices = np.append(pd.Index(labels).get_indexer(np.asarray(new.categories, dtype=object)), -1)[new.codes]
+
+        elif self.is_categorical and self.method != 'domain':
+            new_categories = np.asarray(pd.unique(new[~missing_mask]), dtype=new.dtype)
+            labels = np.unique(np.concatenate([self.bins, new_categories]))
+            indices = pd.Index(labels).get_indexer(new)
+
+        elif self.is_categorical:
+            labels = self.bins
+            indices = pd.Index(self.bins).get_indexer(new)
+
+        else:
+            labels = self.bins
+            indices = self.counter.indices(new)
+
+        # Missing values never match a category or edge
+        indices[missing_mask] = self._n_bins(labels) if self.missing else -1
+        return labels, indices
+
+    def _n_bins(self, labels: np.ndarray) -> int:
+        """Number of regular (non-missing) bins for the given labels."""
+        return len(labels) if self.is_categorical else len(labels) - 1
+
+    def count_by(
+        self,
+        new: Union[List[float], np.ndarray],
+        groups: np.ndarray,
+        n_groups: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram new data separately for each group in one pass.
+
+        Parameters:
+        - new (array-like): New dataset values.
+
+        - groups (np.ndarray): Integer group code (0 .. n_groups-1) of each value; negative codes are ignored.
+
+        - n_groups (int): Number of groups.
+
+        Returns:
+        - Tuple of bin labels and a (n_groups x n_bins) count matrix.
+        """
+        labels, indices = self.bin_indices(new)
+        n_bins = self._n_bins(labels) + self.missing
+        valid = (indices >= 0) & (groups >= 0)
+        flat = np.bincount(groups[valid] * n_bins + indices[valid], minlength=n_groups * n_bins)
+        return labels, flat.reshape(n_groups, n_bins)
+
+    def drift_scores_by(self, labels: np.ndarray, new_counts: np.ndarray) -> np.ndarray:
+        """
+        Drift Score of each row of a (groups x bins) count matrix produced by `count_by`.
+
+        Groups without any new data get NaN.
+        """
+        if self.is_categorical and self.method != 'domain':
+            # Categories absent from both reference and a group contribute exactly zero
+            reference_counts, reference_missing = self._split_counts(self.reference_counts)
+            reference_counts = np.append(_align_counts(self.bins, reference_counts, labels), reference_missing)
+        else:
+            reference_counts = self.reference_counts
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            csi_values = _drift_values(reference_counts, new_counts)[2]
+        scores = np.sum(csi_values, axis=-1)
+        scores[new_counts.sum(axis=-1) == 0] = np.nan
+        return scores
+
+    def merge_counts(
+        self,
+        left: Tuple[np.ndarray, np.ndarray],
+        right: Tuple[np.ndarray, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Add two results of `count` (counts may be negative to remove data).
+        """
+        if self.is_categorical and self.method != 'domain':
+            left_counts, left_missing = self._split_counts(left[1])
+            right_counts, right_missing = self._split_counts(right[1])
+            categories = np.unique(np.concatenate([left[0], right[0]]))
+            counts = _align_counts(left[0], left_counts, categories) + _align_counts(right[0], right_counts, categories)
+
+            # Categories whose count dropped to zero are not part of the new data anymore
+            keep = counts != 0
+            return categories[keep], np.append(counts[keep], left_missing + right_missing)
+        return left[0], left[1] + right[1]
+
+    def _split_counts(self, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Regular bin counts and the (possibly empty) trailing missing count."""
+        return (counts[:-1], counts[-1:]) if self.missing else (counts, counts[:0])
+
+    def _align(
+        self,
+        labels: np.ndarray,
+        new_counts: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Line up new-data counts with the reference bins: (min bins, max bins, reference counts, new counts).
+        """
+        reference_counts, reference_missing = self._split_counts(self.reference_counts)
+        new_counts, new_missing = self._split_counts(new_counts)
+
+        if self.is_categorical and self.method != 'domain':
+            # Union of reference and new categories, as np.unique(concat([reference, new]))
+            unique_bins = np.unique(np.concatenate([self.bins, labels]))
+            reference_counts = _align_counts(self.bins, reference_counts, unique_bins)
+            new_counts = _align_counts(labels, new_counts, unique_bins)
+            min_bins, max_bins = unique_bins, unique_bins  # Same for categorical values
+
+        elif self.is_categorical:
+            min_bins, max_bins = self.bins, self.bins
+
+        else:
+            min_bins = self.bins[:-1]
+            max_bins = self.bins[1:]
+
+        if self.missing:
+            min_bins = np.append(min_bins.astype(object), MISSING_LABEL)
+            max_bins = np.append(max_bins.astype(object), MISSING_LABEL)
+            reference_counts = np.append(reference_counts, reference_missing)
+            new_counts = np.append(new_counts, new_missing)
+
+        return min_bins, max_bins, reference_counts, new_counts
+
+    def score_counts(
+        self,
+        labels: np.ndarray,
+        new_counts: np.ndarray,
+        metrics: Optional[List[str]] = None,
+        bootstrap: Optional[int] = None
+    ) -> FeatureDrift:
+        """
+        Calculate drift from new-data counts produced by `count` (or `merge_counts`).
+
+        Parameters:
+        - labels (np.ndarray): Bin labels returned by `count`.
+
+        - new_counts (np.ndarray): New-data count for each label.
+
+        - metrics (list, optional): Extra drift metrics to compute from the same counts (see `drift_metrics`).
+
+        - bootstrap (int, optional): Number of multinomial resamples of the counts for the confidence
+          interval and p-value of the drift score (see `bootstrap_drift`).
+
+        Returns:
+        - FeatureDrift: Same result as `calculate_feature_drift`.
+        """
+        with stage("score"):
+            return _drift_output(self.strategy, *self._align(labels, new_counts), get_metrics(metrics), self.positions,
+                                 bootstrap=bootstrap)
+
+    def drift_score(self, labels: np.ndarray, new_counts: np.ndarray) -> float:
+        """
+        Drift Score only (no detail DataFrame) from new-data counts produced by `count`.
+
+        Parameters:
+        - labels (np.ndarray): Bin labels returned by `count`.
+
+        - new_counts (np.ndarray): New-data count for each label.
+
+        Returns:
+        - float: Same value as the "Drift Score" of `score_counts`.
+        """
+        _, _, reference_counts, new_counts = self._align(labels, new_counts)
+        return np.sum(_drift_values(reference_counts, new_counts)[2])
+
+    def score(
+        self,
+        new: Union[List[float], np.ndarray],
+        metrics: Optional[List[str]] = None,
+        bootstrap: Optional[int] = None
+    ) -> FeatureDrift:
+        """
+        Calculate drift of new data against the fitted reference bins.
+
+        Parameters:
+        - new (array-like): New dataset values.
+
+        - metrics (list, optional): Extra drift metrics to compute from the same counts (see `drift_metrics`).
+
+        - bootstrap (int, optional): Number of resamples for the confidence interval and p-value of the drift score.
+
+        Returns:
+        - FeatureDrift: Same result as `calculate_feature_drift`.
+        """
+        return self.score_counts(*self.count(new), metrics=metrics, bootstrap=bootstrap)
@@ -1,12 +1,50 @@
 import numpy as np
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.cluster import KMeans
+import pandas as pd
 from typing import Union, List, Optional
 
-def get_bin_edges(reference: Union[List[float], np.ndarray], 
+from .bin_edge_cache import active_edge_cache, fingerprint
+from .quantile_sketch import QuantileSketch
+
+
+def _sample_indices(n_rows: int, max_fit_rows: int, strata: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Sorted indices of a reproducible random sample of `max_fit_rows` rows, stratified by `strata` if given.
+    """
+    rng = np.random.default_rng(42)
+    if strata is None:
+        return np.sort(rng.choice(n_rows, size=max_fit_rows, replace=False))
+
+    # Each class keeps its share of the rows (at least one row per class)
+    indices = []
+    for label in pd.unique(strata):
+        class_indices = np.flatnonzero(strata == label)
+        size = max(1, round(max_fit_rows * len(class_indices) / n_rows))
+        indices.append(rng.choice(class_indices, size=size, replace=False))
+    return np.sort(np.concatenate(indices))
+
+
+def _weighted_values(values: np.ndarray, target: Optional[np.ndarray] = None):
+    """
+    Distinct values (per target class, if given) with their counts, as (X, y, sample_weight) for sklearn.
+    """
+    if target is None:
+        distinct, counts = np.unique(values, return_counts=True)
+        return distinct.reshape(-1, 1), None, counts
+
+    X, y, weights = [], [], []
+    for label in pd.unique(target):
+        distinct, counts = np.unique(values[target == label], return_counts=True)
+        X.append(distinct)
+        y.append(np.full(len(distinct), label))
+        weights.append(counts)
+    return np.concatenate(X).reshape(-1, 1), np.concatenate(y), np.concatenate(weights)
+
+
+def get_bin_edges(reference: Union[List[float], np.ndarray, QuantileSketch], 
                       bins: Union[int, List[float]] = 10, 
                       method: str = "equal_width", 
-                      target: Optional[Union[List[int], np.ndarray]] = None
+                      target: Optional[Union[List[int], np.ndarray]] = None,
+                      max_fit_rows: Optional[int] = None
                      ) -> Union[np.ndarray, List[float]]:
     """
     Compute bin edges for numerical variables or categorical variables based on the specified binning method.
@@ -22,6 +60,8 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
     - reference : array-like
         The input data (typically from the expected or reference dataset) to compute bin edges on.
         Should be numeric for most methods, but may be categorical for 'domain' binning.
+        A `QuantileSketch` built over the reference data (e.g. in chunks) can be passed instead for
+        'equal_freq' (approximate edges, see `QuantileSketch.rank_error`) and 'equal_width' (exact edges).
         
     - bins : int or list
         Number of bins to create (if method is numeric), or a list of bin edges/categories (only used if `method="domain"`).
@@ -45,6 +85,14 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
     - target : array-like, optional
         
         Required if method = 'adaptive'. Target variable used to guide DecisionTree-based binning.
+
+    - max_fit_rows : int, optional
+
+        Fast fitting mode for 'kmeans' and 'adaptive'. References longer than this are fitted on a random
+        sample of `max_fit_rows` rows (stratified by `target` for 'adaptive'), drawn with a fixed seed so
+        the edges are reproducible. The (sampled) values are aggregated to distinct values with counts
+        and the model is fitted on those with sample weights, so fit time scales with the sample size
+        or the number of distinct values rather than the row count. Ignored by the other methods.
     
     Returns:
     --------
@@ -81,8 +129,39 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
         # Return user-defined order as-is (no sorting)
         return  np.asarray(bins)
     
+    # ---- Sketch-based Binning: reference summarized by a QuantileSketch ----
+    if isinstance(reference, QuantileSketch):
+        if reference.n == 0:
+            raise ValueError("Input 'reference' sketch must not be empty.")
+        if method == "equal_freq":
+            return reference.quantile(np.linspace(0, 1, bins + 1))
+        elif method == "equal_width":
+            return np.linspace(reference.min, reference.max, bins + 1)
+        raise ValueError(f"Binning method '{method}' is not supported for a QuantileSketch reference. "
+                         "Choose from 'equal_width' or 'equal_freq'.")
+
     # Convert to NumPy array for consistency
-    reference = np.asarray(reference)
+    return _numeric_bin_edges(np.asarray(reference), bins, method, target, max_fit_rows)
+
+
+def _numeric_bin_edges(
+    reference: np.ndarray,
+    bins: int,
+    method: str,
+    target: Optional[Union[List[int], np.ndarray]] = None,
+    max_fit_rows: Optional[int] = None,
+    has_nan: bool = True,
+    overwrite: bool = False
+) -> np.ndarray:
+    """
+    Validate a numeric reference array and fit its edges (or reuse cached ones).
+
+    Callers that have already split out missing values (`FeatureBaseline.fit` masks each column once)
+    pass `has_nan=False` to skip the NaN scan, and `overwrite=True` when the array is their own copy,
+    so 'equal_freq' partitions it in place instead of copying it again.
+    """
+    if max_fit_rows is not None and max_fit_rows < 1:
+        raise ValueError("'max_fit_rows' must be a positive integer.")
 
     # Handle empty input
     if reference.size == 0:
@@ -92,10 +171,44 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
     if method != "domain" and not np.issubdtype(reference.dtype, np.number):
         raise TypeError("Input 'reference' data must contain only numeric values.")
 
+    # Reuse edges fitted earlier on the same data and parameters (opt-in, see `enable_edge_cache`)
+    cache = active_edge_cache()
+    if cache is None or not isinstance(bins, (int, np.integer)):
+        return _fit_bin_edges(reference, bins, method, target, max_fit_rows, has_nan, overwrite)
+
+    key_target = np.asarray(target) if method == "adaptive" and target is not None else None
+    key = fingerprint(reference, bins, method, key_target, max_fit_rows)
+    edges = cache.get(key) if key is not None else None
+    if edges is None:
+        edges = _fit_bin_edges(reference, bins, method, target, max_fit_rows, has_nan, overwrite)
+        if key is not None:
+            cache.put(key, edges)
+    return edges
+
+
+def _fit_bin_edges(
+    reference: np.ndarray,
+    bins: int,
+    method: str,
+    target: Optional[Union[List[int], np.ndarray]],
+    max_fit_rows: Optional[int],
+    has_nan: bool = True,
+    overwrite: bool = False
+) -> np.ndarray:
+    """
+    Fit the edges of a validated numeric `reference` with one of the data-driven methods.
+
+    With `has_nan=False` the values are known to be free of NaNs; with `overwrite=True` they may be reordered.
+    """
     # ---- Binning Methods ----
     # Remove NaNs if present (skip for 'domain' since bins are user-defined)
-    if method not in ["domain", "adaptive"]:
-        reference = reference[~np.isnan(reference)]
+    # The NaN mask is computed once, and the data is only copied when NaNs are present
+    if has_nan and method not in ["domain", "adaptive"]:
+        nan_mask = np.isnan(reference)
+        if nan_mask.any():
+            reference = reference[~nan_mask]
+            overwrite = True  # A private copy now
+        del nan_mask
 
         # Check again after removing NaNs
         if reference.size == 0:
@@ -103,20 +216,13 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
     
     # ---- Equal Width Binning ----
     if method == "equal_width":
-        reference = reference[~np.isnan(reference)]
-        if reference.size == 0:
-            raise ValueError("Input 'reference' data contains only NaN values.")
-            
         # Create equally spaced intervals from min to max
-        return np.linspace(min(reference), max(reference), bins + 1)
+        return np.linspace(reference.min(), reference.max(), bins + 1)
 
     # ---- Equal Frequency Binning ----
     elif method == "equal_freq":
-        reference = reference[~np.isnan(reference)]
-        if reference.size == 0:
-            raise ValueError("Input 'reference' data contains only NaN values.")
         # Use percentiles to ensure each bin has approximately the same number of samples
-        return np.percentile(reference, np.linspace(0, 100, bins + 1))
+        return np.percentile(reference, np.linspace(0, 100, bins + 1), overwrite_input=overwrite)
     
     # ---- Adaptive Binning (TREE-BASED) ----
     elif method == "adaptive":
@@ -133,35 +239,53 @@ def get_bin_edges(reference: Union[List[float], np.ndarray],
             raise ValueError("Target contains NaNs, which are not allowed.")
 
         # Remove rows where reference data is NaN
-        valid_mask = ~np.isnan(reference)
-        reference_clean = reference[valid_mask]
-        target_clean = target[valid_mask]
+        if has_nan:
+            valid_mask = ~np.isnan(reference)
+            reference_clean = reference[valid_mask]
+            target_clean = target[valid_mask]
+        else:
+            reference_clean, target_clean = reference, target
 
         if reference_clean.size == 0:
             raise ValueError("Input 'reference' data contains only NaN values.")
         
-        # Reshape for sklearn input
-        X = reference_clean.reshape(-1, 1)
-        # target to let tree find splits
-        y = target_clean
-        
-        # Fit decision tree
+        sample_weight = None
+        if max_fit_rows is None:
+            # Reshape for sklearn input
+            X = reference_clean.reshape(-1, 1)
+            # target to let tree find splits
+            y = target_clean
+        else:
+            if reference_clean.size > max_fit_rows:
+                sample = _sample_indices(reference_clean.size, max_fit_rows, strata=target_clean)
+                reference_clean, target_clean = reference_clean[sample], target_clean[sample]
+            # Weighted distinct (value, class) pairs give the tree the same impurities as the rows
+            X, y, sample_weight = _weighted_values(reference_clean, target_clean)
+
+        # Fit decision tree (scikit-learn is imported on first use only; it is slow to import)
+        from sklearn.tree import DecisionTreeClassifier
         tree = DecisionTreeClassifier(max_leaf_nodes=bins, random_state=42)
-        tree.fit(X, y)
+        tree.fit(X, y, sample_weight=sample_weight)
         # Extract and return sorted thresholds
         thresholds = tree.tree_.threshold
         return np.sort(thresholds[thresholds > 0])  # Remove invalid splits (-2) 
 
     # ---- K-Means Based Binning -----
     elif method == "kmeans":
-        reference = reference[~np.isnan(reference)]
-        if reference.size == 0:
-            raise ValueError("Input 'reference' data contains only NaN values.")
+        data = reference.reshape(-1, 1)
+        sample_weight = None
+        if max_fit_rows is not None:
+            if reference.size > max_fit_rows:
+                reference = reference[_sample_indices(reference.size, max_fit_rows)]
+            # Cluster the distinct values weighted by their counts (same objective as clustering the rows)
+            data, _, sample_weight = _weighted_values(reference)
+            if len(data) <= bins:
+                return data.flatten().astype(float)
 
         # Apply k-means clustering
-        data = np.array(reference).reshape(-1, 1)
+        from sklearn.cluster import KMeans
         kmeans = KMeans(n_clusters=bins, random_state=42)
-        kmeans.fit(data)
+        kmeans.fit(data, sample_weight=sample_weight)
         # Use sorted cluster centers as split points
         return np.sort(kmeans.cluster_centers_.flatten())
     
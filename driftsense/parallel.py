@@ -0,0 +1,160 @@
+import os
+from contextvars import copy_context
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+import numpy as np
+
+from .feature_baseline import _as_values
+
+# A feature task is (reference values, new values, keyword arguments for the task function).
+FeatureTask = Tuple[np.ndarray, np.ndarray, dict]
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Translate an `n_jobs` value into a worker count (negative values count back from the CPU count).
+    """
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _run_chunk(func: Callable, chunk: List[FeatureTask]) -> list:
+    return [func(reference, new, **kwargs) for reference, new, kwargs in chunk]
+
+
+def _submit(executor: Executor, func: Callable, chunk: List[FeatureTask]):
+    # Threads run the chunk in a copy of the caller's context (e.g. an active profiler)
+    if isinstance(executor, ThreadPoolExecutor):
+        return executor.submit(copy_context().run, _run_chunk, func, chunk)
+    return executor.submit(_run_chunk, func, chunk)
+
+
+def _is_shareable(values: np.ndarray) -> bool:
+    return values.dtype.kind in "biuf"
+
+
+def _pack_shared(tasks: List[FeatureTask]) -> Tuple[shared_memory.SharedMemory, List[tuple]]:
+    """
+    Copy every numeric column of the tasks into a single shared memory block.
+
+    Returns the block and the tasks rewritten so numeric arrays are replaced by
+    ``("shm", offset, dtype, length)`` descriptors; other arrays are left to pickling.
+    """
+    tasks = [(_as_values(reference), _as_values(new), kwargs) for reference, new, kwargs in tasks]
+    total = sum(values.nbytes for task in tasks for values in task[:2] if _is_shareable(values))
+    shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+
+    offset = 0
+    packed = []
+    for reference, new, kwargs in tasks:
+        specs = []
+        for values in (reference, new):
+            if _is_shareable(values):
+                view = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, offset=offset)
+                view[:] = values
+                specs.append(("shm", offset, values.dtype.str, len(values)))
+                offset += values.nbytes
+                del view
+            else:
+                specs.append(("raw", values))
+        packed.append((specs[0], specs[1], kwargs))
+    return shm, packed
+
+
+def _run_shared_chunk(func: Callable, shm_name: str, chunk: List[tuple]) -> list:
+    """
+    Worker entry point: attach to the shared block, rebuild the column views and run the chunk.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        results = []
+        for reference_spec, new_spec, kwargs in chunk:
+            reference, new = (
+                spec[1] if spec[0] == "raw"
+                else np.ndarray((spec[3],), dtype=np.dtype(spec[2]), buffer=shm.buf, offset=spec[1])
+                for spec in (reference_spec, new_spec)
+            )
+            results.append(func(reference, new, **kwargs))
+            # Views must be released before the block can be closed
+            del reference, new
+        return results
+    finally:
+        shm.close()
+
+
+def _chunked(tasks: List, chunk_size: int) -> List[List]:
+    return [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+
+def map_feature_tasks(
+    func: Callable,
+    tasks: Iterable[FeatureTask],
+    n_jobs: Optional[int] = 1,
+    executor: Union[str, Executor] = "thread",
+    chunk_size: Optional[int] = None
+) -> list:
+    """
+    Apply `func(reference, new, **kwargs)` to every feature task, optionally in parallel.
+
+    Results are returned in task order regardless of the executor, so parallel runs are
+    identical to serial ones.
+
+    Parameters:
+    - func (callable): Module-level function computing one feature (must be picklable for processes).
+
+    - tasks (iterable): Feature tasks as (reference values, new values, keyword arguments).
+
+    - n_jobs (int): Number of workers. 1 runs serially; -1 uses all CPUs.
+
+    - executor (str or Executor): 'thread', 'process', or an existing `concurrent.futures.Executor`.
+      With 'process', numeric columns are handed to workers through shared memory instead of pickling.
+
+    - chunk_size (int, optional): Number of features per submitted task. Defaults to about four
+      chunks per worker, which keeps scheduling overhead low for many cheap features.
+
+    Returns:
+    - list: One result per task, in order.
+    """
+    if isinstance(executor, str) and executor not in ("thread", "process"):
+        raise ValueError(f"Invalid executor: '{executor}'. Choose from 'thread', 'process' or a concurrent.futures.Executor.")
+
+    n_jobs = resolve_n_jobs(n_jobs)
+
+    if n_jobs == 1 and isinstance(executor, str):
+        # Consume lazily so only one feature is materialized at a time
+        return [func(reference, new, **kwargs) for reference, new, kwargs in tasks]
+
+    tasks = list(tasks)
+    if not tasks:
+        return []
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(tasks) // (n_jobs * 4)))
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be a positive integer.")
+
+    if isinstance(executor, Executor):
+        futures = [_submit(executor, func, chunk) for chunk in _chunked(tasks, chunk_size)]
+        return [result for future in futures for result in future.result()]
+
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [_submit(pool, func, chunk) for chunk in _chunked(tasks, chunk_size)]
+            return [result for future in futures for result in future.result()]
+
+    else:
+        shm, packed = _pack_shared(tasks)
+        del tasks
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = [
+                    pool.submit(_run_shared_chunk, func, shm.name, chunk)
+                    for chunk in _chunked(packed, chunk_size)
+                ]
+                return [result for future in futures for result in future.result()]
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,179 @@
+import json
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+from .feature_baseline import FeatureBaseline
+
+# Bump when the on-disk layout changes; `load_profile_arrays` refuses unknown versions.
+FORMAT_VERSION = 1
+
+
+# Python types of object-dtype categories stored as type-tagged JSON in the header (bool before int)
+CATEGORY_TYPES = (("bool", bool), ("int", int), ("float", float), ("str", str))
+
+
+def _tag_category(value) -> List:
+    if isinstance(value, np.generic):
+        value = value.item()
+    for tag, kind in CATEGORY_TYPES:
+        if isinstance(value, kind):
+            return [tag, value]
+    raise TypeError(f"Category {value!r} of type {type(value).__name__} cannot be serialized; "
+                    f"supported category types are bool, int, float and str.")
+
+
+def _encode_bins(bins: np.ndarray) -> Tuple[Optional[np.ndarray], str, Optional[list]]:
+    """
+    Convert bin edges/categories to a pickle-free array plus the dtype to restore on load.
+
+    Object-dtype categories that are not all strings (e.g. a nullable flag's True/False, or ints in
+    an object column) are returned as type-tagged JSON values instead of an array.
+    """
+    if bins.dtype != object:
+        return bins, bins.dtype.str, None
+    if all(isinstance(value, str) for value in bins):
+        return bins.astype(str), "object", None
+    return None, "json", [_tag_category(value) for value in bins]
+
+
+def _decode_bins(bins: Optional[np.ndarray], dtype: str, categories: Optional[list] = None) -> np.ndarray:
+    if dtype == "json":
+        kinds = dict(CATEGORY_TYPES)
+        decoded = np.empty(len(categories), dtype=object)
+        decoded[:] = [kinds[tag](value) for tag, value in categories]
+        return decoded
+    return bins.astype(object) if dtype == "object" else bins
+
+
+def _json_bins(bins):
+    """Make the profile-level `bins` parameter JSON serializable."""
+    if isinstance(bins, dict):
+        return {str(col): np.asarray(values).tolist() for col, values in bins.items()}
+    if np.ndim(bins):
+        return np.asarray(bins).tolist()
+    return int(bins)
+
+
+def _json_settings(settings: dict) -> dict:
+    """Profile settings with `bins` and the integer parameters (possibly NumPy integers) made JSON serializable."""
+    settings = dict(settings, bins=_json_bins(settings["bins"]))
+    for key in ("n_categories", "max_fit_rows", "bootstrap"):
+        if settings.get(key) is not None:
+            settings[key] = int(settings[key])
+    return settings
+
+
+def save_profile_arrays(
+    file_path: str,
+    settings: dict,
+    features: Dict[str, FeatureBaseline]
+) -> None:
+    """
+    Write fitted feature baselines to an uncompressed, pickle-free `.npz` archive.
+
+    The archive holds a JSON header (`__meta__`) with the format version, profile settings and
+    per-feature flags, plus one edges/categories array and one counts array per feature.
+
+    Parameters:
+    - file_path (str): Destination path (conventionally ending in `.npz`).
+
+    - settings (dict): Profile-level settings (`bins`, `method`, `n_categories`, `missing`, `max_fit_rows`).
+
+    - features (dict): Fitted `FeatureBaseline` per column.
+    """
+    arrays = {}
+    feature_meta = []
+    for i, (col, baseline) in enumerate(features.items()):
+        bins, dtype, categories = _encode_bins(baseline.bins)
+        if bins is not None:
+            arrays[f"bins_{i}"] = bins
+        arrays[f"counts_{i}"] = np.asarray(baseline.reference_counts, dtype=np.int64)
+        feature_meta.append({
+            "name": col,
+            "method": baseline.method,
+            "is_categorical": bool(baseline.is_categorical),
+            "missing": bool(baseline.missing),
+            "dtype": dtype,
+        })
+        if categories is not None:
+            feature_meta[-1]["categories"] = categories
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "settings": _json_settings(settings),
+        "features": feature_meta,
+    }
+    arrays["__meta__"] = np.array(json.dumps(meta))
+
+    with open(file_path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+class LazyFeatures(Mapping):
+    """
+    Read-only mapping of feature name to `FeatureBaseline`, loaded from the archive on first access.
+
+    The archive is closed once every feature has been read, or by `close`.
+    """
+
+    def __init__(self, archive, feature_meta: list):
+        self._archive = archive
+        self._index = {meta["name"]: (i, meta) for i, meta in enumerate(feature_meta)}
+        self._cache: Dict[str, FeatureBaseline] = {}
+        if not self._index:
+            self.close()
+
+    def __getitem__(self, col) -> FeatureBaseline:
+        if col not in self._cache:
+            i, meta = self._index[col]
+            if self._archive is None:
+                raise ValueError("The drift profile archive is closed; features not read before closing are unavailable.")
+            bins = self._archive[f"bins_{i}"] if meta["dtype"] != "json" else None
+            self._cache[col] = FeatureBaseline(
+                meta["method"],
+                meta["is_categorical"],
+                _decode_bins(bins, meta["dtype"], meta.get("categories")),
+                self._archive[f"counts_{i}"],
+                missing=meta.get("missing", False),
+            )
+            if len(self._cache) == len(self._index):
+                self.close()  # Everything is in memory
+        return self._cache[col]
+
+    def close(self) -> None:
+        """Close the underlying archive (features read so far stay available)."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def load_profile_arrays(file_path: str) -> Tuple[dict, LazyFeatures]:
+    """
+    Open an archive written by `save_profile_arrays`.
+
+    Only the JSON header is parsed up front; per-feature arrays are read lazily.
+
+    Parameters:
+    - file_path (str): Path of the archive.
+
+    Returns:
+    - Tuple of the profile settings and a lazy mapping of feature baselines.
+    """
+    archive = np.load(file_path, allow_pickle=False)
+    meta = json.loads(archive["__meta__"].item())
+
+    if meta.get("format_version") != FORMAT_VERSION:
+        archive.close()
+        raise ValueError(
+            f"Unsupported drift profile format version: {meta.get('format_version')!r} "
+            f"(expected {FORMAT_VERSION})."
+        )
+
+    return meta["settings"], LazyFeatures(archive, meta["features"])
@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("driftsense.profiling")
+
+PROFILE_COLUMNS = ("Feature", "Stage", "Time (s)", "Rows", "Memory (MB)", "Thread")
+
+_ACTIVE: ContextVar[Optional["DriftProfiler"]] = ContextVar("driftsense_profiler", default=None)
+_FEATURE: ContextVar[Optional[str]] = ContextVar("driftsense_feature", default=None)
+
+# Returned by `stage` and `feature_scope` when profiling is off, so disabled hooks cost a lookup only
+_DISABLED = nullcontext()
+
+
+class DriftProfiler:
+    """
+    Collects wall time, rows and (optionally) memory per feature and stage of a drift run.
+
+    Instrumented stages are:
+
+    - 'prepare': extracting the column values of a feature;
+    - 'type_detection': the categorical/numeric decision;
+    - 'fit_bins': fitting the bin edges or categories of the reference;
+    - 'count_reference' / 'count': histogramming the reference / new data;
+    - 'score': aligning the counts and computing the Drift score and metrics;
+    - 'batched': binning and scoring all batched numeric features together (`batched=True`);
+    - 'summary': building the summary DataFrame;
+    - 'detail_frame': building a detailed Drift DataFrame (only when it is accessed);
+    - 'report_summary' / 'report_detail': rendering the summary and the detail tables of a report.
+
+    Each record is also emitted as a DEBUG log event on the ``driftsense.profiling`` logger, with the
+    record under the ``drift_stage`` attribute, and passed to `callback` when given. Stages run inside
+    process workers (``executor='process'``) are not recorded.
+
+    Parameters:
+    - memory (bool): Also record the peak traced memory of each stage with `tracemalloc`. This makes
+      the run itself noticeably slower.
+
+    - callback (callable, optional): Called with each record (a dict) as soon as a stage finishes.
+
+    Example:
+    ```python
+    with profile_drift() as profiler:
+        summary_df, detailed_dfs = calculate_all_features_drift(reference_df, new_df)
+    profiler.by_stage()
+    ```
+    """
+
+    def __init__(self, memory: bool = False, callback: Optional[Callable[[dict], None]] = None):
+        self.memory = memory
+        self.callback = callback
+        self.records: List[dict] = []
+        # Peak traced memory of each running stage of a thread, as saved before a nested stage resets it
+        self._peaks = threading.local()
+
+    def __repr__(self) -> str:
+        return f"DriftProfiler(records={len(self.records)}, memory={self.memory})"
+
+    @contextmanager
+    def stage(self, name: str, feature: Optional[str] = None, rows: int = 0) -> Iterator[None]:
+        """Time the enclosed block as stage `name` of `feature` (defaults to the current feature)."""
+        if self.memory:
+            peaks = self._peaks.__dict__.setdefault("stack", [])
+            start_memory, peak = tracemalloc.get_traced_memory()
+            if peaks:
+                # Keep the enclosing stage's peak so far before resetting it for this stage
+                peaks[-1] = max(peaks[-1], peak)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            peaks.append(start_memory)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            memory = np.nan
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], peaks.pop())
+                if peaks:
+                    peaks[-1] = max(peaks[-1], peak)
+                memory = max(peak - start_memory, 0) / 2**20
+            self.record({
+                "Feature": feature if feature is not None else _FEATURE.get(),
+                "Stage": name,
+                "Time (s)": elapsed,
+                "Rows": int(rows),
+                "Memory (MB)": memory,
+                "Thread": threading.current_thread().name,
+            })
+
+    def record(self, record: dict) -> None:
+        """Store a finished stage record, log it and pass it to the callback."""
+        self.records.append(record)
+        logger.debug(
+            "%s %s: %.6fs, %d rows", record["Stage"], record["Feature"], record["Time (s)"], record["Rows"],
+            extra={"drift_stage": record}
+        )
+        if self.callback is not None:
+            self.callback(record)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        All records as a DataFrame with one row per feature and stage execution.
+        """
+        return pd.DataFrame(self.records, columns=list(PROFILE_COLUMNS))
+
+    def by_stage(self) -> pd.DataFrame:
+        """
+        Total time, rows and calls per stage, slowest stage first.
+        """
+        frame = self.to_frame()
+        totals = frame.groupby("Stage").agg(**{
+            "Time (s)": ("Time (s)", "sum"), "Rows": ("Rows", "sum"), "Calls": ("Stage", "size"),
+            "Memory (MB)": ("Memory (MB)", "max"),
+        })
+        return totals.sort_values("Time (s)", ascending=False)
+
+
+@contextmanager
+def profile_drift(memory: bool = False, callback: Optional[Callable[[dict], None]] = None) -> Iterator[DriftProfiler]:
+    """
+    Profile every drift computation in the enclosed block (see `DriftProfiler`).
+
+    Parameters:
+    - memory (bool): Also record the peak traced memory of each stage.
+
+    - callback (callable, optional): Called with each record as soon as a stage finishes.
+
+    Returns:
+    - DriftProfiler: The profiler holding the records.
+    """
+    profiler = DriftProfiler(memory=memory, callback=callback)
+    token = _ACTIVE.set(profiler)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        yield profiler
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _ACTIVE.reset(token)
+
+
+def is_profiling() -> bool:
+    """Whether a profiler is active in the current context."""
+    return _ACTIVE.get() is not None
+
+
+def stage(name: str, feature: Optional[str] = None, rows: int = 0):
+    """Context manager timing a stage when profiling is active (a no-op otherwise)."""
+    profiler = _ACTIVE.get()
+    return _DISABLED if profiler is None else profiler.stage(name, feature, rows)
+
+
+@contextmanager
+def _feature(feature: str) -> Iterator[None]:
+    token = _FEATURE.set(feature)
+    try:
+        yield
+    finally:
+        _FEATURE.reset(token)
+
+
+def feature_scope(feature: str):
+    """Attribute the stages in the enclosed block to `feature` when profiling is active."""
+    return _DISABLED if _ACTIVE.get() is None else _feature(feature)
+
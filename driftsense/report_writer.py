@@ -0,0 +1,208 @@
+import os
+from html import escape
+from typing import Iterator, List, Mapping, Optional, TextIO
+import numpy as np
+import pandas as pd
+
+from .drift_bootstrap import BOOTSTRAP_COLUMNS
+from .drift_result import _detail_columns
+from .profiling import stage
+
+# Which detail tables a report includes
+REPORT_DETAILS = ("all", "failing", "none")
+
+# How the pass/fail test of a feature is decided
+REPORT_DECISIONS = ("score", "ci", "p_value")
+
+REPORT_STYLE = """
+        <style>
+            body { font-family: Arial, sans-serif; padding: 20px; }
+            h2 { color: #2a6592; }
+            table { border-collapse: collapse; width: 100%; margin-bottom: 40px; }
+            th, td { border: 1px solid #ccc; padding: 8px; text-align: center; }
+            th { background-color: #f2f2f2; }
+            tr:nth-child(even) { background-color: #f9f9f9; }
+            .pass { background-color: #d4edda; color: #155724; font-weight: bold; }
+            .fail { background-color: #f8d7da; color: #721c24; font-weight: bold; }
+        </style>
+        """
+
+
+def _format_column(values: np.ndarray) -> List[str]:
+    """HTML cell text of a column: floats with four decimals, everything else as str."""
+    if values.dtype.kind == "f":
+        return [f"{value:.4f}" for value in values.tolist()]
+    if values.dtype == object:
+        return [f"{value:.4f}" if isinstance(value, float) else escape(str(value)) for value in values.tolist()]
+    return [escape(str(value)) for value in values.tolist()]
+
+
+def _detail_table(columns: Mapping[str, np.ndarray]) -> str:
+    """Render a detail table from its columns in one join (no per-cell DataFrame formatting)."""
+    header = "".join(f"<th>{escape(str(name))}</th>" for name in columns)
+    cells = zip(*(_format_column(np.asarray(values)) for values in columns.values()))
+    body = "".join("<tr><td>" + "</td><td>".join(row) + "</td></tr>" for row in cells)
+    return f"<table class='dataframe'><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _feature_cell(feature, link: Optional[str]) -> str:
+    name = escape(str(feature))
+    return f"<a href='{escape(link)}'>{name}</a>" if link else name
+
+
+def _write_header(f: TextIO, title: str) -> None:
+    f.write(f"<html><head><title>{title} Report</title>")
+    f.write(REPORT_STYLE)
+    f.write("</head><body>")
+
+
+def _passed(summary_df: pd.DataFrame, scores: np.ndarray, threshold: float, decision: str, alpha: float) -> np.ndarray:
+    """Pass/fail of every feature; NaN scores (or bootstrap values) fail."""
+    if decision not in REPORT_DECISIONS:
+        raise ValueError(f"Invalid report decision: '{decision}'. Choose from 'score', 'ci' or 'p_value'.")
+    if decision == "score":
+        return scores <= threshold
+
+    missing = [col for col in BOOTSTRAP_COLUMNS if col not in summary_df.columns]
+    if missing:
+        raise ValueError(f"Decision '{decision}' needs the bootstrap columns {missing}; compute drift with `bootstrap=...`.")
+    if decision == "ci":
+        # Fail only when the drift is above the threshold with confidence
+        return summary_df["Drift CI Lower"].to_numpy(dtype=float) <= threshold
+    # Fail only when the drift is above the threshold and significant
+    return (scores <= threshold) | (summary_df["P-Value"].to_numpy(dtype=float) >= alpha)
+
+
+def _page_path(file_path: str, page: int) -> str:
+    stem, extension = os.path.splitext(file_path)
+    return f"{stem}_page_{page}{extension or '.html'}"
+
+
+def _chunks(features: List[str], size: int) -> Iterator[List[str]]:
+    for start in range(0, len(features), size):
+        yield features[start:start + size]
+
+
+def write_report(
+    summary_df: pd.DataFrame,
+    detailed_dfs: Mapping[str, pd.DataFrame],
+    file_path: str,
+    threshold: float,
+    score_column: str = "Drift",
+    title: str = "Drift",
+    detail: str = "all",
+    page_size: Optional[int] = None,
+    decision: str = "score",
+    alpha: float = 0.05
+) -> List[str]:
+    """
+    Write an HTML drift report incrementally.
+
+    The summary table is rendered from its columns in one pass, and detail tables are written one
+    feature at a time, so memory stays flat and time grows linearly with the number of features.
+    With `page_size`, `file_path` becomes an index page holding the summary (with links to each
+    feature's detail) and the detail tables are split over numbered pages next to it.
+
+    Parameters:
+    - summary_df (DataFrame): Summary per feature with "Feature" and `score_column` columns.
+
+    - detailed_dfs (dict): Detailed DataFrame per feature.
+
+    - file_path (str): Path of the report (the index page when paginated).
+
+    - threshold (float): Score threshold for test pass/fail.
+
+    - score_column (str): Summary column with the score.
+
+    - title (str): Name of the score in titles and headings.
+
+    - detail (str): 'all' (default), 'failing' (detail tables of failing features only) or 'none'.
+
+    - page_size (int, optional): Number of detail tables per page; None writes a single file.
+
+    - decision (str): 'score' (default) fails features whose score exceeds `threshold`; 'ci' only those whose
+      bootstrap confidence interval lies above it; 'p_value' only those exceeding it with a p-value below `alpha`.
+
+    - alpha (float): Significance level of decision='p_value'.
+
+    Returns:
+    - list: Paths of the written files, index first.
+    """
+    if detail not in REPORT_DETAILS:
+        raise ValueError(f"Invalid report detail: '{detail}'. Choose from 'all', 'failing' or 'none'.")
+    if page_size is not None and page_size < 1:
+        raise ValueError("'page_size' must be a positive integer.")
+
+    features = summary_df["Feature"].tolist()
+    scores = summary_df[score_column].to_numpy(dtype=float)
+    passed = _passed(summary_df, scores, threshold, decision, alpha)
+    # Bootstrap interval and p-value are shown next to the score when available
+    bootstrapped = all(col in summary_df.columns for col in BOOTSTRAP_COLUMNS)
+    if bootstrapped:
+        intervals = [
+            f"[{lower:.4f}, {upper:.4f}]" for lower, upper in zip(
+                summary_df["Drift CI Lower"].to_numpy(dtype=float).tolist(),
+                summary_df["Drift CI Upper"].to_numpy(dtype=float).tolist()
+            )
+        ]
+        p_values = summary_df["P-Value"].to_numpy(dtype=float).tolist()
+
+    # Detail tables in the order of `detailed_dfs`, restricted to failing features if requested
+    failing = {feature for feature, ok in zip(features, passed) if not ok}
+    detail_features = [] if detail == "none" else [
+        feature for feature in detailed_dfs if detail == "all" or feature in failing
+    ]
+
+    pages = list(_chunks(detail_features, page_size)) if page_size else [detail_features]
+    page_paths = [file_path] if not page_size else [_page_path(file_path, i + 1) for i in range(len(pages))]
+    anchors = {feature: f"feature-{i}" for i, feature in enumerate(detail_features)}
+    links = {
+        feature: f"{os.path.basename(path) if page_size else ''}#{anchors[feature]}"
+        for path, page in zip(page_paths, pages) for feature in page
+    }
+
+    with stage("report_summary", rows=len(features)):
+        bootstrap_cells = (
+            [f"<td>{interval}</td><td>{p_value:.4f}</td>" for interval, p_value in zip(intervals, p_values)]
+            if bootstrapped else [""] * len(features)
+        )
+        summary_rows = "".join(
+            f"<tr><td>{_feature_cell(feature, links.get(feature))}</td>"
+            f"<td>{score:.4f}</td>{cells}"
+            f"<td class='{'pass' if ok else 'fail'}'>{'Pass' if ok else 'Fail'}</td></tr>"
+            for feature, score, cells, ok in zip(features, scores.tolist(), bootstrap_cells, passed.tolist())
+        )
+
+    def write_details(f: TextIO, page: List[str]) -> None:
+        for feature in page:
+            with stage("report_detail", feature=feature):
+                f.write(f"<h2 id='{anchors[feature]}'>{title} Detail for Feature: {escape(str(feature))}</h2>")
+                f.write(_detail_table(_detail_columns(detailed_dfs, feature)))
+
+    with open(file_path, "w") as f:
+        _write_header(f, title)
+        f.write(f"<h2>{title} Summary</h2>")
+        bootstrap_header = f"<th>{title} CI</th><th>P-Value</th>" if bootstrapped else ""
+        f.write(f"<table><tr><th>Feature</th><th>{title}</th>{bootstrap_header}<th>Test Result</th></tr>")
+        f.write(summary_rows)
+        f.write("</table>")
+        if not page_size:
+            write_details(f, detail_features)
+        f.write("</body></html>")
+
+    if not page_size:
+        return [file_path]
+
+    index_name = os.path.basename(file_path)
+    for i, (path, page) in enumerate(zip(page_paths, pages)):
+        with open(path, "w") as f:
+            _write_header(f, title)
+            navigation = [f"<a href='{index_name}'>Summary</a>"]
+            if i > 0:
+                navigation.append(f"<a href='{os.path.basename(page_paths[i - 1])}'>Previous</a>")
+            if i + 1 < len(pages):
+                navigation.append(f"<a href='{os.path.basename(page_paths[i + 1])}'>Next</a>")
+            f.write(f"<p>Page {i + 1} of {len(pages)} | {' | '.join(navigation)}</p>")
+            write_details(f, page)
+            f.write("</body></html>")
+    return [file_path] + page_paths
@@ -0,0 +1,47 @@
+import os
+from typing import Iterator, Union
+import pandas as pd
+
+
+def read_chunks(
+    file_path: Union[str, os.PathLike],
+    chunksize: int = 100_000,
+    **read_kwargs
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Parquet file as an iterator of DataFrame chunks.
+
+    The iterator can be passed as `new_df` to `calculate_all_features_drift` (or to
+    `DriftProfile.score_chunks`), so only one chunk is held in memory at a time.
+
+    Parameters:
+    - file_path (str or path): Path of a `.csv` (optionally compressed) or `.parquet` file.
+
+    - chunksize (int): Number of rows per chunk.
+
+    - read_kwargs: Extra keyword arguments for `pandas.read_csv`, or `columns` for Parquet.
+
+    Returns:
+    - Iterator of DataFrames.
+    """
+    if chunksize < 1:
+        raise ValueError("'chunksize' must be a positive integer.")
+
+    path = os.fspath(file_path)
+
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet files in chunks requires 'pyarrow' to be installed.") from e
+        return (batch.to_pandas() for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, **read_kwargs))
+
+    elif ".csv" in os.path.basename(path):
+        return _iter_csv(path, chunksize, **read_kwargs)
+
+    raise ValueError(f"Unsupported file type for '{path}'. Expected a .csv or .parquet file.")
+
+
+def _iter_csv(path: str, chunksize: int, **read_kwargs) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+        yield from reader
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+# Columns `make_frames` can build, from (generator, rows, whether the frame is the new one, shift).
+# Columns named "num_<i>" are normal columns like "num".
+FRAME_COLUMNS = {
+    "num": lambda rng, n, new, shift: rng.normal(loc=shift if new else 0.0, size=n),
+    "skewed": lambda rng, n, new, shift: rng.exponential(size=n),
+    "cat": lambda rng, n, new, shift: rng.choice(["a", "b", "d"] if new else ["a", "b", "c"], n).astype(object),
+    "low_card": lambda rng, n, new, shift: rng.integers(0, 6 if new else 4, n),
+    "label": lambda rng, n, new, shift: rng.integers(0, 2, n),
+}
+
+
+@pytest.fixture
+def make_frames():
+    """
+    Factory of (reference_df, new_df) pairs for drift tests.
+
+    `make_frames(seed, n_ref, n_new, shift=..., missing=..., columns=...)` builds the named columns of
+    `FRAME_COLUMNS`: numeric columns of the new frame are shifted by `shift`, its "cat" column has a
+    new category ("d") instead of "c" and "low_card" has more distinct values. With `missing`, that
+    share of the numeric and "cat" values of both frames is missing (NaN / None).
+    """
+    def make(
+        seed: int = 0,
+        n_ref: int = 500,
+        n_new: int = 200,
+        shift: float = 0.3,
+        missing: float = 0.0,
+        columns=("num", "cat", "low_card")
+    ):
+        rng = np.random.default_rng(seed)
+
+        def frame(n, new):
+            df = pd.DataFrame({col: FRAME_COLUMNS["num" if col.startswith("num_") else col](rng, n, new, shift)
+                               for col in columns})
+            if missing:
+                for col in columns:
+                    if col.startswith("num") or col == "cat":
+                        df.loc[rng.random(n) < missing, col] = np.nan if col != "cat" else None
+            return df
+
+        return frame(n_ref, False), frame(n_new, True)
+
+    return make
@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+from driftsense import DriftProfile, calculate_all_features_drift, calculate_feature_drift
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(0, 2000, 1000, missing=0.05, columns=("cat", "num", "low_card"))
+
+
+def _assert_same(expected, result):
+    pd.testing.assert_frame_equal(result[0], expected[0])
+    assert set(result[1]) == set(expected[1])
+    for feature in expected[1]:
+        pd.testing.assert_frame_equal(result[1][feature], expected[1][feature])
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_category_columns_are_counted_on_codes(frames, missing):
+    reference_df, new_df = frames
+    expected = calculate_all_features_drift(reference_df, new_df, missing=missing)
+    categorical = {"cat": "category"}
+    _assert_same(expected, calculate_all_features_drift(
+        reference_df.astype(categorical), new_df.astype(categorical), missing=missing
+    ))
+
+    profile = DriftProfile(missing=missing).fit(reference_df.astype(categorical))
+    _assert_same(expected, profile.score(new_df.astype(categorical)))
+
+    domain = list(reference_df["cat"].dropna().unique()[:5])
+    expected = calculate_feature_drift(reference_df["cat"].dropna(), new_df["cat"].dropna(), bins=domain, method="domain")
+    result = calculate_feature_drift(
+        reference_df["cat"].dropna().astype("category").array, new_df["cat"].dropna().astype("category").array,
+        bins=domain, method="domain"
+    )
+    pd.testing.assert_frame_equal(result["Drift DataFrame"], expected["Drift DataFrame"])
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_arrow_tables_match_pandas(frames, missing):
+    pa = pytest.importorskip("pyarrow")
+    reference_df, new_df = frames
+    expected = calculate_all_features_drift(reference_df, new_df, missing=missing)
+
+    reference, new = pa.Table.from_pandas(reference_df), pa.Table.from_pandas(new_df)
+    _assert_same(expected, calculate_all_features_drift(reference, new, missing=missing))
+    _assert_same(expected, calculate_all_features_drift(reference, new, missing=missing, batched=True))
+
+    # Dictionary-encoded and multi-chunk columns, RecordBatch input
+    encoded = reference.set_column(0, "cat", reference["cat"].dictionary_encode())
+    chunked = pa.Table.from_batches(new.to_batches(max_chunksize=300))
+    _assert_same(expected, calculate_all_features_drift(encoded, chunked, missing=missing))
+    _assert_same(expected, calculate_all_features_drift(encoded.to_batches()[0], new, missing=missing))
+
+    _assert_same(expected, DriftProfile(missing=missing).fit(encoded).score(chunked))
+
+
+def test_arrow_numeric_columns_are_zero_copy(frames):
+    pa = pytest.importorskip("pyarrow")
+    from driftsense.arrow_input import ArrowFrame
+
+    frame = ArrowFrame(pa.Table.from_pandas(frames[0]))
+    values = frame["low_card"].to_values()
+    assert not values.flags.owndata
+    assert isinstance(frame["cat"].to_values(), pd.Categorical)
+    assert len(frame["num"].to_values()) == frame["num"].count() < len(frame)
+
+
+def test_polars_frames_match_pandas(frames):
+    pl = pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    reference_df, new_df = frames
+    expected = calculate_all_features_drift(reference_df, new_df)
+    _assert_same(expected, calculate_all_features_drift(pl.from_pandas(reference_df), pl.from_pandas(new_df)))
@@ -0,0 +1,129 @@
+import asyncio
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import AsyncDriftScorer, DriftProfile, FeatureBaseline
+
+
+def _frames(n_batches, missing='drop'):
+    rng = np.random.default_rng(0)
+    reference_df = pd.DataFrame({
+        "num": rng.normal(size=1000),
+        "cat": rng.choice(["x", "y", "z"], 1000).astype(object),
+    })
+    reference_df.loc[::13, "num"] = np.nan
+    new_dfs = []
+    for i in range(n_batches):
+        new_df = pd.DataFrame({
+            "num": rng.normal(i * 0.1, 1, 200 + i),
+            "cat": rng.choice(["x", "w"] if i % 2 else ["y", "z", "v"], 200 + i).astype(object),
+        })
+        new_df.loc[::7, "num"] = np.nan
+        new_dfs.append(new_df)
+    return DriftProfile(missing=missing).fit(reference_df), new_dfs
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_concurrent_requests_match_profile_score(missing):
+    profile, new_dfs = _frames(12, missing)
+
+    async def main():
+        async with AsyncDriftScorer(profile, max_batch_size=8, max_delay=0.01) as scorer:
+            return await asyncio.gather(
+                *[scorer.score(new_df) for new_df in new_dfs],
+                *[scorer.score_feature("cat", new_df["cat"]) for new_df in new_dfs],
+            )
+
+    results = asyncio.run(main())
+    for new_df, (summary, details) in zip(new_dfs, results[:len(new_dfs)]):
+        expected_summary, expected_details = profile.score(new_df)
+        pd.testing.assert_frame_equal(summary, expected_summary)
+        for feature in expected_details:
+            pd.testing.assert_frame_equal(details[feature], expected_details[feature])
+    for new_df, result in zip(new_dfs, results[len(new_dfs):]):
+        pd.testing.assert_frame_equal(result["Drift DataFrame"], profile.score(new_df)[1]["cat"])
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_category_columns_are_batched_on_codes(missing, monkeypatch):
+    profile, new_dfs = _frames(6, missing)
+    for i, new_df in enumerate(new_dfs):
+        # Categories of object and string dtype, with missing values
+        new_df.loc[::5, "cat"] = None
+        new_df["cat"] = new_df["cat"].astype(object if i % 2 else "str").astype("category")
+
+    batched_values = []
+    count_by = FeatureBaseline.count_by
+    monkeypatch.setattr(FeatureBaseline, "count_by",
+                        lambda self, new, *args: batched_values.append(new) or count_by(self, new, *args))
+
+    async def main():
+        async with AsyncDriftScorer(profile, max_batch_size=6, max_delay=0.05) as scorer:
+            return await asyncio.gather(*[scorer.score(new_df) for new_df in new_dfs])
+
+    for new_df, (summary, details) in zip(new_dfs, asyncio.run(main())):
+        expected_summary, expected_details = profile.score(new_df)
+        pd.testing.assert_frame_equal(summary, expected_summary)
+        pd.testing.assert_frame_equal(details["cat"], expected_details["cat"])
+    assert any(isinstance(values, pd.Categorical) for values in batched_values)
+
+
+def test_failing_request_does_not_fail_its_batch():
+    profile, new_dfs = _frames(2)
+
+    async def main():
+        async with AsyncDriftScorer(profile, max_delay=0.01) as scorer:
+            return await asyncio.gather(
+                scorer.score(new_dfs[0], detail=False),
+                scorer.score_feature("num", np.array(["a", "b"], dtype=object)),
+                return_exceptions=True,
+            )
+
+    summary, error = asyncio.run(main())
+    pd.testing.assert_frame_equal(summary[0], profile.score(new_dfs[0], detail=False)[0])
+    assert isinstance(error, Exception)
+
+
+def test_queue_limit_rejects_or_waits():
+    profile, new_dfs = _frames(1)
+
+    async def main(reject_when_full):
+        scorer = AsyncDriftScorer(profile, max_pending=2, max_delay=0.05, reject_when_full=reject_when_full)
+        tasks = [asyncio.ensure_future(scorer.score(new_dfs[0], detail=False)) for _ in range(4)]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await scorer.close()
+        return results
+
+    results = asyncio.run(main(True))
+    assert sum(isinstance(result, asyncio.QueueFull) for result in results) == 2
+    assert all(not isinstance(result, Exception) for result in asyncio.run(main(False)))
+
+
+def test_invalid_arguments():
+    profile, _ = _frames(1)
+    with pytest.raises(TypeError):
+        AsyncDriftScorer(object())
+    with pytest.raises(ValueError):
+        AsyncDriftScorer(profile, max_pending=0)
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncDriftScorer(profile).score_feature("unknown", [1.0]))
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_score_feature_rejects_empty_input(missing):
+    profile, _ = _frames(1, missing)
+
+    async def main(values):
+        async with AsyncDriftScorer(profile) as scorer:
+            return await scorer.score_feature("num", values)
+
+    if missing == 'drop':
+        with pytest.raises(ValueError, match="only missing values"):
+            asyncio.run(main([np.nan, np.nan]))
+    else:
+        pd.testing.assert_frame_equal(
+            asyncio.run(main([np.nan, np.nan]))["Drift DataFrame"],
+            profile.features["num"].score(np.array([np.nan, np.nan]))["Drift DataFrame"]
+        )
+    with pytest.raises(ValueError, match="is empty"):
+        asyncio.run(main([]))
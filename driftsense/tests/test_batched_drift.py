@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_all_features_drift
+from driftsense import batched_drift
+from driftsense.batched_drift import batched_numeric_columns, _sorted_percentiles
+
+
+def _frame(rng, n, shift=0.0):
+    data = {f"num_{i}": rng.normal(shift, 1, n) for i in range(5)}
+    data["ints"] = rng.integers(0, 1000, n)
+    data["ties"] = np.round(rng.exponential(size=n), 1)
+    data["few"] = rng.integers(0, 5, n).astype(float)
+    data["f32"] = rng.normal(size=n).astype(np.float32)
+    data["cat"] = rng.choice(["a", "b"], n)
+    data["gaps"] = rng.normal(size=n)
+    data["gaps"][::3] = np.nan
+    return pd.DataFrame(data)
+
+
+@pytest.mark.parametrize("method", ["equal_freq", "equal_width"])
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_batched_matches_per_feature(method, missing):
+    rng = np.random.default_rng(0)
+    reference_df, new_df = _frame(rng, 2000), _frame(rng, 700, shift=0.2)
+    new_df.loc[::4, "num_1"] = np.nan
+
+    summary, details = calculate_all_features_drift(reference_df, new_df, bins=7, method=method, missing=missing)
+    batched_summary, batched_details = calculate_all_features_drift(
+        reference_df, new_df, bins=7, method=method, missing=missing, batched=True
+    )
+
+    expected = summary.set_index("Feature")["Drift"]
+    actual = batched_summary.set_index("Feature")["Drift"].loc[expected.index]
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+    assert list(batched_details) == list(details)
+    for col in details:
+        pd.testing.assert_frame_equal(batched_details[col], details[col])
+
+
+def test_batched_column_selection():
+    rng = np.random.default_rng(1)
+    reference_df = _frame(rng, 500)
+    columns = batched_numeric_columns(
+        reference_df, reference_df, list(reference_df.columns), "equal_freq", kinds={"num_0": "categorical", "few": "numeric"}
+    )
+    assert "num_0" not in columns and "few" in columns
+    assert "f32" not in columns and "cat" not in columns
+    assert batched_numeric_columns(reference_df, reference_df, list(reference_df.columns), "kmeans") == []
+
+
+def test_sorted_percentiles_match_numpy():
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=(8, 101))
+    values[1, ::2] = np.nan
+    values[2, 1:] = np.nan
+    values[3] = np.round(values[3], 1)
+    values[4] *= 1e6
+    n_valid = (~np.isnan(values)).sum(axis=1)
+    q = np.concatenate([np.linspace(0, 100, 11), np.linspace(0, 100, 8), rng.uniform(0, 100, 20)])
+
+    result = _sorted_percentiles(np.sort(values, axis=1), n_valid, q)
+    for i, row in enumerate(values):
+        np.testing.assert_array_equal(result[i], np.percentile(row[~np.isnan(row)], q))
+
+
+def test_tall_frames_use_smaller_blocks(monkeypatch):
+    rng = np.random.default_rng(3)
+    reference_df, new_df = _frame(rng, 3000), _frame(rng, 1000, shift=0.2)
+    expected = calculate_all_features_drift(reference_df, new_df, batched=True)[0]
+    # Room for two columns of the reference per block, filled 999 rows at a time
+    monkeypatch.setattr(batched_drift, "BLOCK_BYTES", 2 * 8 * len(reference_df))
+    monkeypatch.setattr(batched_drift, "ROW_CHUNK", 999)
+    assert batched_drift._block_size(len(reference_df)) == 2
+    pd.testing.assert_frame_equal(calculate_all_features_drift(reference_df, new_df, batched=True)[0], expected)
@@ -0,0 +1,42 @@
+import importlib.util
+import io
+import os
+import pytest
+
+SUITE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "benchmarks", "suite.py")
+
+
+@pytest.fixture(scope="module")
+def suite():
+    if not os.path.exists(SUITE_PATH):
+        pytest.skip("benchmark suite is only available in a source checkout")
+    spec = importlib.util.spec_from_file_location("benchmark_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_suite_runs_every_case(suite, tmp_path):
+    sizes = {"rows": 500, "features": 10, "categories": 5, "bins": 4}
+    results = suite.run(sizes, repeat=1, stream=io.StringIO())
+    names = {name for name, _ in suite.build_cases(**sizes, report_dir=str(tmp_path))}
+    assert set(results["results"]) == names
+    assert {"get_bin_edges/adaptive", "calculate_all_features_drift/wide", "create_drift_report/wide"} <= names
+    assert all(result["time"] > 0 and result["peak_mb"] >= 0 for result in results["results"].values())
+
+    baseline = tmp_path / "baseline.json"
+    assert suite.main(["--rows", "500", "--features", "10", "--repeat", "1", "--filter", "get_bin_edges",
+                       "--save", str(baseline)]) == 0
+    assert baseline.exists()
+
+
+def test_compare_flags_regressions(suite):
+    def document(time, peak_mb):
+        return {"meta": {"sizes": {}}, "results": {"case": {"time": time, "peak_mb": peak_mb}}}
+
+    stream = io.StringIO()
+    assert suite.compare(document(1.1, 10), document(1.0, 10), tolerance=0.25, stream=stream) == []
+    assert suite.compare(document(2.0, 10), document(1.0, 10), tolerance=0.25, stream=stream) == ["case"]
+    assert suite.compare(document(1.0, 30), document(1.0, 10), tolerance=0.25, stream=stream) == ["case"]
+    # Tiny timings stay within the noise floor
+    assert suite.compare(document(3e-4, 0.1), document(1e-4, 0.1), tolerance=0.25, stream=stream) == []
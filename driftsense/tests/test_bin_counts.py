@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from driftsense import BinCounter, bin_counts
+
+
+@pytest.mark.parametrize("edges", [
+    np.linspace(-2, 2, 11),                               # uniform (equal_width)
+    np.array([-np.inf, -1.0, -0.2, 0.0, 0.7, np.inf]),    # open-ended, non-uniform
+    np.array([-np.inf, -1.0, 0.0, 1.0, 2.0, np.inf]),     # open-ended, uniform inside
+])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_matches_histogram(edges, dtype):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=5000).astype(dtype)
+    finite = edges[np.isfinite(edges)]
+    # Values exactly on the edges, outside the range, and not comparable at all
+    values = np.concatenate([values, finite.astype(dtype), np.array([np.nan, np.inf, -np.inf, 10], dtype=dtype)])
+    expected, _ = np.histogram(values[~np.isnan(values)].astype(np.float64), bins=edges)
+    np.testing.assert_array_equal(BinCounter(edges).count(values), expected)
+
+
+def test_integer_input_and_blocks(monkeypatch):
+    monkeypatch.setattr(bin_counts, "BLOCK_SIZE", 7)
+    values = np.random.default_rng(1).integers(0, 20, 100)
+    counter = BinCounter(np.linspace(0, 20, 6))
+    np.testing.assert_array_equal(counter.count(values), np.histogram(values, bins=counter.bin_edges)[0])
+    indices = counter.indices(values)
+    np.testing.assert_array_equal(np.bincount(indices, minlength=5), counter.count(values))
+
+
+def test_invalid_edges():
+    with pytest.raises(ValueError):
+        BinCounter([1.0])
+    with pytest.raises(ValueError):
+        BinCounter([0.0, 2.0, 1.0])
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import (
+    BinEdgeCache, calculate_all_features_drift, calculate_feature_drift, disable_edge_cache, enable_edge_cache,
+    get_bin_edges
+)
+from driftsense.bin_edge_cache import fingerprint
+
+
+@pytest.fixture(autouse=True)
+def no_cache_left_enabled():
+    yield
+    disable_edge_cache()
+
+
+@pytest.fixture
+def data(make_frames):
+    reference_df, new_df = make_frames(0, 2000, 2000, shift=0.2, columns=("num", "label"))
+    return reference_df["num"].to_numpy(), new_df["num"].to_numpy(), reference_df["label"].to_numpy()
+
+
+@pytest.mark.parametrize("method", ["equal_width", "equal_freq", "kmeans", "adaptive"])
+def test_cached_edges_match_fitted_edges(data, method):
+    reference, _, target = data
+    expected = get_bin_edges(reference, 5, method, target=target)
+    cache = enable_edge_cache()
+
+    first = get_bin_edges(reference, 5, method, target=target)
+    second = get_bin_edges(reference, 5, method, target=target)
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(second, expected)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # Returned edges are copies; mutating them does not corrupt the cache
+    second[:] = 0
+    np.testing.assert_array_equal(get_bin_edges(reference, 5, method, target=target), expected)
+
+
+def test_key_depends_on_data_and_parameters(data):
+    reference, new, _ = data
+    cache = enable_edge_cache()
+    get_bin_edges(reference, 5, "equal_freq")
+    get_bin_edges(reference, 6, "equal_freq")
+    get_bin_edges(reference, 5, "equal_width")
+    get_bin_edges(reference.astype(np.float32), 5, "equal_freq")
+    changed = reference.copy()
+    changed[0] += 1
+    get_bin_edges(changed, 5, "equal_freq")
+    assert cache.stats()["misses"] == 5 and cache.stats()["hits"] == 0
+
+    # Domain bins are returned as given and never cached
+    get_bin_edges(reference, [0, 1, 2], "domain")
+    assert len(cache) == 5
+
+
+def test_key_depends_on_sklearn_version(data, monkeypatch):
+    import sklearn
+    reference, _, target = data
+    keys = {method: fingerprint(reference, 5, method, target=target) for method in ("equal_freq", "kmeans", "adaptive")}
+    monkeypatch.setattr(sklearn, "__version__", "0.0")
+    assert fingerprint(reference, 5, "equal_freq", target=target) == keys["equal_freq"]
+    assert fingerprint(reference, 5, "kmeans", target=target) != keys["kmeans"]
+    assert fingerprint(reference, 5, "adaptive", target=target) != keys["adaptive"]
+
+
+def test_lru_eviction(data):
+    reference, _, _ = data
+    cache = enable_edge_cache(max_entries=2)
+    for bins in (3, 4, 5):
+        get_bin_edges(reference, bins, "equal_freq")
+    get_bin_edges(reference, 3, "equal_freq")  # evicted, fitted again
+    get_bin_edges(reference, 5, "equal_freq")
+    assert len(cache) == 2
+    assert cache.stats()["misses"] == 4 and cache.stats()["hits"] == 1
+
+
+def test_disk_tier_is_shared_between_caches(data, tmp_path):
+    reference, new, _ = data
+    expected = calculate_feature_drift(reference, new, method="kmeans")["Drift Score"]
+    enable_edge_cache(directory=tmp_path)
+    calculate_feature_drift(reference, new, method="kmeans")
+
+    cache = enable_edge_cache(directory=tmp_path)
+    assert calculate_feature_drift(reference, new, method="kmeans")["Drift Score"] == expected
+    assert cache.stats() == {"hits": 0, "disk_hits": 1, "misses": 0, "hit_rate": 1.0, "entries": 1}
+
+    cache.clear(disk=True)
+    assert list(tmp_path.glob("*.npy")) == []
+
+
+def test_repeated_runs_skip_fitting(data):
+    reference, new, _ = data
+    reference_df, new_df = pd.DataFrame({"a": reference, "b": new}), pd.DataFrame({"a": new, "b": reference})
+    expected, _ = calculate_all_features_drift(reference_df, new_df, method="kmeans")
+    cache = enable_edge_cache()
+    calculate_all_features_drift(reference_df, new_df, method="kmeans")
+    summary, _ = calculate_all_features_drift(reference_df, new_df, method="kmeans")
+    pd.testing.assert_frame_equal(summary, expected)
+    assert cache.stats()["hits"] == 2
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        BinEdgeCache(max_entries=0)
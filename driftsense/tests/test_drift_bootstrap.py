@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import (
+    DriftProfile, bootstrap_drift, calculate_all_features_drift, calculate_feature_drift, create_drift_report
+)
+from driftsense.drift_result import _drift_values
+
+
+@pytest.fixture
+def counts():
+    return np.array([120, 300, 410, 170]), np.array([80, 260, 380, 280])
+
+
+def test_matches_resampling_loop(counts):
+    reference_counts, new_counts = counts
+    result = bootstrap_drift(reference_counts, new_counts, n_resamples=500, random_state=1)
+
+    # Same draws as resampling one pair of count vectors at a time
+    rng = np.random.default_rng(1)
+    p, q = reference_counts / reference_counts.sum(), new_counts / new_counts.sum()
+    pooled = (reference_counts + new_counts) / (reference_counts + new_counts).sum()
+    observed = np.sum(_drift_values(reference_counts, new_counts)[2])
+    resampled, null = [], []
+    for _ in range(500):
+        draws = [rng.multinomial(n, pvals) for n, pvals in zip(
+            [reference_counts.sum(), new_counts.sum()] * 2, [p, q, pooled, pooled]
+        )]
+        resampled.append(np.sum(_drift_values(draws[0], draws[1])[2]))
+        null.append(np.sum(_drift_values(draws[2], draws[3])[2]))
+
+    lower, upper = np.percentile(resampled, [2.5, 97.5])
+    assert result["Drift CI Lower"] == pytest.approx(lower)
+    assert result["Drift CI Upper"] == pytest.approx(upper)
+    assert result["P-Value"] == pytest.approx((1 + np.sum(np.array(null) >= observed)) / 501)
+
+
+def test_interval_narrows_with_sample_size(counts):
+    reference_counts, new_counts = counts
+    small = bootstrap_drift(reference_counts, new_counts)
+    large = bootstrap_drift(reference_counts * 1000, new_counts * 1000)
+    assert large["Drift CI Upper"] - large["Drift CI Lower"] < small["Drift CI Upper"] - small["Drift CI Lower"]
+    assert large["Drift CI Lower"] < np.sum(_drift_values(reference_counts, new_counts)[2]) < large["Drift CI Upper"]
+
+    # Identical distributions are not significant; empty counts give NaN
+    assert bootstrap_drift(reference_counts, reference_counts // 2)["P-Value"] > 0.5
+    assert np.isnan(bootstrap_drift(reference_counts, np.zeros(4))["P-Value"])
+    with pytest.raises(ValueError):
+        bootstrap_drift(reference_counts, new_counts, n_resamples=0)
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(0, 2000, 150, shift=0.4, columns=("num", "cat"))
+
+
+def test_summary_columns_on_every_path(frames):
+    reference_df, new_df = frames
+    summary, _ = calculate_all_features_drift(reference_df, new_df, bootstrap=200)
+    assert list(summary.columns)[-3:] == ["Drift CI Lower", "Drift CI Upper", "P-Value"]
+
+    result = calculate_feature_drift(reference_df["num"].to_numpy(), new_df["num"].to_numpy(), bootstrap=200)
+    row = summary.set_index("Feature").loc["num"]
+    assert result["Drift Metrics"]["P-Value"] == row["P-Value"]
+
+    profile_summary, _ = DriftProfile(bootstrap=200).fit(reference_df).score(new_df)
+    pd.testing.assert_frame_equal(profile_summary, summary)
+    batched_summary, _ = calculate_all_features_drift(reference_df, new_df, bootstrap=200, batched=True)
+    pd.testing.assert_frame_equal(batched_summary, summary)
+
+
+def test_report_decisions(frames, tmp_path):
+    reference_df, new_df = frames
+    summary, detailed = calculate_all_features_drift(reference_df, new_df, bootstrap=200)
+    # Threshold below the Drift of "num" but within its confidence interval (150 new rows are noisy)
+    num = summary.set_index("Feature").loc["num"]
+    threshold = (num["Drift CI Lower"] + num["Drift"]) / 2
+
+    def num_result(decision):
+        path = tmp_path / f"{decision}.html"
+        create_drift_report(summary, detailed, str(path), drift_threshold=threshold, decision=decision)
+        row = next(row for row in path.read_text().split("<tr>") if "'>num</a>" in row)
+        return "Fail" if "class='fail'" in row else "Pass"
+
+    assert num_result("score") == "Fail"
+    assert num_result("ci") == "Pass"
+    assert num_result("p_value") == ("Fail" if num["P-Value"] < 0.05 else "Pass")
+    assert "P-Value" in (tmp_path / "ci.html").read_text()
+
+    plain_summary, plain_detailed = calculate_all_features_drift(reference_df, new_df)
+    with pytest.raises(ValueError, match="bootstrap"):
+        create_drift_report(plain_summary, plain_detailed, str(tmp_path / "r.html"), decision="p_value")
+    with pytest.raises(ValueError, match="decision"):
+        create_drift_report(summary, detailed, str(tmp_path / "r.html"), decision="bayes")
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_feature_drift, calculate_all_features_drift, DriftProfile
+from driftsense.drift_metrics import compute_metrics, get_metrics, register_metric, DRIFT_METRICS
+
+scipy_stats = pytest.importorskip("scipy.stats")
+scipy_distance = pytest.importorskip("scipy.spatial.distance")
+
+
+@pytest.fixture
+def counts():
+    return np.array([120, 300, 410, 170]), np.array([80, 260, 380, 280])
+
+
+def test_metrics_match_reference_formulas(counts):
+    reference_counts, new_counts = counts
+    positions = np.array([0.5, 1.5, 2.5, 3.5])
+    values = compute_metrics(
+        get_metrics(["psi", "kl", "js", "hellinger", "ks", "wasserstein"]), reference_counts, new_counts, positions
+    )
+    p, q = reference_counts / reference_counts.sum(), new_counts / new_counts.sum()
+
+    assert values["PSI"] == pytest.approx(np.sum((q - p) * np.log(q / p)))
+    assert values["KL"] == pytest.approx(scipy_stats.entropy(q, p))
+    assert values["JS"] == pytest.approx(scipy_distance.jensenshannon(p, q, base=2) ** 2)
+    assert values["Hellinger"] == pytest.approx(np.sqrt(np.sum((np.sqrt(p) - np.sqrt(q)) ** 2) / 2))
+    assert values["KS"] == pytest.approx(np.max(np.abs(np.cumsum(p) - np.cumsum(q))))
+    assert values["Wasserstein"] == pytest.approx(scipy_stats.wasserstein_distance(positions, positions, p, q))
+
+
+def test_metrics_on_group_matrix(counts):
+    reference_counts, new_counts = counts
+    matrix = np.vstack([new_counts, reference_counts])
+    values = compute_metrics(get_metrics(["js", "ks"]), reference_counts, matrix, np.arange(4.0))
+    assert values["JS"][1] == pytest.approx(0) and values["KS"][1] == pytest.approx(0)
+    assert values["JS"][0] == pytest.approx(compute_metrics(get_metrics(["js"]), reference_counts, new_counts)["JS"])
+
+
+def test_ordered_metrics_nan_for_categorical():
+    reference = np.array(["a", "b", "c"] * 20, dtype=object)
+    new = np.array(["a", "b", "b"] * 10, dtype=object)
+    output = calculate_feature_drift(reference, new, metrics=["ks", "hellinger"])
+    assert np.isnan(output["Drift Metrics"]["KS"])
+    assert output["Drift Metrics"]["Hellinger"] > 0
+
+
+def test_summary_columns_and_unknown_metric():
+    rng = np.random.default_rng(0)
+    reference_df = pd.DataFrame({"x": rng.normal(size=500), "c": rng.choice(["a", "b"], 500)})
+    new_df = pd.DataFrame({"x": rng.normal(0.5, size=300), "c": rng.choice(["a", "b"], 300)})
+
+    summary, _ = calculate_all_features_drift(reference_df, new_df, metrics=["psi", "js", "wasserstein"])
+    assert list(summary.columns) == ["index", "Feature", "Binning Strategy", "Drift", "PSI", "JS", "Wasserstein"]
+    np.testing.assert_allclose(summary["PSI"], summary["Drift"])
+
+    profile_summary, _ = DriftProfile(metrics=["psi", "js", "wasserstein"]).fit(reference_df).score(new_df)
+    pd.testing.assert_frame_equal(profile_summary, summary)
+
+    with pytest.raises(ValueError):
+        calculate_all_features_drift(reference_df, new_df, metrics=["chi2"])
+
+
+def test_register_custom_metric(counts):
+    @register_metric("tv", column="Total Variation")
+    def total_variation(reference_perc, new_perc, positions):
+        return np.abs(new_perc - reference_perc).sum(axis=-1) / 2
+
+    try:
+        values = compute_metrics(get_metrics(["TV"]), *counts)
+        assert values["Total Variation"] == pytest.approx(0.11)
+    finally:
+        del DRIFT_METRICS["tv"]
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import DriftProfile, DriftMonitor
+
+
+@pytest.fixture
+def setup(make_frames):
+    reference_df, _ = make_frames(5, 400, 60, columns=("num", "cat"))
+    batches = [make_frames(50 + i, 1, 60, shift=0.2 * i, columns=("num", "cat"))[1] for i in range(5)]
+    return DriftProfile().fit(reference_df), batches
+
+
+def _assert_matches_fresh(monitor, profile, window_batches):
+    expected_summary, expected_details = profile.score(pd.concat(window_batches, ignore_index=True))
+    summary, details = monitor.score()
+    pd.testing.assert_frame_equal(summary, expected_summary)
+    for col in details:
+        pd.testing.assert_frame_equal(details[col], expected_details[col])
+    scores = monitor.drift_scores()
+    for _, row in expected_summary.iterrows():
+        assert scores[row["Feature"]] == pytest.approx(row["Drift"])
+
+
+def test_update_and_expire(setup):
+    profile, batches = setup
+    monitor = DriftMonitor(profile)
+    for batch in batches[:3]:
+        monitor.update(batch)
+    _assert_matches_fresh(monitor, profile, batches[:3])
+    monitor.expire(batches[0]).update(batches[3])
+    _assert_matches_fresh(monitor, profile, batches[1:4])
+
+
+def test_time_buckets_slide(setup):
+    profile, batches = setup
+    monitor = DriftMonitor(profile, window=2)
+    for i, batch in enumerate(batches):
+        monitor.update(batch)
+        _assert_matches_fresh(monitor, profile, batches[max(0, i - 1):i + 1])
+        monitor.advance()
+
+
+def test_expire_unknown_data_raises(setup):
+    profile, batches = setup
+    monitor = DriftMonitor(profile).update(batches[0])
+    with pytest.raises(ValueError):
+        monitor.expire(batches[1])
+
+
+def test_failed_expire_leaves_counts_unchanged(setup):
+    profile, batches = setup
+    monitor = DriftMonitor(profile).update(batches[0])
+    before = {col: (labels.copy(), counts.copy()) for col, (labels, counts) in monitor._total.items()}
+    # The numeric feature can be expired (same number of rows), the categorical one cannot
+    too_much = batches[0].assign(cat="zzz")
+    with pytest.raises(ValueError, match="feature 'cat'"):
+        monitor.expire(too_much)
+
+    assert monitor._total.keys() == before.keys()
+    for col, (labels, counts) in before.items():
+        np.testing.assert_array_equal(monitor._total[col][0], labels)
+        np.testing.assert_array_equal(monitor._total[col][1], counts)
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+from driftsense import DriftProfile, calculate_all_features_drift
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(0, 500, 200)
+
+
+def test_profile_score_matches_calculate_all_features_drift(frames):
+    reference_df, new_df = frames
+    expected_summary, expected_details = calculate_all_features_drift(reference_df, new_df)
+    summary, details = DriftProfile().fit(reference_df).score(new_df)
+    pd.testing.assert_frame_equal(summary, expected_summary)
+    assert details.keys() == expected_details.keys()
+    for col in details:
+        pd.testing.assert_frame_equal(details[col], expected_details[col])
+
+
+def test_profile_reused_across_batches(frames):
+    reference_df, new_df = frames
+    profile = DriftProfile(bins=5, method="equal_width").fit(reference_df)
+    for batch in (new_df.iloc[:100], new_df.iloc[100:]):
+        expected_summary, _ = calculate_all_features_drift(reference_df, batch, bins=5, method="equal_width")
+        summary, _ = profile.score(batch)
+        pd.testing.assert_frame_equal(summary, expected_summary)
+
+
+def test_profile_domain_requires_bins_per_column(frames):
+    reference_df, _ = frames
+    with pytest.raises(ValueError):
+        DriftProfile(bins={"num": [-1, 0, 1]}, method="domain").fit(reference_df)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_all_features_drift, create_drift_report, get_drift_report
+
+
+@pytest.fixture
+def drift_results():
+    rng = np.random.default_rng(0)
+    reference_df = pd.DataFrame({
+        "stable": rng.normal(size=500),
+        "shifted": rng.normal(size=500),
+        "cat": rng.choice(["x", "y", "z"], 500).astype(object),
+    })
+    new_df = pd.DataFrame({
+        "stable": rng.normal(size=300),
+        "shifted": rng.normal(size=300) + 2,
+        "cat": rng.choice(["x", "y", "<w>"], 300).astype(object),
+    })
+    return calculate_all_features_drift(reference_df, new_df, missing="bin")
+
+
+def test_single_file_report(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    path = tmp_path / "report.html"
+    create_drift_report(summary_df, detailed_dfs, str(path))
+
+    html = path.read_text()
+    assert html.count("Drift Detail for Feature") == 3
+    assert "&lt;w&gt;" in html and "<w>" not in html
+    assert "Missing" in html
+    # Same report from a plain dictionary of DataFrames
+    plain_path = tmp_path / "plain.html"
+    create_drift_report(summary_df, dict(detailed_dfs.items()), str(plain_path))
+    assert plain_path.read_text() == html
+
+
+def test_failing_detail_only(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    path = tmp_path / "report.html"
+    create_drift_report(summary_df, detailed_dfs, str(path), detail="failing")
+
+    html = path.read_text()
+    failing = summary_df.loc[summary_df["Drift"] > 0.25, "Feature"]
+    assert "shifted" in set(failing)
+    assert html.count("Drift Detail for Feature") == len(failing)
+    assert "Drift Detail for Feature: stable" not in html
+
+    with pytest.raises(ValueError):
+        create_drift_report(summary_df, detailed_dfs, str(path), detail="some")
+
+
+def test_paginated_report(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    path = tmp_path / "report.html"
+    create_drift_report(summary_df, detailed_dfs, str(path), page_size=2)
+
+    index = path.read_text()
+    pages = [(tmp_path / f"report_page_{i}.html").read_text() for i in (1, 2)]
+    assert not (tmp_path / "report_page_3.html").exists()
+    assert "Drift Detail" not in index
+    assert "report_page_2.html#feature-2" in index
+    assert [page.count("Drift Detail for Feature") for page in pages] == [2, 1]
+    assert "href='report_page_2.html'>Next" in pages[0]
+
+
+def test_get_drift_report_uses_csi_column(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    path = tmp_path / "csi.html"
+    get_drift_report(summary_df.rename(columns={"Drift": "CSI"}), detailed_dfs, str(path), detail="none")
+
+    html = path.read_text()
+    assert "<h2>CSI Summary</h2>" in html and "CSI Detail" not in html
@@ -0,0 +1,49 @@
+import pickle
+import numpy as np
+import pandas as pd
+from driftsense import DriftProfile, FeatureDrift, calculate_all_features_drift, calculate_feature_drift
+
+
+def test_feature_drift_builds_detail_lazily():
+    rng = np.random.default_rng(0)
+    result = calculate_feature_drift(rng.normal(size=500), rng.normal(size=300) + 0.5)
+
+    assert isinstance(result, FeatureDrift)
+    assert result._frame is None
+    assert list(result) == ["Binning Strategy", "Drift DataFrame", "Drift Score"]
+    assert "Drift Metrics" not in result
+
+    detail = result["Drift DataFrame"]
+    assert result["Drift DataFrame"] is detail
+    assert list(detail.columns) == ["Min Bin", "Max Bin", "Reference Count", "New Count", "Reference %", "New %", "Drift Value"]
+    np.testing.assert_array_equal(detail["New Count"], result.new_counts)
+    assert np.isclose(detail["Drift Value"].sum(), result["Drift Score"])
+
+
+def test_feature_drift_metrics_key_and_pickle():
+    result = calculate_feature_drift(list("aabbc") * 20, list("abccc") * 20, metrics=["js"])
+    assert result["Drift Metrics"].keys() == {"JS"}
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored["Drift Score"] == result["Drift Score"]
+    pd.testing.assert_frame_equal(restored["Drift DataFrame"], result["Drift DataFrame"])
+
+
+def test_summary_only_mode():
+    rng = np.random.default_rng(1)
+    reference_df = pd.DataFrame({"num": rng.normal(size=400), "cat": rng.choice(["x", "y"], 400).astype(object)})
+    new_df = pd.DataFrame({"num": rng.normal(size=200), "cat": rng.choice(["x", "z"], 200).astype(object)})
+
+    expected_summary, details = calculate_all_features_drift(reference_df, new_df)
+    for kwargs in ({}, {"batched": True}):
+        summary, empty = calculate_all_features_drift(reference_df, new_df, detail=False, **kwargs)
+        pd.testing.assert_frame_equal(summary, expected_summary)
+        assert empty == {}
+
+    summary, empty = DriftProfile().fit(reference_df).score(new_df, detail=False)
+    pd.testing.assert_frame_equal(summary, expected_summary)
+    assert empty == {}
+
+    assert set(details) == {"num", "cat"}
+    assert all(result._frame is None for result in details.results.values())
+    assert isinstance(details["num"], pd.DataFrame)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_all_features_drift, export_drift_results, read_drift_results
+from driftsense.export import drift_records
+
+
+@pytest.fixture
+def drift_results():
+    rng = np.random.default_rng(0)
+    reference_df = pd.DataFrame({"num": rng.normal(size=400), "cat": rng.choice(["x", "y"], 400).astype(object)})
+    new_df = pd.DataFrame({"num": rng.normal(size=200) + 1, "cat": rng.choice(["x", "z"], 200).astype(object)})
+    return calculate_all_features_drift(reference_df, new_df, metrics=["js"])
+
+
+def test_drift_records_long_format(drift_results):
+    summary_df, detailed_dfs = drift_results
+    records = drift_records(summary_df, detailed_dfs, method="equal_freq", window="2024-06",
+                            timestamp="2024-07-01", run_id="run-1")
+
+    assert len(records) == sum(len(detailed_dfs[col]) for col in detailed_dfs)
+    assert (records["Run ID"] == "run-1").all() and (records["Window"] == "2024-06").all()
+    assert records["Timestamp"].iloc[0] == pd.Timestamp("2024-07-01", tz="UTC")
+    assert {"Drift", "JS", "Test Result", "Bin", "Min Bin", "New Count", "Drift Value"} <= set(records.columns)
+
+    num = records[records["Feature"] == "num"]
+    np.testing.assert_array_equal(num["New Count"], detailed_dfs["num"]["New Count"])
+    assert num["Min Bin"].iloc[0] == "-inf"
+
+    # Summary-only runs keep one row per feature
+    assert len(drift_records(summary_df, {})) == len(summary_df)
+
+
+def test_jsonl_export_appends_and_round_trips(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    path = tmp_path / "drift.jsonl"
+    export_drift_results(summary_df, detailed_dfs, str(path), timestamp="2024-07-01", run_id="a")
+    export_drift_results(summary_df, detailed_dfs, str(path), timestamp="2024-07-02", run_id="b")
+
+    records = read_drift_results(str(path))
+    expected = drift_records(summary_df, detailed_dfs, timestamp="2024-07-01", run_id="a")
+    assert list(records["Run ID"].unique()) == ["a", "b"]
+    first = records[records["Run ID"] == "a"].reset_index(drop=True)
+    np.testing.assert_allclose(first["Drift Value"], expected["Drift Value"])
+    assert first["Min Bin"].tolist() == expected["Min Bin"].tolist()
+    assert len(read_drift_results(str(path), start="2024-07-02")) == len(expected)
+
+    with pytest.raises(ValueError):
+        export_drift_results(summary_df, detailed_dfs, str(tmp_path / "drift.txt"))
+
+
+def test_partitioned_dataset(drift_results, tmp_path):
+    summary_df, detailed_dfs = drift_results
+    for day, window in [("2024-06-30", "2024-06"), ("2024-07-31", "2024-07"), ("2024-07-31", "2024-07")]:
+        written = export_drift_results(summary_df, detailed_dfs, str(tmp_path), timestamp=day, window=window,
+                                       partition_by=["date", "window"])
+    assert written == str(tmp_path / "date=2024-07-31" / "window=2024-07" / "drift.jsonl")
+
+    july = read_drift_results(str(tmp_path), start="2024-07-01")
+    assert set(july["Window"]) == {"2024-07"}
+    assert july["Run ID"].nunique() == 2
+    assert set(read_drift_results(str(tmp_path), window="2024-06")["Window"]) == {"2024-06"}
+
+    with pytest.raises(ValueError):
+        export_drift_results(summary_df, detailed_dfs, str(tmp_path), partition_by=["feature"])
+
+
+def test_parquet_export(drift_results, tmp_path):
+    pytest.importorskip("pyarrow")
+    summary_df, detailed_dfs = drift_results
+    written = export_drift_results(summary_df, detailed_dfs, str(tmp_path), format="parquet", run_id="r1",
+                                   timestamp="2024-07-01", partition_by=["date"])
+    assert written.endswith("run-r1.parquet")
+    records = read_drift_results(str(tmp_path))
+    assert len(records) == sum(len(detailed_dfs[col]) for col in detailed_dfs)
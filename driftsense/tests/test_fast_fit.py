@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import get_bin_edges, DriftProfile
+from driftsense.get_bin_edges import _sample_indices
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(3)
+    reference = np.round(rng.lognormal(size=20_000), 2)
+    target = (rng.random(20_000) < 1 / (1 + np.exp(-(reference - 2)))).astype(int)
+    return reference, target
+
+
+def test_adaptive_weighted_fit_matches_full_fit(data):
+    reference, target = data
+    exact = get_bin_edges(reference, bins=8, method="adaptive", target=target)
+    fast = get_bin_edges(reference, bins=8, method="adaptive", target=target, max_fit_rows=len(reference))
+    np.testing.assert_allclose(fast, exact)
+
+
+@pytest.mark.parametrize("method", ["kmeans", "adaptive"])
+def test_sampled_fit_is_reproducible(data, method):
+    reference, target = data
+    first = get_bin_edges(reference, bins=6, method=method, target=target, max_fit_rows=2_000)
+    second = get_bin_edges(reference, bins=6, method=method, target=target, max_fit_rows=2_000)
+    np.testing.assert_array_equal(first, second)
+    assert np.all((first >= reference.min()) & (first <= reference.max()))
+
+
+def test_kmeans_with_few_distinct_values():
+    edges = get_bin_edges(np.repeat([1.0, 2.0, 5.0], 100), bins=5, method="kmeans", max_fit_rows=50)
+    np.testing.assert_array_equal(edges, [1.0, 2.0, 5.0])
+
+
+def test_stratified_sample_keeps_rare_class():
+    strata = np.zeros(100_000, dtype=int)
+    strata[:30] = 1
+    sample = _sample_indices(len(strata), 1_000, strata=strata)
+    assert abs(len(sample) - 1_000) <= 1 and np.all(np.diff(sample) > 0)
+    assert np.count_nonzero(strata[sample] == 1) == 1
+
+
+def test_invalid_max_fit_rows(data):
+    with pytest.raises(ValueError):
+        get_bin_edges(data[0], bins=5, method="kmeans", max_fit_rows=0)
+
+
+def test_profile_keeps_max_fit_rows(data, tmp_path):
+    reference, _ = data
+    profile = DriftProfile(method="kmeans", bins=5, max_fit_rows=1_000).fit(pd.DataFrame({"x": reference}))
+    profile.save(tmp_path / "profile.npz")
+    assert DriftProfile.load(tmp_path / "profile.npz").max_fit_rows == 1_000
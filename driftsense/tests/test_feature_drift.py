@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_feature_drift, DriftProfile
+from driftsense.feature_baseline import _count_categories, _has_few_distinct
+
+
+def _loop_counts(values, categories):
+    return np.array([np.sum(values == cat) for cat in categories])
+
+
+@pytest.mark.parametrize("values, categories", [
+    (np.array(["a", "b", "c", "a"], dtype=object), np.array(["a", "b", "c", "d"], dtype=object)),
+    (np.array(["x", "y", "x"]), np.array(["x", "y", "z"])),
+    (np.array([1, 2, 2, 3, 3, 3]), np.array([0, 1, 2, 3])),
+    (np.array([1.0, 2.0, np.nan, 2.0]), np.array([1.0, 2.0, np.nan])),
+])
+def test_count_categories_matches_loop(values, categories):
+    np.testing.assert_array_equal(_count_categories(values, categories), _loop_counts(values, categories))
+
+
+def test_categorical_drift_counts_unseen_categories():
+    reference = np.array(["a", "b", "c"] * 10, dtype=object)
+    new = np.array(["a", "d"] * 5, dtype=object)
+    result = calculate_feature_drift(reference, new)
+    df = result["Drift DataFrame"]
+    assert list(df["Min Bin"]) == ["a", "b", "c", "d"]
+    assert list(df["Reference Count"]) == [10, 10, 10, 0]
+    assert list(df["New Count"]) == [5, 0, 0, 5]
+
+
+def test_domain_categories_missing_from_data():
+    reference = np.array([1, 1, 2, 3])
+    new = np.array([1, 2, 2, 7])
+    result = calculate_feature_drift(reference, new, bins=[1, 2, 9], method="domain")
+    df = result["Drift DataFrame"]
+    assert list(df["Reference Count"]) == [2, 1, 0]
+    assert list(df["New Count"]) == [1, 2, 0]
+
+
+@pytest.mark.parametrize("n_distinct", [5, 19, 20, 21, 5000])
+def test_has_few_distinct_matches_unique(n_distinct):
+    values = np.random.default_rng(0).integers(0, n_distinct, 20_000).astype(float)
+    values[::7] = np.nan
+    assert _has_few_distinct(values, 20) == (len(np.unique(values)) < 20)
+
+
+def test_kind_overrides_automatic_decision():
+    reference = np.random.default_rng(0).integers(0, 5, 500)
+    new = np.random.default_rng(1).integers(0, 5, 200)
+    assert calculate_feature_drift(reference, new)["Binning Strategy"] == "domain"
+    numeric = calculate_feature_drift(reference, new, bins=3, method="equal_width", kind="numeric")
+    assert numeric["Binning Strategy"] == "equal_width"
+    with pytest.raises(ValueError):
+        calculate_feature_drift(reference, new, kind="ordinal")
+
+
+def test_profile_kinds_map():
+    rng = np.random.default_rng(2)
+    reference_df = pd.DataFrame({"code": rng.integers(0, 5, 300), "score": rng.normal(size=300)})
+    profile = DriftProfile(kinds={"code": "numeric", "score": "categorical"}).fit(reference_df)
+    assert not profile.features["code"].is_categorical
+    assert profile.features["score"].is_categorical
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+import driftsense
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _loaded_modules(code):
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True)
+    return set(json.loads(output.stdout))
+
+
+def test_import_and_equal_freq_drift_do_not_load_sklearn():
+    modules = _loaded_modules("import driftsense")
+    assert "sklearn" not in modules and "driftsense.calculate_all_features_drift" not in modules
+
+    modules = _loaded_modules(
+        "import driftsense\n"
+        "driftsense.calculate_all_features_drift(\n"
+        "    __import__('pandas').DataFrame({'a': range(100)}), __import__('pandas').DataFrame({'a': range(50, 150)}))"
+    )
+    assert "sklearn" not in modules and "scipy" not in modules
+
+    modules = _loaded_modules("import driftsense\ndriftsense.get_bin_edges(list(range(100)), 4, 'kmeans')")
+    assert "sklearn" in modules
+
+
+def test_public_names_resolve_lazily():
+    from driftsense.feature_baseline import FeatureBaseline
+
+    # Importing a submodule named like its function must not shadow the function
+    assert callable(driftsense.get_bin_edges) and callable(driftsense.calculate_feature_drift)
+    assert driftsense.FeatureBaseline is FeatureBaseline
+    assert set(driftsense.__all__) <= set(dir(driftsense))
+    for name in driftsense.__all__:
+        assert getattr(driftsense, name).__name__ == name
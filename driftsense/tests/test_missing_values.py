@@ -0,0 +1,83 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import calculate_feature_drift, calculate_all_features_drift, DriftProfile, DriftMonitor
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(7, 400, 300, missing=0.15, columns=("num", "cat"))
+
+
+def test_missing_bin_counts_missing_share():
+    # Same observed distribution, but the share of missing values grows from 25% to 40%
+    reference = np.array([1.0, 2.0, 3.0, np.nan] * 25)
+    new = np.concatenate([np.array([1.0, 2.0, 3.0] * 20), np.full(40, np.nan)])
+    result = calculate_feature_drift(reference, new, bins=2, method="equal_width", missing="bin")
+    df = result["Drift DataFrame"]
+    assert df["Min Bin"].iloc[-1] == "Missing"
+    assert df["Reference Count"].iloc[-1] == 25 and df["New Count"].iloc[-1] == 40
+    dropped = calculate_feature_drift(reference[~np.isnan(reference)], new[~np.isnan(new)], bins=2, method="equal_width")
+    assert dropped["Drift Score"] == pytest.approx(0.0)
+    assert result["Drift Score"] > 0.05
+
+
+def test_drop_ignores_missing_values_of_any_kind():
+    reference = np.array(["a", "b", None, "a"] * 50, dtype=object)
+    new = np.array(["a", None, None, "b"] * 20, dtype=object)
+    result = calculate_feature_drift(reference, new)
+    assert list(result["Drift DataFrame"]["Min Bin"]) == ["a", "b"]
+    assert result["Drift Score"] == pytest.approx(
+        calculate_feature_drift(reference[pd.notna(reference)], new[pd.notna(new)])["Drift Score"]
+    )
+
+    numeric = np.r_[np.random.default_rng(3).normal(size=500), np.full(50, np.nan)]
+    assert calculate_feature_drift(numeric, numeric[::-1])["Drift Score"] == pytest.approx(0.0)
+    with pytest.raises(ValueError, match="only missing"):
+        calculate_feature_drift(np.full(5, np.nan), np.ones(3))
+
+
+def test_missing_bin_consistent_across_entry_points(tmp_path, frames):
+    reference_df, new_df = frames
+    expected_summary, expected_details = calculate_all_features_drift(reference_df, new_df, missing="bin")
+    assert list(expected_details["cat"]["Min Bin"])[-1] == "Missing"
+
+    profile = DriftProfile(missing="bin").fit(reference_df)
+    profile.save(tmp_path / "profile.npz")
+    chunks = (new_df.iloc[i:i + 50] for i in range(0, len(new_df), 50))
+    for summary, details in (
+        profile.score(new_df),
+        DriftProfile.load(tmp_path / "profile.npz").score(new_df),
+        profile.score_chunks(chunks),
+        DriftMonitor(profile).update(new_df.iloc[:100]).update(new_df.iloc[100:]).score(),
+    ):
+        pd.testing.assert_frame_equal(summary, expected_summary)
+        for col in details:
+            pd.testing.assert_frame_equal(details[col], expected_details[col])
+
+    windows = profile.score_windows(new_df.assign(day=np.arange(len(new_df)) % 2), by="day")
+    for day in (0, 1):
+        summary, _ = profile.score(new_df[np.arange(len(new_df)) % 2 == day])
+        for _, row in summary.iterrows():
+            assert windows.loc[row["Feature"], day] == pytest.approx(row["Drift"], rel=1e-9)
+
+
+def test_peak_memory_bounded_by_a_few_columns():
+    rng = np.random.default_rng(8)
+    rows, n_features = 200_000, 12
+    reference_df = pd.DataFrame(rng.normal(size=(rows, n_features)))
+    new_df = pd.DataFrame(rng.normal(size=(rows, n_features)))
+    reference_df.iloc[::10, :] = np.nan
+    column_bytes = rows * 8
+
+    for missing in ("drop", "bin"):
+        tracemalloc.start()
+        try:
+            calculate_all_features_drift(reference_df, new_df, missing=missing)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Missing values are masked once per column and only the fitted reference values are copied,
+        # so the peak stays around one column whatever the number of features
+        assert peak < 1.5 * column_bytes
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+from driftsense import calculate_all_features_drift
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(2, 300, 120, shift=0.1, columns=[f"num_{i}" for i in range(8)] + ["cat"])
+
+
+@pytest.mark.parametrize("executor, chunk_size", [("thread", None), ("thread", 3), ("process", 2)])
+def test_parallel_matches_serial(frames, executor, chunk_size):
+    reference_df, new_df = frames
+    expected_summary, expected_details = calculate_all_features_drift(reference_df, new_df)
+    summary, details = calculate_all_features_drift(
+        reference_df, new_df, n_jobs=2, executor=executor, chunk_size=chunk_size
+    )
+    pd.testing.assert_frame_equal(summary, expected_summary)
+    assert list(details) == list(expected_details)
+    for col in details:
+        pd.testing.assert_frame_equal(details[col], expected_details[col])
+
+
+def test_invalid_executor(frames):
+    reference_df, new_df = frames
+    with pytest.raises(ValueError):
+        calculate_all_features_drift(reference_df, new_df, executor="gpu")
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import DriftProfile
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(1, 400, 150, shift=0.5, columns=("num", "skewed", "cat", "label"))
+
+
+def _assert_same_scores(profile, loaded, new_df):
+    summary, details = profile.score(new_df)
+    loaded_summary, loaded_details = loaded.score(new_df)
+    pd.testing.assert_frame_equal(loaded_summary, summary)
+    for col in details:
+        pd.testing.assert_frame_equal(loaded_details[col], details[col])
+
+
+@pytest.mark.parametrize("method", ["equal_width", "equal_freq", "kmeans"])
+def test_round_trip_numeric_methods(tmp_path, frames, method):
+    reference_df, new_df = frames
+    profile = DriftProfile(bins=5, method=method).fit(reference_df)
+    profile.save(tmp_path / "profile.npz")
+    _assert_same_scores(profile, DriftProfile.load(tmp_path / "profile.npz"), new_df)
+
+
+def test_round_trip_adaptive(tmp_path, frames):
+    reference_df, new_df = frames
+    # get_bin_edges keeps only positive tree thresholds, so fit the positive feature
+    profile = DriftProfile(bins=6, method="adaptive").fit(reference_df, columns=["skewed", "cat"], target="label")
+    assert list(profile.features) == ["skewed", "cat"]
+    profile.save(tmp_path / "profile.npz")
+    _assert_same_scores(profile, DriftProfile.load(tmp_path / "profile.npz"), new_df)
+
+
+def test_round_trip_domain(tmp_path, frames):
+    reference_df, new_df = frames
+    bins = {"num": [-5, -1, 0, 1, 5], "skewed": [0, 1, 2, 50], "cat": ["a", "b", "c"], "label": [0, 1]}
+    profile = DriftProfile(bins=bins, method="domain").fit(reference_df)
+    profile.save(tmp_path / "profile.npz")
+    loaded = DriftProfile.load(tmp_path / "profile.npz")
+    assert loaded.bins == bins
+    _assert_same_scores(profile, loaded, new_df)
+
+
+def test_round_trip_numpy_integer_settings(tmp_path, frames):
+    reference_df, new_df = frames
+    profile = DriftProfile(bins=np.int64(5), method="kmeans", max_fit_rows=np.int64(200)).fit(reference_df)
+    profile.save(tmp_path / "profile.npz")
+    loaded = DriftProfile.load(tmp_path / "profile.npz")
+    assert loaded.bins == 5 and loaded.max_fit_rows == 200
+    _assert_same_scores(profile, loaded, new_df)
+
+
+def test_round_trip_list_bins(tmp_path):
+    DriftProfile(bins=np.array([-1.0, 0.0, 1.0]), method="domain").save(tmp_path / "profile.npz")
+    assert DriftProfile.load(tmp_path / "profile.npz").bins == [-1.0, 0.0, 1.0]
+
+
+def test_load_rejects_unknown_version(tmp_path):
+    np.savez(tmp_path / "bad.npz", __meta__=np.array('{"format_version": 999}'))
+    with pytest.raises(ValueError):
+        DriftProfile.load(tmp_path / "bad.npz")
+
+
+def test_round_trip_non_string_object_categories(tmp_path):
+    rng = np.random.default_rng(2)
+    flags = rng.choice([True, False, None], 400).astype(object)  # Nullable flag
+    codes = rng.choice([1, 2, 3], 400).astype(object)  # Ints in an object column
+    reference_df = pd.DataFrame({"flag": flags, "code": codes})
+    new_df = pd.DataFrame({"flag": flags[:150][::-1], "code": rng.choice([1, 2, 4], 150).astype(object)})
+
+    for missing in ["drop", "bin"]:
+        profile = DriftProfile(missing=missing).fit(reference_df)
+        profile.save(tmp_path / "profile.npz")
+        with DriftProfile.load(tmp_path / "profile.npz") as loaded:
+            assert [type(value) for value in loaded.features["flag"].bins] == [bool, bool]
+            _assert_same_scores(profile, loaded, new_df)
+
+
+def test_loaded_profile_closes_archive(tmp_path, frames):
+    reference_df, new_df = frames
+    DriftProfile().fit(reference_df).save(tmp_path / "profile.npz")
+
+    loaded = DriftProfile.load(tmp_path / "profile.npz")
+    archive = loaded.features._archive
+    loaded.score(new_df)  # Reads every feature
+    assert loaded.features._archive is None and archive.fid is None
+
+    with DriftProfile.load(tmp_path / "profile.npz") as loaded:
+        loaded.features["num"]
+    with pytest.raises(ValueError, match="closed"):
+        loaded.features["cat"]
+    assert loaded.features["num"] is not None
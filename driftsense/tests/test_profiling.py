@@ -0,0 +1,60 @@
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import DriftProfile, calculate_all_features_drift, create_drift_report, profile_drift
+from driftsense.profiling import is_profiling
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(0, 500, 200, shift=0.0, columns=("num", "cat"))
+
+
+def test_profile_option_returns_stage_timings(frames):
+    reference_df, new_df = frames
+    expected_summary, _ = calculate_all_features_drift(reference_df, new_df)
+    summary, details, timings = calculate_all_features_drift(reference_df, new_df, profile=True)
+
+    pd.testing.assert_frame_equal(summary, expected_summary)
+    assert list(timings.columns) == ["Feature", "Stage", "Time (s)", "Rows", "Memory (MB)", "Thread"]
+    num = timings[timings["Feature"] == "num"].set_index("Stage")
+    assert {"prepare", "type_detection", "fit_bins", "count_reference", "count", "score"} <= set(num.index)
+    assert num.loc["count", "Rows"] == 200 and num.loc["fit_bins", "Rows"] == 500
+    assert (timings["Time (s)"] >= 0).all()
+    assert not is_profiling()
+
+
+def test_threads_attribute_stages_to_features(frames):
+    reference_df, new_df = frames
+    _, _, timings = calculate_all_features_drift(reference_df, new_df, n_jobs=2, chunk_size=1, profile=True)
+    assert set(timings.loc[timings["Stage"] == "score", "Feature"]) == {"num", "cat"}
+
+
+def test_context_manager_memory_callback_and_log_events(frames, caplog, tmp_path):
+    reference_df, new_df = frames
+    seen = []
+    with caplog.at_level(logging.DEBUG, logger="driftsense.profiling"):
+        with profile_drift(memory=True, callback=seen.append) as profiler:
+            profile = DriftProfile().fit(reference_df)
+            summary, details = profile.score(new_df)
+            details["num"]
+            create_drift_report(summary, details, str(tmp_path / "report.html"))
+
+    frame = profiler.to_frame()
+    assert len(frame) == len(seen) == len(caplog.records)
+    assert caplog.records[0].drift_stage == seen[0]
+    assert frame["Memory (MB)"].notna().all()
+    assert {"detail_frame", "report_summary", "report_detail"} <= set(frame["Stage"])
+    assert profiler.by_stage()["Calls"].sum() == len(frame)
+
+
+def test_nested_stage_keeps_outer_peak():
+    with profile_drift(memory=True) as profiler:
+        with profiler.stage("outer"):
+            np.ones(2**20).sum()  # 8 MB allocated and freed before the inner stage
+            with profiler.stage("inner"):
+                np.ones(2**17).sum()
+
+    memory = profiler.to_frame().set_index("Stage")["Memory (MB)"]
+    assert memory["outer"] >= 8 > memory["inner"]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from driftsense import QuantileSketch, FeatureBaseline, get_bin_edges
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(4).lognormal(size=200_000)
+
+
+def _rank_errors(values, edges, quantiles):
+    true_ranks = np.searchsorted(np.sort(values), edges, side="right") / len(values)
+    return np.abs(true_ranks - quantiles)
+
+
+def test_exact_while_small():
+    sketch = QuantileSketch(k=200).update([5, 1, 3, 2, 4])
+    assert sketch.rank_error() == 0.0
+    np.testing.assert_array_equal(get_bin_edges(sketch, bins=4, method="equal_freq"), [1, 2, 3, 4, 5])
+
+
+def test_equal_freq_edges_within_error_bound(values):
+    sketch = QuantileSketch(k=200)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+    quantiles = np.linspace(0, 1, 11)
+    edges = get_bin_edges(sketch, bins=10, method="equal_freq")
+    assert edges[0] == values.min() and edges[-1] == values.max()
+    assert np.all(_rank_errors(values, edges, quantiles) <= sketch.rank_error(0.99))
+    assert sketch.retained < 3 * sketch.k
+
+
+def test_merge_matches_single_stream_bound(values):
+    parts = [QuantileSketch(k=200, seed=i).update(chunk) for i, chunk in enumerate(np.array_split(values, 4))]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert merged.n == len(values)
+    quantiles = np.linspace(0, 1, 6)
+    assert np.all(_rank_errors(values, merged.quantile(quantiles), quantiles) <= merged.rank_error(0.99))
+
+
+def test_nans_ignored_and_empty_sketch_rejected():
+    sketch = QuantileSketch().update([np.nan, np.nan])
+    assert sketch.n == 0
+    with pytest.raises(ValueError):
+        get_bin_edges(sketch, bins=5, method="equal_freq")
+    with pytest.raises(ValueError):
+        get_bin_edges(QuantileSketch().update([1.0, 2.0]), bins=2, method="kmeans")
+
+
+def test_baseline_from_sketch(values):
+    sketch = QuantileSketch(k=400).update(values)
+    baseline = FeatureBaseline.from_sketch(sketch, bins=10)
+    assert baseline.reference_counts.sum() == len(values)
+    exact = FeatureBaseline.fit(values, bins=10)
+    np.testing.assert_allclose(baseline.reference_counts, exact.reference_counts, atol=sketch.rank_error(0.99) * len(values) * 2)
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import DriftProfile
+
+
+@pytest.fixture
+def setup(make_frames):
+    reference_df, new_df = make_frames(6, 500, 400, shift=0.0, missing=0.1)
+    new_df.insert(0, "day", np.random.default_rng(6).choice(["d1", "d2", "d3", "d4"], len(new_df)))
+    new_df.loc[new_df["day"] == "d4", "num"] = np.nan
+    return reference_df, new_df
+
+
+@pytest.mark.parametrize("method, bins", [("equal_freq", 10), ("equal_width", 5), ("domain", None)])
+def test_windows_match_per_window_scores(setup, method, bins):
+    reference_df, new_df = setup
+    if method == "domain":
+        bins = {"num": [-1, 0, 1], "cat": ["a", "b", "c"], "low_card": [0, 1, 2, 3]}
+    profile = DriftProfile(bins=bins, method=method).fit(reference_df)
+    matrix = profile.score_windows(new_df, by="day")
+    assert list(matrix.columns) == ["d1", "d2", "d3", "d4"]
+
+    for day, window in new_df.groupby("day"):
+        summary, _ = profile.score(window.drop(columns="day"))
+        expected = summary.set_index("Feature")["Drift"]
+        for feature in matrix.index:
+            if feature in expected:
+                assert matrix.loc[feature, day] == pytest.approx(expected[feature], rel=1e-9)
+            else:
+                assert np.isnan(matrix.loc[feature, day])
+
+
+def test_windows_from_dict(setup):
+    reference_df, new_df = setup
+    profile = DriftProfile().fit(reference_df)
+    windows = {day: window.drop(columns="day") for day, window in new_df.groupby("day")}
+    pd.testing.assert_frame_equal(profile.score_windows(windows), profile.score_windows(new_df, by="day"))
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+from driftsense import FeatureBaseline, calculate_all_features_drift, calculate_segment_drift
+
+
+@pytest.fixture
+def data(make_frames):
+    reference_df, new_df = make_frames(0, 4000, 3000, missing=0.05, columns=("num", "cat"))
+    rng = np.random.default_rng(0)
+    for df, regions in ((reference_df, ["north", "south", "east"]), (new_df, ["north", "south", "west"])):
+        df.insert(0, "region", rng.choice(regions, len(df)))
+        df.insert(1, "channel", rng.choice(["web", "app"], len(df)))
+    return reference_df, new_df
+
+
+def test_segment_bins_match_per_slice_runs(data):
+    reference_df, new_df = data
+    result = calculate_segment_drift(reference_df, new_df, "region", segment_bins="segment", metrics=["js"])
+
+    for region in ["north", "south"]:
+        expected, _ = calculate_all_features_drift(
+            reference_df[reference_df.region == region].drop(columns="region"),
+            new_df[new_df.region == region].drop(columns="region"), metrics=["js"]
+        )
+        rows = result[result.region == region].set_index("Feature")
+        for _, row in expected.iterrows():
+            assert rows.loc[row["Feature"], "Drift"] == pytest.approx(row["Drift"])
+            assert rows.loc[row["Feature"], "JS"] == pytest.approx(row["JS"])
+            assert rows.loc[row["Feature"], "Binning Strategy"] == row["Binning Strategy"]
+
+
+@pytest.mark.parametrize("missing", ["drop", "bin"])
+def test_shared_bins_use_whole_reference(data, missing):
+    reference_df, new_df = data
+    result = calculate_segment_drift(reference_df, new_df, ["region", "channel"], missing=missing)
+
+    values = reference_df["num"].to_numpy()
+    baseline = FeatureBaseline.fit(values if missing == 'bin' else values[~np.isnan(values)], missing=missing)
+    for (region, channel), segment in reference_df.groupby(["region", "channel"]):
+        new_segment = new_df[(new_df.region == region) & (new_df.channel == channel)]["num"].to_numpy()
+        row = result[(result.region == region) & (result.channel == channel) & (result.Feature == "num")].iloc[0]
+        if len(new_segment) == 0:
+            assert np.isnan(row["Drift"])
+            continue
+        reference_segment = segment["num"].to_numpy()
+        if missing == 'drop':
+            reference_segment = reference_segment[~np.isnan(reference_segment)]
+            new_segment = new_segment[~np.isnan(new_segment)]
+        _, counts = baseline.count(reference_segment)
+        expected = FeatureBaseline(baseline.method, False, baseline.bins, counts, missing=baseline.missing).score(new_segment)
+        assert row["Drift"] == pytest.approx(expected["Drift Score"])
+        assert row["Reference Count"] == len(reference_segment) and row["New Count"] == len(new_segment)
+
+
+def test_tidy_layout_and_one_sided_segments(data):
+    reference_df, new_df = data
+    result = calculate_segment_drift(reference_df, new_df, "region")
+
+    assert list(result.columns) == ["region", "Feature", "Binning Strategy", "Drift", "Reference Count", "New Count"]
+    assert list(result["region"].unique()) == ["east", "north", "south", "west"]
+    assert list(result["Feature"][:3]) == ["channel", "num", "cat"]
+    assert result.loc[result.region.isin(["east", "west"]), "Drift"].isna().all()
+    assert result.loc[result.region.isin(["north", "south"]), "Drift"].notna().all()
+    # New categories of a feature are scored like the unsegmented run
+    assert (result.loc[result.region == "north"].set_index("Feature").loc["cat", "Drift"] > 0.5)
+
+
+def test_calculate_all_features_drift_segment_by(data):
+    reference_df, new_df = data
+    segment_df, detailed_dfs = calculate_all_features_drift(reference_df, new_df, segment_by="region")
+
+    pd.testing.assert_frame_equal(segment_df, calculate_segment_drift(reference_df, new_df, "region"))
+    assert detailed_dfs == {}
+
+
+def test_invalid_segment_arguments(data):
+    reference_df, new_df = data
+    with pytest.raises(ValueError, match="Segment column"):
+        calculate_segment_drift(reference_df, new_df, "store")
+    with pytest.raises(ValueError, match="segment bins"):
+        calculate_segment_drift(reference_df, new_df, "region", segment_bins="global")
+
+
+@pytest.mark.parametrize("option", [
+    {"n_jobs": 2}, {"executor": "process"}, {"chunk_size": 4}, {"batched": True}, {"detail": False}, {"bootstrap": 100}
+])
+def test_segment_by_rejects_ignored_options(data, option):
+    reference_df, new_df = data
+    with pytest.raises(ValueError, match=f"'{next(iter(option))}' is not available with 'segment_by'"):
+        calculate_all_features_drift(reference_df, new_df, segment_by="region", **option)
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+from driftsense import calculate_all_features_drift, read_chunks
+
+
+@pytest.fixture
+def frames(make_frames):
+    return make_frames(3, 500, 230, shift=0.2, missing=0.1)
+
+
+def _assert_same(result, expected):
+    pd.testing.assert_frame_equal(result[0], expected[0])
+    assert list(result[1]) == list(expected[1])
+    for col in result[1]:
+        pd.testing.assert_frame_equal(result[1][col], expected[1][col])
+
+
+@pytest.mark.parametrize("chunksize", [1, 17, 1000])
+def test_chunked_new_data_matches_in_memory(frames, chunksize):
+    reference_df, new_df = frames
+    expected = calculate_all_features_drift(reference_df, new_df)
+    chunks = (new_df.iloc[i:i + chunksize] for i in range(0, len(new_df), chunksize))
+    _assert_same(calculate_all_features_drift(reference_df, chunks), expected)
+
+
+def test_read_chunks_csv(tmp_path, frames):
+    reference_df, new_df = frames
+    new_df.to_csv(tmp_path / "new.csv", index=False)
+    expected = calculate_all_features_drift(reference_df, pd.read_csv(tmp_path / "new.csv"))
+    result = calculate_all_features_drift(reference_df, read_chunks(tmp_path / "new.csv", chunksize=50))
+    _assert_same(result, expected)
+
+
+def test_read_chunks_rejects_unknown_file_type(tmp_path):
+    with pytest.raises(ValueError):
+        read_chunks(tmp_path / "new.json")
+
+
+@pytest.mark.parametrize("option", [{"n_jobs": 2}, {"executor": "process"}, {"chunk_size": 4}, {"batched": True}])
+def test_streaming_rejects_ignored_options(frames, option):
+    reference_df, new_df = frames
+    with pytest.raises(ValueError, match=f"'{next(iter(option))}' is not available when the new data is streamed"):
+        calculate_all_features_drift(reference_df, iter([new_df]), **option)